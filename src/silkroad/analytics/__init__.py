@@ -1,5 +1,15 @@
 "Analytics and persistence layer for trades and performance metrics."
 
-from .logger import AnalyticsStore
+from .logger import AnalyticsSink, AnalyticsStore
+from .parquet import ParquetAnalyticsReader, ParquetAnalyticsStore
+from .reader import AnalyticsReader
+from .writer import AsyncAnalyticsStore
 
-__all__ = ["AnalyticsStore"]
+__all__ = [
+    "AnalyticsReader",
+    "AnalyticsSink",
+    "AnalyticsStore",
+    "AsyncAnalyticsStore",
+    "ParquetAnalyticsReader",
+    "ParquetAnalyticsStore",
+]
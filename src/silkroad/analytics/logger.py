@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import atexit
+import functools
+import json
 import sqlite3
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Protocol
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from silkroad.backtesting.results import BacktestResult
 
 
 @dataclass
@@ -24,90 +37,358 @@ class PerformanceRecord:
     timestamp: datetime
     metric: str
     value: float
-    metadata: Dict[str, Any] | None = None
+    metadata: dict[str, Any] | None = None
+
+
+class AnalyticsSink(Protocol):
+    """What engines log to: ``AnalyticsStore``, ``AsyncAnalyticsStore`` and the Parquet store."""
+
+    def log_trade(self, record: TradeRecord) -> None: ...
+
+    def log_performance(self, record: PerformanceRecord) -> None: ...
+
+    def log_result(self, result: BacktestResult) -> None: ...
+
+    def buffering(self, buffer_size: int = 1000) -> AbstractContextManager[Any]: ...
+
+    def flush(self) -> None: ...
+
+    def close(self) -> None: ...
 
 
 class AnalyticsStore:
-    """Lightweight SQLite-backed store for trades and performance metrics."""
+    """Lightweight SQLite-backed store for trades and performance metrics.
+
+    Timestamps are stored as INTEGER nanoseconds since the epoch (UTC) and indexed for the
+    dashboard's "most recent" queries. Databases written by older versions, with ISO-8601 TEXT
+    timestamps, are upgraded in place the first time they are opened. Backtest results, including
+    their price, equity and returns series, are kept per ``run_id`` in ``runs``/``run_series``.
+
+    With ``buffer_size`` or ``flush_interval`` set, records are buffered in memory and written with
+    ``executemany`` in a single transaction once either threshold is reached, on ``flush()`` and
+    on ``close()``. A failed flush rolls back and keeps the rows buffered for the next attempt,
+    and buffered rows are flushed at interpreter exit.
+    """
 
-    def __init__(self, database: str) -> None:
+    def __init__(
+        self,
+        database: str,
+        buffer_size: int = 0,
+        flush_interval: float | None = None,
+    ) -> None:
         self.path = Path(database)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(self.path)
         self.conn.execute("PRAGMA journal_mode=WAL;")
         self.conn.execute("PRAGMA synchronous=NORMAL;")
         self._init_schema()
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._trade_rows: list[tuple[Any, ...]] = []
+        self._performance_rows: list[tuple[Any, ...]] = []
+        self._last_flush = time.monotonic()
+        self._closed = False
+        atexit.register(_flush_at_exit, weakref.ref(self))
 
     def _init_schema(self) -> None:
-        self.conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS trades (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                symbol TEXT NOT NULL,
-                side TEXT NOT NULL,
-                quantity REAL NOT NULL,
-                price REAL NOT NULL,
-                strategy TEXT NOT NULL,
-                source TEXT NOT NULL
-            )
-            """
-        )
-        self.conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS performance (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                run_id TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                metric TEXT NOT NULL,
-                value REAL NOT NULL,
-                metadata TEXT
-            )
-            """
-        )
+        """Create or upgrade the schema, tracked with ``PRAGMA user_version``."""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        self.conn.execute("BEGIN")
+        try:
+            legacy: list[str] = []
+            if version == 0:
+                tables = self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+                existing = {name for (name,) in tables}
+                legacy = [table for table in ("trades", "performance") if table in existing]
+            for table in legacy:
+                self.conn.execute(f"ALTER TABLE {table} RENAME TO {table}_v0")
+            for statement in _SCHEMA:
+                self.conn.execute(statement)
+            for table in legacy:
+                _migrate_v0_table(self.conn, table)
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except BaseException:
+            self.conn.rollback()
+            raise
         self.conn.commit()
 
+    @property
+    def buffered(self) -> bool:
+        return bool(self.buffer_size) or self.flush_interval is not None
+
     def log_trade(self, record: TradeRecord) -> None:
-        self.conn.execute(
-            """
-            INSERT INTO trades (timestamp, symbol, side, quantity, price, strategy, source)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                record.timestamp.isoformat(),
-                record.symbol,
-                record.side,
-                record.quantity,
-                record.price,
-                record.strategy,
-                record.source,
-            ),
+        row = (
+            to_epoch_ns(record.timestamp),
+            record.symbol,
+            record.side,
+            record.quantity,
+            record.price,
+            record.strategy,
+            record.source,
         )
+        if self.buffered:
+            self._trade_rows.append(row)
+            self._maybe_flush()
+            return
+        self.conn.execute(_INSERT_TRADE, row)
         self.conn.commit()
 
     def log_performance(self, record: PerformanceRecord) -> None:
-        metadata_json: Optional[str] = None
+        metadata_json: str | None = None
         if record.metadata:
             try:
-                import json
-
                 metadata_json = json.dumps(record.metadata)
             except TypeError:
                 metadata_json = None
+        row = (
+            record.run_id,
+            to_epoch_ns(record.timestamp),
+            record.metric,
+            record.value,
+            metadata_json,
+        )
+        if self.buffered:
+            self._performance_rows.append(row)
+            self._maybe_flush()
+            return
+        self.conn.execute(_INSERT_PERFORMANCE, row)
+        self.conn.commit()
+
+    def log_result(self, result: BacktestResult) -> None:
+        """Persist a backtest summary and its series so it can be reloaded with ``load_result``."""
+        summary = {
+            "strategy_name": result.strategy_name,
+            "starting_cash": result.starting_cash,
+            "ending_value": result.ending_value,
+            "total_return": result.total_return,
+            "total_trades": result.total_trades,
+            "sharpe_ratio": result.sharpe_ratio,
+            "extra_metrics": result.extra_metrics,
+        }
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO runs (run_id, completed_at, strategy, summary) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    result.run_id,
+                    to_epoch_ns(result.completed_at),
+                    result.strategy_name,
+                    json.dumps(summary),
+                ),
+            )
+            for name in SERIES_NAMES:
+                series = getattr(result, name)
+                if series is not None:
+                    self._write_series(result.run_id, name, series)
+
+    def log_series(self, run_id: str, name: str, series: pd.Series) -> None:
+        with self.conn:
+            self._write_series(run_id, name, series)
+
+    def _write_series(self, run_id: str, name: str, series: pd.Series) -> None:
+        index = pd.DatetimeIndex(series.index)
+        if index.tz is not None:
+            index = index.tz_convert("UTC").tz_localize(None)
         self.conn.execute(
-            """
-            INSERT INTO performance (run_id, timestamp, metric, value, metadata)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+            "INSERT OR REPLACE INTO run_series (run_id, name, timestamps, \"values\") "
+            "VALUES (?, ?, ?, ?)",
             (
-                record.run_id,
-                record.timestamp.isoformat(),
-                record.metric,
-                record.value,
-                metadata_json,
+                run_id,
+                name,
+                index.as_unit("ns").asi8.tobytes(),
+                series.to_numpy(dtype=np.float64).tobytes(),
             ),
         )
-        self.conn.commit()
+
+    def load_series(self, run_id: str, name: str) -> pd.Series | None:
+        return read_series(self.conn, run_id, name)
+
+    def load_result(self, run_id: str) -> BacktestResult | None:
+        """Rebuild a logged ``BacktestResult``; its series are read on first access."""
+        return read_result(self.conn, run_id, functools.partial(self.load_series, run_id))
+
+    def recent_runs(self, limit: int = 20) -> pd.DataFrame:
+        return read_recent_runs(self.conn, limit)
+
+    def flush(self) -> None:
+        """Write all buffered records in one transaction; on failure they stay buffered."""
+        if not self._trade_rows and not self._performance_rows:
+            self._last_flush = time.monotonic()
+            return
+        with self.conn:
+            if self._trade_rows:
+                self.conn.executemany(_INSERT_TRADE, self._trade_rows)
+            if self._performance_rows:
+                self.conn.executemany(_INSERT_PERFORMANCE, self._performance_rows)
+        self._trade_rows = []
+        self._performance_rows = []
+        self._last_flush = time.monotonic()
+
+    @contextmanager
+    def buffering(self, buffer_size: int = 1000) -> Iterator[AnalyticsStore]:
+        """Temporarily buffer writes (e.g. for the fills of one backtest) and flush on exit."""
+        previous = self.buffer_size
+        self.buffer_size = max(previous, buffer_size)
+        try:
+            yield self
+        finally:
+            self.buffer_size = previous
+            self.flush()
+
+    def _maybe_flush(self) -> None:
+        pending = len(self._trade_rows) + len(self._performance_rows)
+        if self.buffer_size and pending >= self.buffer_size:
+            self.flush()
+        elif self.flush_interval is not None:
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
 
     def close(self) -> None:
-        self.conn.close()
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self.conn.close()
+
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS trades (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp INTEGER NOT NULL,
+        symbol TEXT NOT NULL,
+        side TEXT NOT NULL,
+        quantity REAL NOT NULL,
+        price REAL NOT NULL,
+        strategy TEXT NOT NULL,
+        source TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS performance (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id TEXT NOT NULL,
+        timestamp INTEGER NOT NULL,
+        metric TEXT NOT NULL,
+        value REAL NOT NULL,
+        metadata TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_trades_strategy_symbol ON trades (strategy, symbol, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_performance_timestamp ON performance (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_performance_run_metric ON performance (run_id, metric)",
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        run_id TEXT PRIMARY KEY,
+        completed_at INTEGER NOT NULL,
+        strategy TEXT NOT NULL,
+        summary TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_runs_completed_at ON runs (completed_at)",
+    """
+    CREATE TABLE IF NOT EXISTS run_series (
+        run_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        timestamps BLOB NOT NULL,
+        "values" BLOB NOT NULL,
+        PRIMARY KEY (run_id, name)
+    )
+    """,
+)
+
+# Series persisted with each backtest run, as raw int64-nanosecond / float64 column blobs.
+SERIES_NAMES = ("price_series", "equity_curve", "returns_series")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_epoch_ns(timestamp: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch; naive values are taken as UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def read_series(conn: sqlite3.Connection, run_id: str, name: str) -> pd.Series | None:
+    row = conn.execute(
+        "SELECT timestamps, \"values\" FROM run_series WHERE run_id = ? AND name = ?",
+        (run_id, name),
+    ).fetchone()
+    if row is None:
+        return None
+    index = pd.DatetimeIndex(np.frombuffer(row[0], dtype=np.int64).view("datetime64[ns]"))
+    return pd.Series(np.frombuffer(row[1], dtype=np.float64), index=index, name=name)
+
+
+def read_result(
+    conn: sqlite3.Connection,
+    run_id: str,
+    series_loader: Callable[[str], pd.Series | None],
+) -> BacktestResult | None:
+    from silkroad.backtesting.results import BacktestResult
+
+    row = conn.execute(
+        "SELECT completed_at, summary FROM runs WHERE run_id = ?", (run_id,)
+    ).fetchone()
+    if row is None:
+        return None
+    completed_at = pd.Timestamp(row[0], unit="ns", tz="UTC").to_pydatetime()
+    result = BacktestResult(run_id=run_id, completed_at=completed_at, **json.loads(row[1]))
+    result.series_loader = series_loader
+    return result
+
+
+def read_recent_runs(conn: sqlite3.Connection, limit: int) -> pd.DataFrame:
+    frame = pd.read_sql_query(
+        "SELECT run_id, completed_at, strategy FROM runs ORDER BY completed_at DESC LIMIT ?",
+        conn,
+        params=(limit,),
+    )
+    frame["completed_at"] = pd.to_datetime(frame["completed_at"], unit="ns")
+    return frame
+
+
+def _migrate_v0_table(conn: sqlite3.Connection, table: str) -> None:
+    """Copy a version-0 table (ISO-8601 TEXT timestamps) into its integer-timestamp replacement."""
+    cursor = conn.execute(f"SELECT * FROM {table}_v0")
+    columns = [description[0] for description in cursor.description]
+    rows = cursor.fetchall()
+    if rows:
+        position = columns.index("timestamp")
+        # Mixed offsets and naive values are both normalised to UTC, matching to_epoch_ns().
+        parsed = pd.to_datetime([row[position] for row in rows], utc=True, format="ISO8601")
+        nanos = parsed.as_unit("ns").asi8.tolist()
+        converted = [
+            row[:position] + (stamp,) + row[position + 1 :]
+            for row, stamp in zip(rows, nanos, strict=True)
+        ]
+        placeholders = ", ".join("?" for _ in columns)
+        conn.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", converted
+        )
+    conn.execute(f"DROP TABLE {table}_v0")
+
+
+_INSERT_TRADE = """
+    INSERT INTO trades (timestamp, symbol, side, quantity, price, strategy, source)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_PERFORMANCE = """
+    INSERT INTO performance (run_id, timestamp, metric, value, metadata)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+
+def _flush_at_exit(store_ref: weakref.ref[AnalyticsStore]) -> None:
+    store = store_ref()
+    if store is not None and not store._closed:
+        store.flush()
@@ -0,0 +1,419 @@
+from __future__ import annotations
+
+import atexit
+import json
+import time
+import uuid
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from silkroad.analytics.logger import (
+    SERIES_NAMES,
+    PerformanceRecord,
+    TradeRecord,
+    to_epoch_ns,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+if TYPE_CHECKING:
+    from silkroad.backtesting.results import BacktestResult
+
+
+def _schemas() -> dict[str, pa.Schema]:
+    timestamp = pa.timestamp("ns", tz="UTC")
+    return {
+        "trades": pa.schema(
+            [
+                ("timestamp", timestamp),
+                ("symbol", pa.string()),
+                ("side", pa.string()),
+                ("quantity", pa.float64()),
+                ("price", pa.float64()),
+                ("strategy", pa.string()),
+                ("source", pa.string()),
+            ]
+        ),
+        "performance": pa.schema(
+            [
+                ("run_id", pa.string()),
+                ("timestamp", timestamp),
+                ("metric", pa.string()),
+                ("value", pa.float64()),
+                ("metadata", pa.string()),
+            ]
+        ),
+        "runs": pa.schema(
+            [
+                ("run_id", pa.string()),
+                ("completed_at", timestamp),
+                ("strategy", pa.string()),
+                ("summary", pa.string()),
+            ]
+        ),
+        "run_series": pa.schema(
+            [
+                ("run_id", pa.string()),
+                ("name", pa.string()),
+                ("timestamp", pa.timestamp("ns")),
+                ("value", pa.float64()),
+            ]
+        ),
+    }
+
+
+class ParquetAnalyticsReader:
+    """Read-only query layer over the Parquet datasets written by ``ParquetAnalyticsStore``.
+
+    Reads go through ``pyarrow.dataset`` with the filters pushed down, which prunes whole date
+    partitions and skips row groups by statistics. Nothing is created or flushed, so dashboards
+    can open it next to a running writer.
+    """
+
+    def __init__(self, root: str) -> None:
+        if pa is None:
+            raise ImportError(
+                "The parquet analytics backend requires pyarrow; install silkroad[parquet]."
+            )
+        self.path = Path(root)
+        self._schemas = _schemas()
+
+    def load_series(self, run_id: str, name: str) -> pd.Series | None:
+        table = self._scan(
+            "run_series",
+            (pc.field("run_id") == run_id) & (pc.field("name") == name),
+            columns=["timestamp", "value"],
+        )
+        if table is None or not table.num_rows:
+            return None
+        frame = table.to_pandas()
+        return pd.Series(
+            frame["value"].to_numpy(), index=pd.DatetimeIndex(frame["timestamp"]), name=name
+        )
+
+    def load_result(self, run_id: str) -> BacktestResult | None:
+        from silkroad.backtesting.results import BacktestResult
+
+        table = self._scan("runs", pc.field("run_id") == run_id)
+        if table is None or not table.num_rows:
+            return None
+        row = table.to_pylist()[-1]
+        result = BacktestResult(
+            run_id=run_id, completed_at=row["completed_at"], **json.loads(row["summary"])
+        )
+        result.series_loader = lambda name: self.load_series(run_id, name)
+        return result
+
+    def recent_runs(self, limit: int = 20) -> pd.DataFrame:
+        table = self._scan("runs", None, columns=["run_id", "completed_at", "strategy"])
+        if table is None:
+            return pd.DataFrame(columns=["run_id", "completed_at", "strategy"])
+        frame = table.to_pandas().sort_values("completed_at", ascending=False).head(limit)
+        frame["completed_at"] = frame["completed_at"].dt.tz_localize(None)
+        return frame.reset_index(drop=True)
+
+    def read_trades(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        symbol: str | None = None,
+        strategy: str | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """Trades in ``[start, end)``, optionally for one symbol/strategy, read with pushdown."""
+        condition = _time_filter(start, end)
+        if symbol is not None:
+            condition = _and(condition, pc.field("symbol") == symbol)
+        if strategy is not None:
+            condition = _and(condition, pc.field("strategy") == strategy)
+        return self._read("trades", condition, columns)
+
+    def recent_trades(self, limit: int = 50) -> pd.DataFrame:
+        """Newest trades first, with the columns of ``AnalyticsReader.recent_trades``."""
+        return self._read_newest("trades", limit)
+
+    def recent_metrics(self, limit: int = 50) -> pd.DataFrame:
+        """Newest metrics first, with the columns of ``AnalyticsReader.recent_metrics``."""
+        return self._read_newest("performance", limit)
+
+    def read_performance(
+        self,
+        run_id: str | None = None,
+        metric: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        condition = _time_filter(start, end)
+        if run_id is not None:
+            condition = _and(condition, pc.field("run_id") == run_id)
+        if metric is not None:
+            condition = _and(condition, pc.field("metric") == metric)
+        return self._read("performance", condition, columns)
+
+    def _scan(
+        self,
+        table_name: str,
+        condition: pc.Expression | None,
+        columns: list[str] | None = None,
+    ) -> pa.Table | None:
+        directory = self.path / table_name
+        if not directory.exists():
+            return None
+        dataset = ds.dataset(
+            directory,
+            format="parquet",
+            partitioning=ds.partitioning(pa.schema([("date", pa.date32())]), flavor="hive"),
+        )
+        return dataset.to_table(columns=columns, filter=condition)
+
+    def _read(
+        self,
+        table_name: str,
+        condition: pc.Expression | None,
+        columns: list[str] | None,
+    ) -> pd.DataFrame:
+        names = columns or self._schemas[table_name].names
+        table = self._scan(table_name, condition, names)
+        if table is None:
+            return pd.DataFrame(columns=names)
+        frame = table.to_pandas()
+        if "timestamp" in frame:
+            frame = frame.sort_values("timestamp").reset_index(drop=True)
+        return frame
+
+    def _read_newest(self, table_name: str, limit: int) -> pd.DataFrame:
+        """The newest ``limit`` rows, reading date partitions from the latest back until enough."""
+        schema = self._schemas[table_name]
+        directory = self.path / table_name
+        partitions = sorted(directory.glob("date=*"), reverse=True) if directory.exists() else []
+        tables: list[pa.Table] = []
+        rows = 0
+        for partition in partitions:
+            if rows >= limit:
+                break
+            table = ds.dataset(partition, format="parquet", schema=schema).to_table()
+            tables.append(table)
+            rows += table.num_rows
+        if not tables:
+            return pd.DataFrame(columns=schema.names)
+        frame = pa.concat_tables(tables).to_pandas()
+        return _newest(frame.sort_values("timestamp", kind="stable"), limit)
+
+
+class ParquetAnalyticsStore(ParquetAnalyticsReader):
+    """Columnar analytics store backed by Hive-partitioned Parquet datasets.
+
+    Records are buffered and appended as new files under ``root/<table>/date=YYYY-MM-DD/`` (UTC
+    date), so writes never rewrite existing data. Buffered rows are also written once
+    ``flush_interval`` seconds have passed (checked on the next write) and at interpreter exit,
+    so a quiet live session does not sit on them.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        buffer_size: int = 10_000,
+        flush_interval: float | None = 60.0,
+    ) -> None:
+        super().__init__(root)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._rows: dict[str, list[dict[str, Any]]] = {"trades": [], "performance": []}
+        self._last_flush = time.monotonic()
+        self._closed = False
+        atexit.register(_flush_at_exit, weakref.ref(self))
+
+    def log_trade(self, record: TradeRecord) -> None:
+        self._rows["trades"].append(
+            {
+                "timestamp": to_epoch_ns(record.timestamp),
+                "symbol": record.symbol,
+                "side": record.side,
+                "quantity": record.quantity,
+                "price": record.price,
+                "strategy": record.strategy,
+                "source": record.source,
+            }
+        )
+        self._maybe_flush()
+
+    def log_performance(self, record: PerformanceRecord) -> None:
+        metadata_json: str | None = None
+        if record.metadata:
+            try:
+                metadata_json = json.dumps(record.metadata)
+            except TypeError:
+                metadata_json = None
+        self._rows["performance"].append(
+            {
+                "run_id": record.run_id,
+                "timestamp": to_epoch_ns(record.timestamp),
+                "metric": record.metric,
+                "value": record.value,
+                "metadata": metadata_json,
+            }
+        )
+        self._maybe_flush()
+
+    def log_result(self, result: BacktestResult) -> None:
+        summary = {
+            "strategy_name": result.strategy_name,
+            "starting_cash": result.starting_cash,
+            "ending_value": result.ending_value,
+            "total_return": result.total_return,
+            "total_trades": result.total_trades,
+            "sharpe_ratio": result.sharpe_ratio,
+            "extra_metrics": result.extra_metrics,
+        }
+        completed_at = to_epoch_ns(result.completed_at)
+        self._append(
+            "runs",
+            [
+                {
+                    "run_id": result.run_id,
+                    "completed_at": completed_at,
+                    "strategy": result.strategy_name,
+                    "summary": json.dumps(summary),
+                }
+            ],
+            completed_at,
+        )
+        for name in SERIES_NAMES:
+            series = getattr(result, name)
+            if series is not None:
+                self.log_series(result.run_id, name, series, partition_ns=completed_at)
+
+    def log_series(
+        self, run_id: str, name: str, series: pd.Series, partition_ns: int | None = None
+    ) -> None:
+        index = pd.DatetimeIndex(series.index)
+        if index.tz is not None:
+            index = index.tz_convert("UTC").tz_localize(None)
+        table = pa.table(
+            {
+                "run_id": pa.array([run_id] * len(series), pa.string()),
+                "name": pa.array([name] * len(series), pa.string()),
+                "timestamp": pa.array(index.as_unit("ns").asi8, pa.timestamp("ns")),
+                "value": pa.array(series.to_numpy(dtype=np.float64), pa.float64()),
+            },
+            schema=self._schemas["run_series"],
+        )
+        self._write("run_series", table, partition_ns or time.time_ns())
+
+    def flush(self) -> None:
+        for table_name, rows in self._rows.items():
+            if not rows:
+                continue
+            # Write one file per UTC date so every batch lands in its date partition.
+            by_day: dict[int, list[dict[str, Any]]] = {}
+            for row in rows:
+                by_day.setdefault(row["timestamp"] // _DAY_NS, []).append(row)
+            for day, day_rows in by_day.items():
+                self._append(table_name, day_rows, day * _DAY_NS)
+            self._rows[table_name] = []
+        self._last_flush = time.monotonic()
+
+    @contextmanager
+    def buffering(self, buffer_size: int = 1000) -> Iterator[ParquetAnalyticsStore]:
+        previous = self.buffer_size
+        self.buffer_size = max(previous, buffer_size)
+        try:
+            yield self
+        finally:
+            self.buffer_size = previous
+            self.flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+
+    def _maybe_flush(self) -> None:
+        pending = sum(len(rows) for rows in self._rows.values())
+        if pending >= max(self.buffer_size, 1):
+            self.flush()
+        elif self.flush_interval is not None:
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def _append(self, table_name: str, rows: list[dict[str, Any]], partition_ns: int) -> None:
+        table = pa.Table.from_pylist(rows, schema=self._schemas[table_name])
+        self._write(table_name, table, partition_ns)
+
+    def _write(self, table_name: str, table: pa.Table, partition_ns: int) -> None:
+        day = pd.Timestamp(partition_ns, unit="ns", tz="UTC").date()
+        ds.write_dataset(
+            table,
+            self.path / table_name / f"date={day.isoformat()}",
+            format="parquet",
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+
+
+_DAY_NS = 86_400 * 1_000_000_000
+
+
+def _flush_at_exit(store_ref: weakref.ref[ParquetAnalyticsStore]) -> None:
+    store = store_ref()
+    if store is not None and not store._closed:
+        store.flush()
+
+
+def _newest(frame: pd.DataFrame, limit: int) -> pd.DataFrame:
+    frame = frame.iloc[::-1].head(limit).reset_index(drop=True)
+    if len(frame) and frame["timestamp"].dt.tz is not None:
+        frame["timestamp"] = frame["timestamp"].dt.tz_convert("UTC").dt.tz_localize(None)
+    return frame
+
+
+def _and(
+    left: pc.Expression | None, right: pc.Expression | None
+) -> pc.Expression | None:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return left & right
+
+
+def _time_filter(start: datetime | None, end: datetime | None) -> pc.Expression | None:
+    """Filter on ``timestamp`` plus the matching ``date`` partitions so whole days are pruned."""
+    condition = None
+    if start is not None:
+        begin = _utc(start)
+        condition = _and(
+            condition,
+            (pc.field("date") >= begin.date())
+            & (pc.field("timestamp") >= pa.scalar(begin.value, pa.timestamp("ns", tz="UTC"))),
+        )
+    if end is not None:
+        stop = _utc(end)
+        condition = _and(
+            condition,
+            (pc.field("date") <= stop.date())
+            & (pc.field("timestamp") < pa.scalar(stop.value, pa.timestamp("ns", tz="UTC"))),
+        )
+    return condition
+
+
+def _utc(value: datetime) -> pd.Timestamp:
+    stamp = pd.Timestamp(value)
+    return stamp.tz_localize("UTC") if stamp.tzinfo is None else stamp.tz_convert("UTC")
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import functools
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from silkroad.analytics.logger import (
+    SCHEMA_VERSION,
+    read_recent_runs,
+    read_result,
+    read_series,
+)
+
+if TYPE_CHECKING:
+    from silkroad.backtesting.results import BacktestResult
+
+
+class AnalyticsReader:
+    """Read-only query layer over the analytics SQLite database.
+
+    Queries check a ``mode=ro`` connection out of a pool of at most ``pool_size`` connections and
+    return it afterwards, so dashboards serving many sessions never share a connection between
+    concurrent queries or with the engine writing to the database, and threads that come and go
+    do not leave connections behind. In WAL mode readers see the last committed state without
+    blocking that writer. Each connection keeps its statements prepared (``cached_statements``),
+    so the fixed queries below are parsed once per connection.
+    """
+
+    def __init__(self, database: str, cached_statements: int = 64, pool_size: int = 8) -> None:
+        if pool_size <= 0:
+            raise ValueError("Reader pool_size must be positive.")
+        self.path = Path(database)
+        self.cached_statements = cached_statements
+        self.pool_size = pool_size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=pool_size)
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out a pooled connection for the duration of the block."""
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                # Connections checked out across close() are closed there, not returned.
+                if any(conn is pooled for pooled in self._connections):
+                    self._idle.put_nowait(conn)
+
+    def query(self, sql: str, params: Sequence[object] = ()) -> pd.DataFrame:
+        with self.connection() as conn:
+            return pd.read_sql_query(sql, conn, params=tuple(params))
+
+    def recent_trades(self, limit: int = 50) -> pd.DataFrame:
+        frame = self.query(
+            "SELECT timestamp, symbol, side, quantity, price, strategy, source "
+            "FROM trades ORDER BY timestamp DESC LIMIT ?",
+            (limit,),
+        )
+        frame["timestamp"] = pd.to_datetime(frame["timestamp"], unit="ns")
+        return frame
+
+    def recent_metrics(self, limit: int = 50) -> pd.DataFrame:
+        frame = self.query(
+            "SELECT run_id, timestamp, metric, value, metadata "
+            "FROM performance ORDER BY timestamp DESC LIMIT ?",
+            (limit,),
+        )
+        frame["timestamp"] = pd.to_datetime(frame["timestamp"], unit="ns")
+        return frame
+
+    def run_metrics(self, run_id: str) -> pd.DataFrame:
+        return self.query(
+            "SELECT metric, value FROM performance WHERE run_id = ? ORDER BY metric", (run_id,)
+        )
+
+    def recent_runs(self, limit: int = 20) -> pd.DataFrame:
+        with self.connection() as conn:
+            return read_recent_runs(conn, limit)
+
+    def load_series(self, run_id: str, name: str) -> pd.Series | None:
+        with self.connection() as conn:
+            return read_series(conn, run_id, name)
+
+    def load_result(self, run_id: str) -> BacktestResult | None:
+        # Series load later, after this connection is back in the pool, so each checks one out.
+        with self.connection() as conn:
+            return read_result(conn, run_id, functools.partial(self.load_series, run_id))
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+            while True:
+                try:
+                    self._idle.get_nowait()
+                except queue.Empty:
+                    break
+        for conn in connections:
+            conn.close()
+
+    def _checkout(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            opened = len(self._connections) < self.pool_size
+            if opened:
+                conn = self._open()
+                self._connections.append(conn)
+        # Every connection is in use: wait for one to be checked back in.
+        return conn if opened else self._idle.get()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            f"{self.path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            cached_statements=self.cached_statements,
+            # Pooled connections move between threads, one query at a time.
+            check_same_thread=False,
+        )
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            conn.close()
+            raise RuntimeError(
+                f"Analytics database '{self.path}' uses schema version {version}; open it with "
+                "AnalyticsStore once to upgrade it."
+            )
+        return conn
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from silkroad.analytics.logger import AnalyticsStore, PerformanceRecord, TradeRecord
+
+if TYPE_CHECKING:
+    from silkroad.backtesting.results import BacktestResult
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+_STOP = object()
+_FLUSH = object()
+# How often blocked callers re-check that the writer thread is still alive.
+_POLL_INTERVAL = 0.1
+
+
+class AsyncAnalyticsStore:
+    """Analytics store that hands records to a background writer thread.
+
+    ``log_trade``/``log_performance`` only enqueue, so trading loops never wait on SQLite. The
+    writer thread owns its own ``AnalyticsStore`` connection (or whatever ``store_factory`` opens)
+    and writes whatever has queued up as one batch (at most ``batch_size`` rows at a time); with
+    ``flush_on_drain=False`` the store keeps its own batching and is only flushed by ``flush()``
+    and ``close()``. When the bounded queue is full, ``overflow`` decides between waiting
+    (``"block"``), discarding the incoming record (``"drop_newest"``) or evicting the oldest
+    queued one (``"drop_oldest"``); discarded records are counted in ``dropped``. ``close()``
+    drains the queue before returning.
+
+    A record that fails to write is skipped and its exception kept in ``last_error``. If the
+    writer thread itself stops, calls that would wait on it raise ``RuntimeError`` instead.
+    """
+
+    def __init__(
+        self,
+        database: str,
+        queue_size: int = 10_000,
+        overflow: str = "block",
+        batch_size: int = 500,
+        store_factory: Callable[[], Any] | None = None,
+        flush_on_drain: bool = True,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unsupported overflow policy '{overflow}'.")
+        self.path = Path(database)
+        self.overflow = overflow
+        self.flush_on_drain = flush_on_drain
+        self.dropped = 0
+        self.last_error: BaseException | None = None
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._close_error: BaseException | None = None
+        if store_factory is None:
+            store_factory = partial(AnalyticsStore, database, buffer_size=batch_size)
+        ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(store_factory, ready),
+            name="silkroad-analytics-writer",
+            daemon=True,
+        )
+        self._thread.start()
+        ready.wait()
+        if self._close_error is not None:
+            raise self._close_error
+        atexit.register(self.close)
+
+    def log_trade(self, record: TradeRecord) -> None:
+        self._put(record)
+
+    def log_performance(self, record: PerformanceRecord) -> None:
+        self._put(record)
+
+    def log_result(self, result: BacktestResult) -> None:
+        self._put(result)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until every record queued so far has been written and the store flushed.
+
+        Raises ``TimeoutError`` after ``timeout`` seconds and ``RuntimeError`` if the writer
+        thread has stopped.
+        """
+        if self._closed:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._put_blocking(_FLUSH)
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                self._check_alive()
+                wait = _POLL_INTERVAL
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("Timed out waiting for the analytics writer.")
+                    wait = min(wait, remaining)
+                self._queue.all_tasks_done.wait(wait)
+
+    @contextmanager
+    def buffering(self, buffer_size: int = 1000) -> Iterator[AsyncAnalyticsStore]:
+        """Match ``AnalyticsStore.buffering``: writes are already batched, so only flush on exit."""
+        try:
+            yield self
+        finally:
+            self.flush()
+
+    def close(self, timeout: float | None = None) -> None:
+        """Write everything queued and stop the writer thread, waiting at most ``timeout``."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        with self._lock:
+            self._put_blocking(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise TimeoutError("Timed out waiting for the analytics writer to stop.")
+        if self._close_error is not None:
+            raise self._close_error
+
+    def _put(self, record: TradeRecord | PerformanceRecord | BacktestResult) -> None:
+        if self._closed:
+            raise RuntimeError("Analytics writer is closed.")
+        if self.overflow == "block":
+            self._put_blocking(record)
+            return
+        with self._lock:
+            while True:
+                try:
+                    self._queue.put_nowait(record)
+                    return
+                except queue.Full:
+                    pass
+                self.dropped += 1
+                if self.overflow == "drop_newest":
+                    return
+                try:
+                    evicted = self._queue.get_nowait()
+                except queue.Empty:
+                    continue
+                if evicted is _STOP or evicted is _FLUSH:
+                    # Control items are never evicted: keep it and drop the incoming record.
+                    self._queue.put_nowait(evicted)
+                    return
+                self._queue.task_done()
+
+    def _put_blocking(self, item: object) -> None:
+        while True:
+            self._check_alive()
+            try:
+                self._queue.put(item, timeout=_POLL_INTERVAL)
+                return
+            except queue.Full:
+                pass
+
+    def _check_alive(self) -> None:
+        if not self._thread.is_alive():
+            raise RuntimeError("Analytics writer thread has stopped.") from self._close_error
+
+    def _run(self, store_factory: Callable[[], Any], ready: threading.Event) -> None:
+        try:
+            store = store_factory()
+        except BaseException as exc:
+            self._close_error = exc
+            ready.set()
+            return
+        ready.set()
+        try:
+            while True:
+                item = self._queue.get()
+                try:
+                    if item is _STOP:
+                        break
+                    if item is _FLUSH:
+                        store.flush()
+                    elif isinstance(item, TradeRecord):
+                        store.log_trade(item)
+                    elif isinstance(item, PerformanceRecord):
+                        store.log_performance(item)
+                    else:
+                        store.log_result(item)  # type: ignore[arg-type]
+                    if self.flush_on_drain and self._queue.empty():
+                        store.flush()
+                except Exception as exc:
+                    # SQLite rows stay buffered in ``store`` and are retried with the next batch;
+                    # anything else loses only this record.
+                    self.last_error = exc
+                finally:
+                    self._queue.task_done()
+        except BaseException as exc:
+            self._close_error = exc
+        finally:
+            try:
+                store.close()
+            except (sqlite3.Error, OSError) as exc:
+                self._close_error = exc
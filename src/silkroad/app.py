@@ -1,17 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
 
-from .analytics import AnalyticsStore
+from .analytics import AnalyticsSink
+from .backtesting.engine import BacktestEngine
+from .backtesting.results import BacktestResult
 from .config.settings import AppConfig, load_config
-from .data import build_data_feed, MarketDataFeed
+from .data import AsyncMarketDataFeed, MarketDataFeed, build_async_data_feed, build_data_feed
 from .execution.base import ExecutionEngine
 from .monitoring.notifications import Notifier, PrintNotifier
 from .risk.manager import RiskLimits, RiskManager
 from .strategy.base import Strategy
-from .backtesting.engine import BacktestEngine
-from .backtesting.results import BacktestResult
 
 
 @dataclass
@@ -20,24 +19,35 @@ class SilkRoadApp:
 
     config: AppConfig
     strategy: Strategy
-    data_feed: MarketDataFeed
+    data_feed: MarketDataFeed | AsyncMarketDataFeed
     execution_engine: ExecutionEngine
     risk_manager: RiskManager
     notifier: Notifier
-    analytics: Optional[AnalyticsStore]
-    backtest_engine: Optional[BacktestEngine] = None
+    analytics: AnalyticsSink | None
+    backtest_engine: BacktestEngine | None = None
 
     @classmethod
-    def from_file(cls, path: str) -> "SilkRoadApp":
+    def from_file(cls, path: str) -> SilkRoadApp:
         config = load_config(path)
-        data_feed = build_data_feed(
-            source=config.data.source,
-            symbol=config.data.symbol,
-            interval=config.data.interval,
-            lookback=config.data.lookback,
-            poll_interval=config.data.poll_interval,
-            **config.data.parameters,
-        )
+        data_feed: MarketDataFeed | AsyncMarketDataFeed
+        if config.execution.name == "paper_portfolio":
+            data_feed = build_async_data_feed(
+                source=config.data.source,
+                symbols=config.data.symbols or [config.data.symbol],
+                interval=config.data.interval,
+                lookback=config.data.lookback,
+                poll_interval=config.data.poll_interval,
+                **config.data.parameters,
+            )
+        else:
+            data_feed = build_data_feed(
+                source=config.data.source,
+                symbol=config.data.symbol,
+                interval=config.data.interval,
+                lookback=config.data.lookback,
+                poll_interval=config.data.poll_interval,
+                **config.data.parameters,
+            )
         strategy = config.strategy.build()
         risk_limits = None
         if config.risk:
@@ -48,11 +58,9 @@ class SilkRoadApp:
             )
         risk_manager = RiskManager(limits=risk_limits)
         notifier: Notifier = PrintNotifier()
-        analytics_store: Optional[AnalyticsStore] = None
+        analytics_store: AnalyticsSink | None = None
         if config.analytics and config.analytics.enabled:
-            if config.analytics.backend != "sqlite":
-                raise ValueError(f"Unsupported analytics backend '{config.analytics.backend}'.")
-            analytics_store = AnalyticsStore(config.analytics.database)
+            analytics_store = config.analytics.build()
         execution = config.execution.build(
             symbol=config.data.symbol,
             data_feed=data_feed,
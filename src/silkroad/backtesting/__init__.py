@@ -1,7 +1,25 @@
 "Backtesting support utilities."
 
-from .engine import BacktestEngine
 from .backtrader_bridge import StrategyBridge
+from .barloop import BarLoop
+from .cache import ResultCache
+from .engine import BacktestEngine
+from .executors import EXECUTOR_REGISTRY, register_executor
 from .results import BacktestResult
+from .robustness import bootstrap, with_bootstrap
+from .sweep import ParameterSweep
+from .walkforward import WalkForward
 
-__all__ = ["BacktestEngine", "StrategyBridge", "BacktestResult"]
+__all__ = [
+    "EXECUTOR_REGISTRY",
+    "BacktestEngine",
+    "BarLoop",
+    "StrategyBridge",
+    "BacktestResult",
+    "ParameterSweep",
+    "ResultCache",
+    "WalkForward",
+    "bootstrap",
+    "register_executor",
+    "with_bootstrap",
+]
@@ -1,65 +1,97 @@
 from __future__ import annotations
 
 import backtrader as bt  # type: ignore
-import pandas as pd
 
-from silkroad.analytics.logger import AnalyticsStore, TradeRecord
-from silkroad.data.base import MarketSnapshot
+from silkroad.analytics.logger import AnalyticsSink, TradeRecord
+from silkroad.backtesting.portfolio import PortfolioLeg
+from silkroad.backtesting.vectorized import Fill
+from silkroad.data.base import HistoryCursor
 from silkroad.risk.manager import RiskManager
-from silkroad.strategy.base import Signal, Strategy
+from silkroad.strategy.base import Signal
 
 
 class StrategyBridge(bt.Strategy):  # type: ignore[misc]
+    """Feeds SilkRoad signals into Backtrader, one leg per data feed.
+
+    A single-symbol run passes ``silkroad_strategy``/``history``/``signals``; portfolio runs pass
+    ``legs`` in the same order as the data feeds, and each leg trades an equal-weight sleeve
+    (``1 / len(legs)`` of portfolio value) through the shared broker. The bridge records the
+    broker value of every bar in ``equity`` and every execution in ``fills`` for post-run metrics.
+    """
+
     params = dict(
         silkroad_strategy=None,
         history=None,
         risk_manager=None,
         analytics=None,
         symbol=None,
+        signals=None,
+        legs=None,
     )
 
     def __init__(self) -> None:
-        if self.p.silkroad_strategy is None:
-            raise ValueError("StrategyBridge requires 'silkroad_strategy' parameter.")
-        if self.p.history is None:
-            raise ValueError("StrategyBridge requires 'history' parameter.")
-        self.strategy: Strategy = self.p.silkroad_strategy
-        self.history_df: pd.DataFrame = self.p.history
+        legs: list[PortfolioLeg] | None = self.p.legs
+        if legs is None:
+            if self.p.silkroad_strategy is None:
+                raise ValueError("StrategyBridge requires 'silkroad_strategy' parameter.")
+            if self.p.history is None:
+                raise ValueError("StrategyBridge requires 'history' parameter.")
+            legs = [
+                PortfolioLeg(
+                    symbol=self.p.symbol or getattr(self.data, "symbol", "UNKNOWN"),
+                    strategy=self.p.silkroad_strategy,
+                    history=self.p.history,
+                    signals=self.p.signals,
+                )
+            ]
+        if len(legs) != len(self.datas):
+            raise ValueError("StrategyBridge needs exactly one leg per data feed.")
+        self.legs = legs
         self.risk_manager: RiskManager | None = self.p.risk_manager
-        self.analytics: AnalyticsStore | None = self.p.analytics
-        self.symbol: str = self.p.symbol or getattr(self.data, "symbol", "UNKNOWN")
+        self.analytics: AnalyticsSink | None = self.p.analytics
+        self.weight = 1.0 / len(legs)
         self.orders: list = []
+        self.equity: list[float] = []
+        self.fills: list[Fill] = []
+        self.cursors = [HistoryCursor.from_frame(leg.history) for leg in legs]
+        self._columns: dict[str, int] = {leg.symbol: column for column, leg in enumerate(legs)}
 
     def next(self) -> None:
-        current_dt = self.datas[0].datetime.datetime(0)
-        truncated_history = self.history_df.loc[: current_dt]
-        if truncated_history.empty:
-            return
-        snapshot = MarketSnapshot(truncated_history)
-        signal: Signal = self.strategy.generate_signal(snapshot)
+        position = len(self.datas[0]) - 1
+        self.equity.append(self.broker.getvalue())
+        for data, leg, cursor in zip(self.datas, self.legs, self.cursors, strict=True):
+            if leg.signals is not None:
+                side, size = int(leg.signals.sides[position]), float(leg.signals.sizes[position])
+            else:
+                cursor.position = position
+                side, size = leg.strategy.signal_side(cursor)
+            if not side:
+                continue
 
-        if self.risk_manager and not self.risk_manager.validate(signal):
-            return
-
-        if signal.side == "buy":
-            self.order_target_percent(target=min(1.0, signal.size))
-        elif signal.side == "sell":
-            self.order_target_percent(target=-min(1.0, signal.size))
-        else:
-            return
+            signal = Signal(side="buy" if side > 0 else "sell", size=size)
+            if self.risk_manager and not self.risk_manager.validate(signal):
+                continue
+            self.order_target_percent(data=data, target=side * min(1.0, size) * self.weight)
 
     def notify_order(self, order: bt.Order) -> None:  # type: ignore[override]
         if order.status in [order.Completed, order.Partial]:
+            column = self._columns.get(order.data._name, 0)
+            position = len(self.datas[0]) - 1
+            for bit in order.executed.iterpending():
+                self.fills.append(
+                    Fill(position, bit.size, bit.price, bit.closedcomm + bit.openedcomm, column)
+                )
             if self.analytics:
+                leg = self.legs[column]
                 executed_dt = bt.num2date(order.executed.dt)
                 self.analytics.log_trade(
                     TradeRecord(
                         timestamp=executed_dt,
-                        symbol=self.symbol,
+                        symbol=leg.symbol,
                         side="buy" if order.isbuy() else "sell",
                         quantity=abs(order.executed.size),
                         price=order.executed.price,
-                        strategy=self.strategy.name,
+                        strategy=leg.strategy.name,
                         source="backtest",
                     )
                 )
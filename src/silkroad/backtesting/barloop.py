@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from silkroad.backtesting.vectorized import Fill, TargetPercentSimulator, target_percents
+from silkroad.data.base import HistoryCursor
+from silkroad.risk.manager import RiskManager
+from silkroad.strategy.base import Signal, SignalBatch, Strategy
+
+
+class BarLoop:
+    """Backtrader-free event loop: signal, risk check and broker in one pass over bar positions.
+
+    The broker is ``TargetPercentSimulator``'s kernel, so both engines share one state machine.
+    Batch signals are turned into targets up front; per-bar strategies are asked through
+    ``Strategy.signal_side`` on one reused ``HistoryCursor`` as the kernel reaches each bar, so
+    no ``Signal`` or metadata is built for the bars that hold and the risk manager only sees
+    bars that would trade.
+    """
+
+    __slots__ = ("broker",)
+
+    def __init__(
+        self, starting_cash: float, commission: float = 0.0, slippage: float = 0.0
+    ) -> None:
+        self.broker = TargetPercentSimulator(
+            starting_cash=starting_cash, commission=commission, slippage=slippage
+        )
+
+    def run(
+        self,
+        frame: pd.DataFrame,
+        strategy: Strategy,
+        signals: SignalBatch | None = None,
+        risk_manager: RiskManager | None = None,
+    ) -> tuple[np.ndarray, list[Fill]]:
+        """Simulate a prepared frame, using ``signals`` when the strategy has a batch API."""
+        open_, high, low, close = (
+            frame[column].to_numpy(dtype=float) for column in ("open", "high", "low", "close")
+        )
+        if signals is not None:
+            allowed = risk_manager.validate_batch(signals) if risk_manager else None
+            return self.broker.run(open_, high, low, close, target_percents(signals, allowed))
+
+        cursor = HistoryCursor.from_frame(frame)
+        signal_side = strategy.signal_side
+        validate = risk_manager.validate if risk_manager is not None else None
+        nan = math.nan
+
+        def target_at(position: int) -> float:
+            cursor.position = position
+            side, size = signal_side(cursor)
+            if not side:
+                return nan
+            if validate is not None and not validate(
+                Signal(side="buy" if side > 0 else "sell", size=size)
+            ):
+                return nan
+            return side * min(1.0, size)
+
+        return self.broker.simulate(open_, high, low, close, target_at)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+from collections.abc import Iterable
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from silkroad.backtesting.results import BacktestResult
+
+# Bump when the pickled layout or the key recipe changes.
+CACHE_FORMAT = 2
+
+# Root of the installed ``silkroad`` package, whose sources are hashed into every key.
+_PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+class ResultCache:
+    """Content-addressed store of ``BacktestResult`` pickles with least-recently-used eviction.
+
+    Keys come from ``result_key``; a hit refreshes the entry's mtime, and once more than
+    ``max_entries`` files exist the least recently used ones are deleted.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 128) -> None:
+        self.path = Path(directory)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+    def get(self, key: str) -> BacktestResult | None:
+        entry = self.path / f"{key}.pkl"
+        try:
+            with entry.open("rb") as handle:
+                result = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Truncated or written by an incompatible version: treat as a miss.
+            entry.unlink(missing_ok=True)
+            return None
+        os.utime(entry)
+        return result
+
+    def put(self, key: str, result: BacktestResult) -> None:
+        result = dataclasses.replace(result, series_loader=None)
+        handle, temporary = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as stream:
+                pickle.dump(result, stream, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self.path / f"{key}.pkl")
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        self._evict()
+
+    def clear(self) -> None:
+        for entry in self.path.glob("*.pkl"):
+            entry.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in self.path.glob("*.pkl"):
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry))
+            except FileNotFoundError:
+                continue
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, entry in entries[: len(entries) - self.max_entries]:
+            entry.unlink(missing_ok=True)
+
+
+def result_key(histories: Iterable[pd.DataFrame], *parts: Any) -> str:
+    """SHA-256 over the history contents, the JSON form of ``parts`` and the code version."""
+    digest = hashlib.sha256()
+    for frame in histories:
+        digest.update(json.dumps([str(column) for column in frame.columns]).encode())
+        rows = pd.util.hash_pandas_object(frame, index=True).to_numpy()
+        digest.update(np.ascontiguousarray(rows).data)
+    for part in parts:
+        digest.update(json.dumps(part, sort_keys=True, default=repr).encode())
+    digest.update(_code_version().encode())
+    return digest.hexdigest()
+
+
+def strategy_state(strategy: Any) -> dict:
+    """Type and constructor parameters of a strategy, for use in ``result_key``."""
+    if dataclasses.is_dataclass(strategy):
+        fields = {f.name: getattr(strategy, f.name) for f in dataclasses.fields(strategy) if f.init}
+    else:
+        fields = {k: v for k, v in vars(strategy).items() if not k.startswith("_")}
+    cls = type(strategy)
+    return {
+        "type": f"{cls.__module__}.{cls.__qualname__}",
+        "source": _module_digest(cls.__module__),
+        "parameters": fields,
+    }
+
+
+@functools.cache
+def _code_version() -> str:
+    """Package version plus a hash of every ``silkroad`` source file, so local edits anywhere
+    a result depends on (indicators, strategies, risk, the engines) invalidate entries."""
+    try:
+        version = metadata.version("silkroad")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    digest = hashlib.sha256()
+    for source in sorted(_PACKAGE_ROOT.rglob("*.py")):
+        digest.update(source.relative_to(_PACKAGE_ROOT).as_posix().encode())
+        digest.update(source.read_bytes())
+    return f"{CACHE_FORMAT}:{version}:{digest.hexdigest()}"
+
+
+@functools.cache
+def _module_digest(name: str) -> str:
+    source = getattr(sys.modules.get(name), "__file__", None)
+    if not source or not Path(source).is_file():
+        return ""
+    return hashlib.sha256(Path(source).read_bytes()).hexdigest()
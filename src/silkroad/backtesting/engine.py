@@ -1,144 +1,373 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import copy
+import dataclasses
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
-import backtrader as bt  # type: ignore
+import numpy as np
 import pandas as pd
-from uuid import uuid4
 
-from silkroad.analytics.logger import AnalyticsStore, PerformanceRecord
-from silkroad.backtesting.backtrader_bridge import StrategyBridge
+from silkroad.analytics.logger import AnalyticsSink, PerformanceRecord, TradeRecord
+from silkroad.backtesting.cache import ResultCache, result_key, strategy_state
+from silkroad.backtesting.executors import get_executor
+from silkroad.backtesting.metrics import (
+    RunningMetrics,
+    annual_sharpe,
+    daily_returns,
+    holdings,
+    trade_pnls,
+)
+from silkroad.backtesting.portfolio import PortfolioLeg, align_histories
 from silkroad.backtesting.results import BacktestResult
-from silkroad.data import build_data_feed
-from silkroad.strategy.base import Strategy
+from silkroad.backtesting.robustness import with_bootstrap
+from silkroad.backtesting.vectorized import (
+    Fill,
+    TargetPercentSimulator,
+    collect_signals,
+    target_percents,
+)
+from silkroad.data import MarketDataFeed, SharedHistory, SharedHistoryHandle, build_data_feed
+from silkroad.indicators import release
+from silkroad.strategy.base import SignalBatch, Strategy
 
 if TYPE_CHECKING:
     from silkroad.config.settings import BacktestConfig, DataFeedConfig
     from silkroad.risk.manager import RiskManager
 
 
+@dataclass
+class _RunOutcome:
+    ending_value: float
+    total_trades: int
+    sharpe_ratio: float | None
+    returns_series: pd.Series | None
+    extra_metrics: dict[str, float]
+
+
 class BacktestEngine:
-    """Backtrader-powered engine for evaluating strategies on historical data feeds."""
+    """Evaluates strategies on historical data feeds with Backtrader or the vectorized simulator.
+
+    When ``data_feed_config.symbols`` is set the run becomes a portfolio backtest: histories are
+    loaded concurrently and aligned on one index, each symbol trades its own copy of the strategy
+    in an equal-weight sleeve, and all symbols share one broker. ``history`` may then be a mapping
+    of symbol to frame.
+    """
 
     def __init__(
         self,
         strategy: Strategy,
-        config: "BacktestConfig",
-        data_feed_config: "DataFeedConfig",
-        risk_manager: Optional["RiskManager"],
-        analytics: Optional[AnalyticsStore] = None,
+        config: BacktestConfig,
+        data_feed_config: DataFeedConfig,
+        risk_manager: RiskManager | None,
+        analytics: AnalyticsSink | None = None,
+        history: pd.DataFrame | SharedHistoryHandle | Mapping[str, pd.DataFrame] | None = None,
     ) -> None:
         self.strategy = strategy
         self.config = config
         self.data_feed_config = data_feed_config
         self.risk_manager = risk_manager
         self.analytics = analytics
+        self.history = history
+        self._shared_history: SharedHistory | None = None
+        self.cache = (
+            ResultCache(config.cache_dir, config.cache_entries) if config.cache_dir else None
+        )
 
     def run(self) -> BacktestResult:
         if not self.config.enabled:
             raise RuntimeError("Backtesting is disabled in the current configuration.")
 
-        history = self._load_history()
-        prepared_history = history.copy()
-        self.strategy.prepare(prepared_history)
-        prepared_history = prepared_history[~prepared_history.index.duplicated(keep="last")]
-        try:
-            prepared_history.index = prepared_history.index.tz_localize(None)
-        except TypeError:
-            pass
+        if self.config.chunk_size:
+            # Chunked runs never hold the whole history, so they are not fingerprinted or cached.
+            with self.analytics.buffering() if self.analytics else nullcontext():
+                result = self._result(*self._run_chunked(self.config.chunk_size))
+            self._log_result(result)
+            return result
 
-        cerebro = bt.Cerebro()
-        cerebro.broker.setcash(self.config.starting_cash)
-        cerebro.broker.setcommission(commission=self.config.commission)
-        if self.config.slippage:
-            cerebro.broker.set_slippage_perc(self.config.slippage)
-
-        data_feed = bt.feeds.PandasData(dataname=prepared_history)
-        cerebro.adddata(data_feed, name=self.data_feed_config.symbol)
-        cerebro.addstrategy(
-            StrategyBridge,
-            silkroad_strategy=self.strategy,
-            history=prepared_history,
-            risk_manager=self.risk_manager,
-            analytics=self.analytics,
-            symbol=self.data_feed_config.symbol,
-        )
-        cerebro.addanalyzer(bt.analyzers.SharpeRatio_A, _name="sharpe")
-        cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name="trades")
-        cerebro.addanalyzer(bt.analyzers.TimeReturn, timeframe=bt.TimeFrame.Days, _name="returns")
-
-        strategies = cerebro.run()
-        bridge: StrategyBridge = strategies[0]
-
-        ending_value = cerebro.broker.getvalue()
-        total_return = (ending_value / self.config.starting_cash) - 1
-        trade_analysis = bridge.analyzers.trades.get_analysis()
-        total_trades = (
-            trade_analysis.get("total", {}).get("closed", 0) if hasattr(bridge.analyzers, "trades") else 0
-        )
-        sharpe_ratio = None
-        if hasattr(bridge.analyzers, "sharpe"):
-            sharpe_ratio = bridge.analyzers.sharpe.get_analysis().get("sharperatio")
+        if self.data_feed_config.symbols:
+            histories = self._load_histories()
+        else:
+            histories = {self.data_feed_config.symbol: self._load_history()}
+        key = self._cache_key(histories) if self.cache is not None else None
+        cached = self.cache.get(key) if self.cache is not None and key is not None else None
+        if cached is not None:
+            # Same data, parameters and code: reuse the stored run under a fresh run_id.
+            result = dataclasses.replace(
+                cached, run_id=uuid4().hex, completed_at=pd.Timestamp.utcnow().to_pydatetime()
+            )
+        else:
+            # Fills are written in batches for the duration of the run and flushed before returning.
+            with self.analytics.buffering() if self.analytics else nullcontext():
+                result = self._simulate(histories)
+            if self.cache is not None and key is not None:
+                self.cache.put(key, result)
+
+        self._log_result(result)
+        return result
 
-        run_id = uuid4().hex
-        completed_at = pd.Timestamp.utcnow().to_pydatetime()
-        extra_metrics = {}
+    def _simulate(self, histories: dict[str, pd.DataFrame]) -> BacktestResult:
+        executor = get_executor(self.config.engine)
+        if self.data_feed_config.symbols:
+            legs = self._portfolio_legs(histories)
+            # A portfolio has no single price series; per-symbol prices stay in the legs.
+            price_series: pd.Series | None = None
+        else:
+            symbol = self.data_feed_config.symbol
+            prepared_history = self._prepare_history(histories[symbol])
+            signals = self.strategy.generate_signals(prepared_history)
+            legs = [PortfolioLeg(symbol, self.strategy, prepared_history, signals)]
+            price_series = prepared_history["close"].copy()
+        equity_values, fills = executor(self, legs)
+        self._log_fills(fills, legs)
+        outcome = self._outcome(equity_values, legs[0].history.index, fills)
+        return self._result(outcome, price_series)
 
-        price_series = prepared_history["close"].copy()
+    def _result(self, outcome: _RunOutcome, price_series: pd.Series | None) -> BacktestResult:
+        ending_value = outcome.ending_value
         equity_curve = None
-        if hasattr(bridge.analyzers, "returns"):
-            returns = bridge.analyzers.returns.get_analysis()
-            if returns:
-                returns_series = pd.Series(list(returns.values()), index=pd.to_datetime(list(returns.keys())))
-                returns_series = returns_series.sort_index()
-                equity_curve = (1 + returns_series).cumprod() * self.config.starting_cash
-                extra_metrics["avg_daily_return"] = float(returns_series.mean())
+        returns_series = outcome.returns_series
+        if returns_series is not None and not returns_series.empty:
+            equity_curve = (1 + returns_series).cumprod() * self.config.starting_cash
 
         result = BacktestResult(
             strategy_name=self.strategy.name,
             starting_cash=self.config.starting_cash,
             ending_value=ending_value,
-            total_return=total_return,
-            total_trades=total_trades,
-            sharpe_ratio=sharpe_ratio,
-            run_id=run_id,
-            completed_at=completed_at,
-            extra_metrics=extra_metrics,
+            total_return=(ending_value / self.config.starting_cash) - 1,
+            total_trades=outcome.total_trades,
+            sharpe_ratio=outcome.sharpe_ratio,
+            run_id=uuid4().hex,
+            completed_at=pd.Timestamp.utcnow().to_pydatetime(),
+            extra_metrics=outcome.extra_metrics,
             price_series=price_series,
             equity_curve=equity_curve,
+            returns_series=returns_series,
         )
+        if self.config.bootstrap_samples:
+            # Intervals are computed once here, then cached and logged along with the run.
+            result = with_bootstrap(result, **bootstrap_options(self.config))
+        return result
 
-        if self.analytics:
+    def _cache_key(self, histories: dict[str, pd.DataFrame]) -> str:
+        return result_key(
+            histories.values(),
+            list(histories),
+            strategy_state(self.strategy),
+            # Settings that only change where or how fast a run happens are not part of the key.
+            self.config.model_dump(
+                exclude={"enabled", "cache_dir", "cache_entries", "bootstrap_workers"}
+            ),
+            getattr(self.risk_manager, "limits", None),
+        )
+
+    def _log_result(self, result: BacktestResult) -> None:
+        if not self.analytics:
+            return
+        metrics = {"total_return": result.total_return, "sharpe_ratio": result.sharpe_ratio}
+        for metric, value in metrics.items():
+            if value is None:
+                continue
             self.analytics.log_performance(
                 PerformanceRecord(
-                    run_id=run_id,
-                    timestamp=completed_at,
-                    metric="total_return",
-                    value=total_return,
+                    run_id=result.run_id,
+                    timestamp=result.completed_at,
+                    metric=metric,
+                    value=value,
                     metadata={"strategy": self.strategy.name},
                 )
             )
-            if sharpe_ratio is not None:
-                self.analytics.log_performance(
-                    PerformanceRecord(
-                        run_id=run_id,
-                        timestamp=completed_at,
-                        metric="sharpe_ratio",
-                        value=sharpe_ratio,
-                        metadata={"strategy": self.strategy.name},
-                    )
+        self.analytics.log_result(result)
+
+    def _prepare_history(self, history: pd.DataFrame) -> pd.DataFrame:
+        # A shallow copy keeps the loaded (possibly shared, read-only) columns and lets prepare()
+        # add indicator columns without duplicating OHLCV data.
+        prepared_history = history.copy(deep=False)
+        self.strategy.prepare(prepared_history)
+        prepared_history = prepared_history[~prepared_history.index.duplicated(keep="last")]
+        try:
+            prepared_history.index = prepared_history.index.tz_localize(None)
+        except TypeError:
+            pass
+        return prepared_history
+
+    def _portfolio_legs(self, histories: dict[str, pd.DataFrame]) -> list[PortfolioLeg]:
+        """One leg per symbol in ``data_feed_config.symbols``, traded against one shared broker."""
+        legs: list[PortfolioLeg] = []
+        for symbol, frame in align_histories(histories).items():
+            # Each symbol gets its own copy so stateful strategies never see another symbol's bars.
+            strategy = copy.deepcopy(self.strategy)
+            strategy.prepare(frame)
+            legs.append(PortfolioLeg(symbol, strategy, frame, strategy.generate_signals(frame)))
+        return legs
+
+    def _log_fills(self, fills: list[Fill], legs: list[PortfolioLeg]) -> None:
+        if not self.analytics:
+            return
+        for fill in fills:
+            leg = legs[fill.column]
+            self.analytics.log_trade(
+                TradeRecord(
+                    timestamp=leg.history.index[fill.position].to_pydatetime(),
+                    symbol=leg.symbol,
+                    side="buy" if fill.size > 0 else "sell",
+                    quantity=abs(fill.size),
+                    price=fill.price,
+                    strategy=leg.strategy.name,
+                    source="backtest",
                 )
-        return result
+            )
 
-    def _load_history(self) -> pd.DataFrame:
-        feed = build_data_feed(
-            source=self.data_feed_config.source,
-            symbol=self.data_feed_config.symbol,
-            interval=self.data_feed_config.interval,
-            lookback=self.data_feed_config.lookback,
-            poll_interval=self.data_feed_config.poll_interval,
-            **self.data_feed_config.parameters,
+    def _outcome(
+        self, equity_values: np.ndarray, index: pd.DatetimeIndex, fills: list[Fill]
+    ) -> _RunOutcome:
+        running = RunningMetrics(self.config.starting_cash)
+        running.add(pd.Series(equity_values, index=index), holdings(fills, len(equity_values)))
+        return self._running_outcome(running, fills)
+
+    def _running_outcome(self, running: RunningMetrics, fills: list[Fill]) -> _RunOutcome:
+        starting_cash = self.config.starting_cash
+        if not running.bars:
+            return _RunOutcome(starting_cash, 0, None, None, {})
+        day_end = running.day_end_equity()
+        return _RunOutcome(
+            ending_value=running.last_value,
+            total_trades=len(trade_pnls(fills)),
+            sharpe_ratio=annual_sharpe(day_end, starting_cash),
+            returns_series=daily_returns(day_end, starting_cash),
+            extra_metrics=running.summary(fills),
         )
-        history = feed.load_history()
-        history = history.sort_index()
-        return history
+
+    def _run_chunked(self, chunk_size: int) -> tuple[_RunOutcome, pd.Series | None]:
+        """Vectorized run over history blocks, keeping only ``Strategy.warmup()`` bars between them.
+
+        Each block is prepared together with the warm-up tail of the previous one, simulated with
+        the resumable ``TargetPercentSimulator`` and folded into ``RunningMetrics``; fills are
+        logged per block, and only day-end equity and closes are kept for the result.
+        """
+        if self.config.engine != "vectorized":
+            raise ValueError("Chunked backtests (chunk_size) require engine: vectorized.")
+        if self.data_feed_config.symbols:
+            raise ValueError("Chunked backtests do not support portfolio (data.symbols) runs.")
+        warmup = self.strategy.warmup()
+        simulator = TargetPercentSimulator(
+            starting_cash=self.config.starting_cash,
+            commission=self.config.commission,
+            slippage=self.config.slippage,
+        )
+        running = RunningMetrics(self.config.starting_cash)
+        fills: list[Fill] = []
+        closes: list[pd.Series] = []
+        tail: pd.DataFrame | None = None
+        offset = 0
+        for block in self._history_blocks(chunk_size):
+            frame = block if tail is None else pd.concat([tail, block])
+            prepared = self._prepare_history(frame)
+            # Warm-up rows only feed the indicators; they were simulated with the previous block.
+            skip = 0
+            if tail is not None and len(tail):
+                boundary = pd.Timestamp(tail.index[-1]).tz_localize(None)
+                skip = int(prepared.index.searchsorted(boundary, side="right"))
+            current = prepared.iloc[skip:]
+            if len(current):
+                signals = self.strategy.generate_signals(prepared)
+                if signals is None:
+                    signals = collect_signals(self.strategy, prepared)
+                signals = SignalBatch(sides=signals.sides[skip:], sizes=signals.sizes[skip:])
+                allowed = self.risk_manager.validate_batch(signals) if self.risk_manager else None
+                start = simulator.position
+                equity_values, block_fills = simulator.run(
+                    current["open"].to_numpy(dtype=float),
+                    current["high"].to_numpy(dtype=float),
+                    current["low"].to_numpy(dtype=float),
+                    current["close"].to_numpy(dtype=float),
+                    target_percents(signals, allowed),
+                )
+                held = holdings(block_fills, len(current), start=[start])
+                running.add(pd.Series(equity_values, index=current.index), held)
+                leg = PortfolioLeg(self.data_feed_config.symbol, self.strategy, current)
+                self._log_fills(block_fills, [leg])
+                fills.extend(
+                    dataclasses.replace(fill, position=fill.position + offset)
+                    for fill in block_fills
+                )
+                closes.append(current["close"].groupby(current.index.normalize()).last())
+                offset += len(current)
+            tail = frame.iloc[len(frame) - warmup :] if warmup else frame.iloc[len(frame) :]
+            release(frame)
+
+        price_series = None
+        if closes:
+            price_series = pd.concat(closes)
+            price_series = price_series[~price_series.index.duplicated(keep="last")]
+        return self._running_outcome(running, fills), price_series
+
+    def _history_blocks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        if self.history is not None and not isinstance(self.history, Mapping):
+            history = self._load_history()
+            for start in range(0, len(history), chunk_size):
+                yield history.iloc[start : start + chunk_size]
+            return
+        yield from build_feed(self.data_feed_config).iter_history(chunk_size)
+
+    def _load_history(self) -> pd.DataFrame:
+        if isinstance(self.history, SharedHistoryHandle):
+            if self._shared_history is None:
+                self._shared_history = SharedHistory.attach(self.history)
+            return self._shared_history.frame()
+        if self.history is not None:
+            return self.history
+        return load_history(self.data_feed_config)
+
+    def _load_histories(self) -> dict[str, pd.DataFrame]:
+        if isinstance(self.history, Mapping):
+            return dict(self.history)
+        return load_histories(self.data_feed_config)
+
+
+def build_feed(data_feed_config: DataFeedConfig) -> MarketDataFeed:
+    return build_data_feed(
+        source=data_feed_config.source,
+        symbol=data_feed_config.symbol,
+        interval=data_feed_config.interval,
+        lookback=data_feed_config.lookback,
+        poll_interval=data_feed_config.poll_interval,
+        **data_feed_config.parameters,
+    )
+
+
+def bootstrap_options(config: BacktestConfig) -> dict[str, Any]:
+    """Keyword arguments for ``robustness.bootstrap`` from a ``BacktestConfig``."""
+    return {
+        "samples": config.bootstrap_samples,
+        "block_size": config.bootstrap_block,
+        "confidence": config.bootstrap_confidence,
+        "seed": config.bootstrap_seed,
+        "workers": config.bootstrap_workers,
+    }
+
+
+def load_history(data_feed_config: DataFeedConfig) -> pd.DataFrame:
+    history = build_feed(data_feed_config).load_history()
+    history = history.sort_index()
+    return history
+
+
+def load_histories(
+    data_feed_config: DataFeedConfig, max_workers: int = 8
+) -> dict[str, pd.DataFrame]:
+    """Load every symbol in ``data_feed_config.symbols`` concurrently, keyed by symbol.
+
+    Fetching is I/O bound (exchange APIs, cache files), so a thread pool overlaps the requests;
+    each symbol builds its own feed, so no client is shared between threads.
+    """
+    symbols = list(data_feed_config.symbols)
+    if not symbols:
+        return {}
+    configs = [data_feed_config.model_copy(update={"symbol": symbol}) for symbol in symbols]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as pool:
+        return dict(zip(symbols, pool.map(load_history, configs), strict=True))
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import backtrader as bt  # type: ignore
+import numpy as np
+
+from silkroad.backtesting.backtrader_bridge import StrategyBridge
+from silkroad.backtesting.barloop import BarLoop
+from silkroad.backtesting.portfolio import PortfolioLeg
+from silkroad.backtesting.vectorized import (
+    Fill,
+    PortfolioSimulator,
+    TargetPercentSimulator,
+    collect_signals,
+    target_percents,
+)
+
+if TYPE_CHECKING:
+    from silkroad.backtesting.engine import BacktestEngine
+
+_Run = tuple[np.ndarray, list[Fill]]
+_PRICE_COLUMNS = ("open", "high", "low", "close")
+
+# Runs prepared legs (one per symbol, sharing one index) and returns the broker value of every
+# bar plus every execution; the engine logs the fills and computes metrics from both.
+Executor = Callable[["BacktestEngine", list[PortfolioLeg]], _Run]
+
+EXECUTOR_REGISTRY: dict[str, Executor] = {}
+
+
+def register_executor(name: str) -> Callable[[Executor], Executor]:
+    def decorator(executor: Executor) -> Executor:
+        EXECUTOR_REGISTRY[name] = executor
+        return executor
+
+    return decorator
+
+
+def get_executor(name: str) -> Executor:
+    try:
+        return EXECUTOR_REGISTRY[name]
+    except KeyError as exc:
+        raise ValueError(f"Unsupported backtest engine '{name}'.") from exc
+
+
+@register_executor("backtrader")
+def run_backtrader(engine: BacktestEngine, legs: list[PortfolioLeg]) -> _Run:
+    config = engine.config
+    # Metrics are computed after the run from the bridge's equity and fills, so no analyzers
+    # or observers run per bar.
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.broker.setcash(config.starting_cash)
+    cerebro.broker.setcommission(commission=config.commission)
+    if config.slippage:
+        cerebro.broker.set_slippage_perc(config.slippage, slip_open=True)
+    for leg in legs:
+        cerebro.adddata(bt.feeds.PandasData(dataname=leg.history), name=leg.symbol)
+    cerebro.addstrategy(StrategyBridge, legs=legs, risk_manager=engine.risk_manager)
+    bridge: StrategyBridge = cerebro.run()[0]
+    return np.asarray(bridge.equity, dtype=float), bridge.fills
+
+
+@register_executor("vectorized")
+def run_vectorized(engine: BacktestEngine, legs: list[PortfolioLeg]) -> _Run:
+    config, risk_manager = engine.config, engine.risk_manager
+    targets = []
+    for leg in legs:
+        signals = leg.signals
+        if signals is None:
+            signals = collect_signals(leg.strategy, leg.history)
+        allowed = risk_manager.validate_batch(signals) if risk_manager else None
+        targets.append(target_percents(signals, allowed) / len(legs))
+    costs = {"commission": config.commission, "slippage": config.slippage}
+    if len(legs) == 1:
+        history = legs[0].history
+        open_, high, low, close = (
+            history[column].to_numpy(dtype=float) for column in _PRICE_COLUMNS
+        )
+        simulator = TargetPercentSimulator(starting_cash=config.starting_cash, **costs)
+        return simulator.run(open_, high, low, close, targets[0])
+    open_, high, low, close = (
+        np.column_stack([leg.history[column].to_numpy(dtype=float) for leg in legs])
+        for column in _PRICE_COLUMNS
+    )
+    portfolio = PortfolioSimulator(starting_cash=config.starting_cash, **costs)
+    return portfolio.run(open_, high, low, close, np.column_stack(targets))
+
+
+@register_executor("barloop")
+def run_bar_loop(engine: BacktestEngine, legs: list[PortfolioLeg]) -> _Run:
+    if len(legs) != 1:
+        raise ValueError(
+            "The barloop engine runs single-symbol backtests; use vectorized for data.symbols."
+        )
+    leg = legs[0]
+    loop = BarLoop(
+        starting_cash=engine.config.starting_cash,
+        commission=engine.config.commission,
+        slippage=engine.config.slippage,
+    )
+    return loop.run(leg.history, leg.strategy, leg.signals, engine.risk_manager)
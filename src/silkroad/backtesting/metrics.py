@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from silkroad.backtesting.vectorized import Fill
+
+_DAYS_PER_YEAR = 365.25
+
+
+def daily_returns(equity: pd.Series, starting_cash: float) -> pd.Series:
+    """Close-to-close daily returns, the first day measured from ``starting_cash``."""
+    day_end = equity.groupby(equity.index.normalize()).last()
+    previous = day_end.shift(1)
+    previous.iloc[0] = starting_cash
+    returns = day_end / previous - 1.0
+    returns.index = returns.index + pd.Timedelta(days=1) - pd.Timedelta(microseconds=1)
+    return returns
+
+
+def annual_sharpe(
+    equity: pd.Series, starting_cash: float, riskfree_rate: float = 0.01
+) -> float | None:
+    """Sharpe ratio of calendar-year returns, mirroring Backtrader's ``SharpeRatio_A`` defaults."""
+    year_end = equity.groupby(equity.index.year).last().to_numpy()
+    returns = year_end / np.r_[starting_cash, year_end[:-1]] - 1.0
+    excess = returns - riskfree_rate
+    deviation = float(np.sqrt(np.mean((excess - excess.mean()) ** 2)))
+    if not deviation or math.isnan(deviation):
+        return None
+    return float(excess.mean()) / deviation
+
+
+def max_drawdown(equity: np.ndarray, starting_cash: float) -> float:
+    """Largest peak-to-trough loss as a fraction of the peak (0.25 means -25%)."""
+    if not len(equity):
+        return 0.0
+    peaks = np.maximum.accumulate(np.maximum(equity, starting_cash))
+    return float(np.max(1.0 - equity / peaks))
+
+
+def sortino_ratio(returns: pd.Series) -> float | None:
+    """Annualized mean over downside deviation of daily returns (periods per year from the data)."""
+    values = returns.to_numpy(dtype=float)
+    downside = float(np.sqrt(np.mean(np.minimum(values, 0.0) ** 2))) if len(values) else 0.0
+    if not downside:
+        return None
+    return float(values.mean()) / downside * math.sqrt(periods_per_year(returns))
+
+
+def periods_per_year(returns: pd.Series) -> float:
+    """Observations per year implied by the span of a datetime-indexed series."""
+    span_days = (returns.index[-1] - returns.index[0]).days + 1
+    return len(returns) / span_days * _DAYS_PER_YEAR
+
+
+def trade_pnls(fills: Sequence[Fill]) -> np.ndarray:
+    """Net profit of every closed round trip, commissions included, in the order they closed.
+
+    A trade opens when a column's position leaves zero and closes when it returns to zero or
+    reverses; a reversing fill closes the trade and opens the next one with the remainder.
+    """
+    positions: dict[int, float] = {}
+    costs: dict[int, float] = {}
+    pnls: dict[int, float] = {}
+    closed = []
+    for fill in fills:
+        column, size, price = fill.column, fill.size, fill.price
+        position = positions.get(column, 0.0)
+        commission = fill.commission
+        if position and (position > 0) != (size > 0):
+            closing = -position if abs(size) > abs(position) else size
+            share = closing / size
+            pnl = pnls.get(column, 0.0) - closing * (price - costs[column])
+            pnl -= commission * share
+            commission *= 1.0 - share
+            position += closing
+            size -= closing
+            if not position:
+                closed.append(pnl)
+                pnl = 0.0
+            pnls[column] = pnl
+        if size:
+            # Opening or adding: the average entry price absorbs the new units.
+            costs[column] = (costs.get(column, 0.0) * position + price * size) / (position + size)
+            position += size
+            pnls[column] = pnls.get(column, 0.0) - commission
+        positions[column] = position
+    return np.asarray(closed, dtype=float)
+
+
+def holdings(fills: Sequence[Fill], length: int, start: Sequence[float] = ()) -> np.ndarray:
+    """Whether any column holds a position at the end of each bar, given the starting positions."""
+    columns = max([len(start) - 1, *(fill.column for fill in fills)], default=0) + 1
+    held = np.zeros((length, columns))
+    if length:
+        held[0, : len(start)] = start
+    for fill in fills:
+        held[fill.position, fill.column] += fill.size
+    return np.any(held.cumsum(axis=0) != 0, axis=1)
+
+
+class RunningMetrics:
+    """Accumulates equity blocks so long runs never keep the per-bar curve.
+
+    Only day-end equity, the running peak/drawdown and a few sums are retained; ``summary``
+    then yields the same values ``performance_metrics`` computes from the full curve.
+    """
+
+    def __init__(self, starting_cash: float) -> None:
+        self.starting_cash = starting_cash
+        self.bars = 0
+        self.bars_held = 0
+        self.equity_sum = 0.0
+        self.peak = starting_cash
+        self.drawdown = 0.0
+        self.first: pd.Timestamp | None = None
+        self.last: pd.Timestamp | None = None
+        self.last_value = starting_cash
+        self._day_ends: list[pd.Series] = []
+
+    def add(self, equity: pd.Series, held: np.ndarray) -> None:
+        if not len(equity):
+            return
+        values = equity.to_numpy(dtype=float)
+        peaks = np.maximum.accumulate(np.maximum(values, self.peak))
+        self.drawdown = max(self.drawdown, float(np.max(1.0 - values / peaks)))
+        self.peak = float(peaks[-1])
+        self.bars += len(values)
+        self.bars_held += int(np.count_nonzero(held))
+        self.equity_sum += float(values.sum())
+        if self.first is None:
+            self.first = equity.index[0]
+        self.last, self.last_value = equity.index[-1], float(values[-1])
+        self._day_ends.append(equity.groupby(equity.index.normalize()).last())
+
+    def day_end_equity(self) -> pd.Series:
+        """Equity at the last bar of every day seen so far."""
+        if not self._day_ends:
+            return pd.Series(dtype=float)
+        # A day split across blocks keeps the value from the later block.
+        merged = pd.concat(self._day_ends)
+        merged = merged[~merged.index.duplicated(keep="last")]
+        self._day_ends = [merged]
+        return merged
+
+    def summary(self, fills: Sequence[Fill]) -> dict[str, float]:
+        metrics: dict[str, float] = {
+            "max_drawdown": self.drawdown,
+            "exposure": self.bars_held / self.bars if self.bars else 0.0,
+            "turnover": 0.0,
+        }
+        if not self.bars:
+            return metrics
+        mean_equity = self.equity_sum / self.bars
+        if mean_equity:
+            metrics["turnover"] = sum(abs(f.size) * f.price for f in fills) / mean_equity
+        returns = daily_returns(self.day_end_equity(), self.starting_cash)
+        metrics["avg_daily_return"] = float(returns.mean())
+        sortino = sortino_ratio(returns)
+        if sortino is not None:
+            metrics["sortino_ratio"] = sortino
+        if self.first is not None and self.last is not None:
+            years = (self.last - self.first).total_seconds() / 86_400 / _DAYS_PER_YEAR
+            growth = self.last_value / self.starting_cash
+            if self.drawdown and years > 0 and growth > 0:
+                metrics["calmar_ratio"] = (growth ** (1.0 / years) - 1.0) / self.drawdown
+        metrics.update(trade_metrics(fills))
+        return metrics
+
+
+def trade_metrics(fills: Sequence[Fill]) -> dict[str, float]:
+    """Win rate, average/best/worst trade and profit factor of the closed round trips."""
+    pnls = trade_pnls(fills)
+    if not len(pnls):
+        return {}
+    wins, losses = pnls[pnls > 0], pnls[pnls < 0]
+    metrics = {
+        "win_rate": float(len(wins) / len(pnls)),
+        "avg_trade_pnl": float(pnls.mean()),
+        "best_trade": float(pnls.max()),
+        "worst_trade": float(pnls.min()),
+    }
+    if len(losses):
+        metrics["profit_factor"] = float(wins.sum() / -losses.sum())
+    return metrics
+
+
+def performance_metrics(
+    equity: pd.Series, fills: Sequence[Fill], starting_cash: float
+) -> dict[str, float]:
+    """Post-run ``BacktestResult.extra_metrics`` computed from per-bar equity and fills.
+
+    Ratios that are undefined for the run (no losing days, no drawdown, no trades) are omitted.
+    """
+    running = RunningMetrics(starting_cash)
+    running.add(equity, holdings(fills, len(equity)))
+    return running.summary(fills)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import reduce
+
+import pandas as pd
+
+from silkroad.strategy.base import SignalBatch, Strategy
+
+
+@dataclass
+class PortfolioLeg:
+    """One symbol of a portfolio backtest: its own strategy copy, prepared frame and signals."""
+
+    symbol: str
+    strategy: Strategy
+    history: pd.DataFrame
+    signals: SignalBatch | None = None
+
+
+def align_histories(histories: Mapping[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    """Reindex every history onto the union of their timestamps.
+
+    Bars a symbol is missing are carried forward as flat, zero-volume bars at the previous close,
+    and leading rows are dropped until every symbol has traded, so all frames share one index.
+    """
+    frames: dict[str, pd.DataFrame] = {}
+    for symbol, frame in histories.items():
+        if frame.empty:
+            raise ValueError(f"No history loaded for symbol '{symbol}'.")
+        frame = frame[~frame.index.duplicated(keep="last")].sort_index()
+        try:
+            frame.index = frame.index.tz_localize(None)
+        except TypeError:
+            pass
+        frames[symbol] = frame
+    if not frames:
+        raise ValueError("Portfolio backtests require at least one symbol.")
+
+    index = reduce(lambda left, right: left.union(right), (f.index for f in frames.values()))
+    start = max(frame.index[0] for frame in frames.values())
+    index = index[index >= start]
+
+    aligned: dict[str, pd.DataFrame] = {}
+    for symbol, frame in frames.items():
+        frame = frame.reindex(index)
+        missing = frame["close"].isna()
+        frame = frame.ffill()
+        for column in ("open", "high", "low"):
+            if column in frame:
+                frame[column] = frame[column].where(~missing, frame["close"])
+        if "volume" in frame:
+            frame["volume"] = frame["volume"].where(~missing, 0.0)
+        aligned[symbol] = frame
+    return aligned
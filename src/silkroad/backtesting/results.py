@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional
 
 import pandas as pd
 
@@ -14,9 +14,21 @@ class BacktestResult:
     ending_value: float
     total_return: float
     total_trades: int
-    sharpe_ratio: Optional[float]
+    sharpe_ratio: float | None
     run_id: str
     completed_at: datetime
-    extra_metrics: Dict[str, float]
-    price_series: Optional[pd.Series] = None
-    equity_curve: Optional[pd.Series] = None
+    extra_metrics: dict[str, float]
+    price_series: pd.Series | None = None
+    equity_curve: pd.Series | None = None
+    returns_series: pd.Series | None = None
+    series_loader: Callable[[str], pd.Series | None] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    def series(self, name: str) -> pd.Series | None:
+        """Return ``price_series``, ``equity_curve`` or ``returns_series``, loading it if stored."""
+        value = getattr(self, name)
+        if value is None and self.series_loader is not None:
+            value = self.series_loader(name)
+            setattr(self, name, value)
+        return value
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from silkroad.backtesting.metrics import periods_per_year
+from silkroad.backtesting.results import BacktestResult
+
+# Statistics computed for every resampled path, in the column order of ``resample_metrics``.
+# ``daily_sharpe`` is the annualized Sharpe ratio of the per-period returns, not the calendar-year
+# ``BacktestResult.sharpe_ratio``, so it is named apart from it.
+BOOTSTRAP_METRICS = ("total_return", "daily_sharpe", "max_drawdown")
+
+# (returns, paths in the batch, block size, batch seed, periods per year)
+_Batch = tuple[np.ndarray, int, int, np.random.SeedSequence, float]
+
+
+def bootstrap(
+    returns: pd.Series | np.ndarray,
+    samples: int = 1000,
+    block_size: int | None = None,
+    confidence: float = 0.95,
+    seed: int | None = None,
+    workers: int | None = None,
+    batch_size: int = 500,
+) -> dict[str, float]:
+    """Block-bootstrap confidence intervals of total return, daily Sharpe and max drawdown.
+
+    ``returns`` are per-period returns, such as a run's daily ``returns_series`` or per-trade
+    returns. Each path draws blocks of ``block_size`` consecutive returns (default: the cube
+    root of the length) with replacement, wrapping at the end, so short-range autocorrelation
+    survives. Paths are generated and scored ``batch_size`` at a time as 2-D arrays, across
+    ``workers`` processes when more than one is given; every batch has its own child seed, so the
+    result depends on ``seed`` but not on ``workers``.
+
+    ``daily_sharpe`` is the mean over the standard deviation of the per-period returns,
+    annualized from the index spacing of a datetime-indexed series (unannualized otherwise). It
+    differs from the run's calendar-year ``sharpe_ratio``. An interval is omitted when it is
+    undefined.
+    """
+    if samples <= 0:
+        raise ValueError("Bootstrap samples must be positive.")
+    if not 0 < confidence < 1:
+        raise ValueError("Bootstrap confidence must be between 0 and 1.")
+    periods = 1.0
+    if isinstance(returns, pd.Series):
+        returns = returns.dropna()
+        if isinstance(returns.index, pd.DatetimeIndex) and len(returns):
+            periods = periods_per_year(returns)
+    values = np.asarray(returns, dtype=float)
+    values = values[~np.isnan(values)]
+    if len(values) < 2:
+        raise ValueError("Bootstrapping needs at least two returns.")
+    block = block_size or max(1, round(len(values) ** (1 / 3)))
+
+    counts = [min(batch_size, samples - start) for start in range(0, samples, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(counts))
+    tasks = [
+        (values, count, block, child, periods)
+        for count, child in zip(counts, seeds, strict=True)
+    ]
+    if workers and workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            batches = list(pool.map(_run_batch, tasks))
+    else:
+        batches = [_run_batch(task) for task in tasks]
+    metrics = np.vstack(batches)
+
+    tail = (1.0 - confidence) / 2.0
+    summary = {
+        "bootstrap_samples": float(samples),
+        "bootstrap_block_size": float(block),
+        "bootstrap_confidence": confidence,
+    }
+    for column, name in enumerate(BOOTSTRAP_METRICS):
+        scores = metrics[:, column]
+        scores = scores[~np.isnan(scores)]
+        if len(scores):
+            low, high = np.quantile(scores, [tail, 1.0 - tail])
+            summary[f"{name}_ci_low"] = float(low)
+            summary[f"{name}_ci_high"] = float(high)
+    return summary
+
+
+def with_bootstrap(result: BacktestResult, **kwargs: Any) -> BacktestResult:
+    """Copy of ``result`` with ``bootstrap`` intervals of its returns in ``extra_metrics``.
+
+    Runs that already carry intervals, or have fewer than two returns, are returned unchanged.
+    """
+    if "bootstrap_samples" in result.extra_metrics:
+        return result
+    returns = result.series("returns_series")
+    if returns is None or returns.count() < 2:
+        return result
+    extra_metrics = {**result.extra_metrics, **bootstrap(returns, **kwargs)}
+    return dataclasses.replace(result, extra_metrics=extra_metrics)
+
+
+def block_indices(
+    length: int, samples: int, block_size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """``(samples, length)`` positions of circular block-bootstrap paths."""
+    blocks = -(-length // block_size)
+    starts = rng.integers(0, length, size=(samples, blocks, 1))
+    positions = (starts + np.arange(block_size)) % length
+    return positions.reshape(samples, blocks * block_size)[:, :length]
+
+
+def resample_metrics(paths: np.ndarray, periods: float = 1.0) -> np.ndarray:
+    """Total return, annualized per-period Sharpe ratio and max drawdown of every row."""
+    growth = np.cumprod(1.0 + paths, axis=1)
+    peaks = np.maximum.accumulate(np.maximum(growth, 1.0), axis=1)
+    drawdown = np.max(1.0 - growth / peaks, axis=1)
+    deviation = paths.std(axis=1)
+    sharpe = np.full(len(paths), np.nan)
+    defined = deviation > 0
+    sharpe[defined] = paths[defined].mean(axis=1) / deviation[defined] * np.sqrt(periods)
+    return np.column_stack([growth[:, -1] - 1.0, sharpe, drawdown])
+
+
+def _run_batch(task: _Batch) -> np.ndarray:
+    values, count, block, seed, periods = task
+    rng = np.random.default_rng(seed)
+    return resample_metrics(values[block_indices(len(values), count, block, rng)], periods)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from silkroad.backtesting.engine import BacktestEngine, load_history
+from silkroad.data.shared import SharedHistory, SharedHistoryHandle
+from silkroad.risk.manager import RiskLimits, RiskManager
+
+if TYPE_CHECKING:
+    from silkroad.config.settings import AppConfig, BacktestConfig, DataFeedConfig, StrategyConfig
+    from silkroad.strategy.base import Strategy
+
+
+@dataclass
+class WorkerContext:
+    """History and settings shared by every backtest a sweep worker runs.
+
+    Pool workers get one through ``init_worker``; serial runs build one locally, so nothing
+    leaks into module state. ``cache`` is scratch space for callers such as ``WalkForward``.
+    """
+
+    history: pd.DataFrame
+    strategy_config: StrategyConfig
+    backtest_config: BacktestConfig
+    data_feed_config: DataFeedConfig
+    risk_limits: RiskLimits | None
+    shared: SharedHistory | None = None
+    cache: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def open(
+        cls,
+        history: pd.DataFrame | SharedHistoryHandle,
+        strategy_config: StrategyConfig,
+        backtest_config: BacktestConfig,
+        data_feed_config: DataFeedConfig,
+        risk_limits: RiskLimits | None,
+    ) -> WorkerContext:
+        """Context over ``history``, attaching to it first when given a shared-memory handle."""
+        shared = None
+        if isinstance(history, SharedHistoryHandle):
+            shared = SharedHistory.attach(history)
+            history = shared.frame()
+        return cls(history, strategy_config, backtest_config, data_feed_config, risk_limits, shared)
+
+    def engine(self, strategy: Strategy, history: pd.DataFrame | None = None) -> BacktestEngine:
+        """Backtest ``strategy`` on ``history`` (default: the whole context history)."""
+        return BacktestEngine(
+            strategy=strategy,
+            config=self.backtest_config,
+            data_feed_config=self.data_feed_config,
+            risk_manager=RiskManager(limits=self.risk_limits),
+            history=self.history if history is None else history,
+        )
+
+
+_WORKER_CONTEXT: WorkerContext | None = None
+
+
+def init_worker(
+    history: pd.DataFrame | SharedHistoryHandle,
+    strategy_config: StrategyConfig,
+    backtest_config: BacktestConfig,
+    data_feed_config: DataFeedConfig,
+    risk_limits: RiskLimits | None,
+) -> None:
+    """``ProcessPoolExecutor`` initializer: open this process's ``WorkerContext``."""
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = WorkerContext.open(
+        history, strategy_config, backtest_config, data_feed_config, risk_limits
+    )
+
+
+def worker_context() -> WorkerContext:
+    """The context opened by ``init_worker`` in this worker process."""
+    if _WORKER_CONTEXT is None:
+        raise RuntimeError("init_worker() has not run in this process.")
+    return _WORKER_CONTEXT
+
+
+class ParameterSweep:
+    """Evaluate a registered strategy over a grid or random sample of parameter combinations.
+
+    List-valued entries in ``StrategyConfig.parameters`` define the search space; scalar entries
+    are held fixed. History is loaded once and published to worker processes through shared
+    memory, so each worker attaches to the same pages instead of holding its own copy.
+    """
+
+    def __init__(
+        self,
+        strategy_config: StrategyConfig,
+        backtest_config: BacktestConfig,
+        data_feed_config: DataFeedConfig,
+        risk_limits: RiskLimits | None = None,
+        method: str = "grid",
+        samples: int | None = None,
+        seed: int | None = None,
+        workers: int | None = None,
+        rank_by: str = "sharpe_ratio",
+    ) -> None:
+        if method not in ("grid", "random"):
+            raise ValueError(f"Unsupported sweep method '{method}'.")
+        if data_feed_config.symbols:
+            raise ValueError(
+                "Parameter sweeps run single-symbol backtests; remove 'data.symbols'."
+            )
+        self.strategy_config = strategy_config
+        self.backtest_config = backtest_config
+        self.data_feed_config = data_feed_config
+        self.risk_limits = risk_limits
+        self.method = method
+        self.samples = samples
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.rank_by = rank_by
+
+    @classmethod
+    def from_config(cls, config: AppConfig, **kwargs: Any) -> ParameterSweep:
+        from silkroad.config.settings import BacktestConfig
+
+        risk_limits = None
+        if config.risk:
+            risk_limits = RiskLimits(
+                max_position_fraction=config.risk.max_position_size,
+                max_drawdown=config.risk.max_drawdown,
+                stop_loss_pct=config.risk.stop_loss_pct,
+            )
+        return cls(
+            strategy_config=config.strategy,
+            backtest_config=config.backtest or BacktestConfig.model_validate({}),
+            data_feed_config=config.data,
+            risk_limits=risk_limits,
+            **kwargs,
+        )
+
+    def combinations(self) -> list[dict[str, Any]]:
+        parameters = self.strategy_config.parameters
+        fixed = {key: value for key, value in parameters.items() if not isinstance(value, list)}
+        axes = {key: value for key, value in parameters.items() if isinstance(value, list)}
+        names = list(axes)
+        sizes = [len(axes[name]) for name in names]
+        total = int(np.prod(sizes)) if sizes else 1
+
+        picks: Iterable[int]
+        if self.method == "grid" or self.samples is None or self.samples >= total:
+            picks = range(total)
+        else:
+            rng = np.random.default_rng(self.seed)
+            picks = sorted(rng.choice(total, size=self.samples, replace=False).tolist())
+
+        combinations = []
+        for flat in picks:
+            chosen = {}
+            for name, size in zip(reversed(names), reversed(sizes), strict=True):
+                flat, offset = divmod(flat, size)
+                chosen[name] = axes[name][offset]
+            combinations.append({**fixed, **{name: chosen[name] for name in names}})
+        return combinations
+
+    def run(self) -> pd.DataFrame:
+        """Run every combination and return a table ranked by ``rank_by`` (best first)."""
+        combinations = self.combinations()
+        history = load_history(self.data_feed_config)
+        # Workers only need the symbol; feed parameters may embed the raw data a second time.
+        data_feed_config = self.data_feed_config.model_copy(update={"parameters": {}})
+        settings = (self.strategy_config, self.backtest_config, data_feed_config, self.risk_limits)
+
+        if self.workers <= 1 or len(combinations) <= 1:
+            context = WorkerContext(history, *settings)
+            rows = [run_combination(context, parameters) for parameters in combinations]
+        else:
+            workers = min(self.workers, len(combinations))
+            with SharedHistory.publish(history) as shared:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=init_worker,
+                    initargs=(shared.handle, *settings),
+                ) as pool:
+                    rows = list(pool.map(_run_combination, combinations))
+
+        table = pd.DataFrame(rows)
+        if self.rank_by in table.columns:
+            table = table.sort_values(
+                self.rank_by, ascending=False, na_position="last", kind="stable"
+            )
+        return table.reset_index(drop=True)
+
+
+def run_combination(context: WorkerContext, parameters: dict[str, Any]) -> dict[str, Any]:
+    """Backtest one parameter combination and summarise it as a table row."""
+    engine = context.engine(context.strategy_config.build(**parameters))
+    result = engine.run()
+    row: dict[str, Any] = dict(parameters)
+    row.update(
+        total_return=result.total_return,
+        sharpe_ratio=result.sharpe_ratio,
+        total_trades=result.total_trades,
+        ending_value=result.ending_value,
+        avg_daily_return=result.extra_metrics.get("avg_daily_return"),
+    )
+    return row
+
+
+def _run_combination(parameters: dict[str, Any]) -> dict[str, Any]:
+    return run_combination(worker_context(), parameters)
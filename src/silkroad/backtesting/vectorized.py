@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from silkroad.data.base import HistoryCursor
+from silkroad.strategy.base import SignalBatch, Strategy
+
+
+@dataclass
+class Fill:
+    position: int
+    size: float
+    price: float
+    commission: float
+    column: int = 0
+
+
+@dataclass
+class TargetPercentSimulator:
+    """Stand-in for Backtrader's broker when a strategy trades via target percents.
+
+    Signals and targets arrive as arrays, but the broker itself is a per-bar Python loop over
+    plain lists: each fill depends on the cash and position left by the previous one. Orders
+    sized on bar ``i`` fill at the open of bar ``i + 1`` with percentage commission and slippage
+    capped to the bar's high/low, matching ``order_target_percent`` on a ``BackBroker``.
+    """
+
+    starting_cash: float
+    commission: float = 0.0
+    slippage: float = 0.0
+    cash: float = field(init=False)
+    position: float = field(init=False, default=0.0)
+    pending: float | None = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        self.cash = self.starting_cash
+
+    def run(
+        self,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        targets: np.ndarray,
+    ) -> tuple[np.ndarray, list[Fill]]:
+        """Simulate a block of bars; ``targets`` holds NaN where no order is placed."""
+        return self.simulate(open_, high, low, close, targets.tolist().__getitem__)
+
+    def simulate(
+        self,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        target_at: Callable[[int], float],
+    ) -> tuple[np.ndarray, list[Fill]]:
+        """Broker kernel: ``target_at(i)`` is asked for bar ``i``'s target (NaN for no order)
+        after the bar's pending fill and mark-to-market, so it may depend on earlier fills.
+        ``BarLoop`` drives per-bar strategies through it."""
+        opens, highs, lows, closes = open_.tolist(), high.tolist(), low.tolist(), close.tolist()
+        commission, slippage = self.commission, self.slippage
+        cash, position, pending = self.cash, self.position, self.pending
+        equity: list[float] = []
+        record = equity.append
+        fills: list[Fill] = []
+
+        for i, price in enumerate(closes):
+            if pending is not None:
+                size, pending = pending, None
+                fill_price = _fill_price(size, opens[i], highs[i], lows[i], slippage)
+                cash, size = _execute(cash, position, size, fill_price, commission)
+                if size:
+                    position += size
+                    cost = abs(size) * fill_price * commission
+                    fills.append(Fill(position=i, size=size, price=fill_price, commission=cost))
+
+            value = cash + position * price
+            record(value)
+            target = target_at(i)
+            if target != target:
+                continue
+            size = _order_size(target, position, price, value)
+            if size and cash - size * price - abs(size) * price * commission >= 0.0:
+                pending = size
+
+        self.cash, self.position, self.pending = cash, position, pending
+        return np.asarray(equity, dtype=float), fills
+
+
+@dataclass
+class PortfolioSimulator:
+    """``TargetPercentSimulator`` over one column per symbol, sharing a single cash balance.
+
+    Every column is sized off the same bar-close portfolio value. Like Backtrader's broker, orders
+    are accepted in column order against a running cash balance, and they fill at the next open
+    in that same order. Like ``TargetPercentSimulator`` this is a per-bar loop, with an inner
+    loop over the columns.
+    """
+
+    starting_cash: float
+    commission: float = 0.0
+    slippage: float = 0.0
+
+    def run(
+        self,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        targets: np.ndarray,
+    ) -> tuple[np.ndarray, list[Fill]]:
+        """Simulate ``(bars, symbols)`` arrays; ``targets`` holds NaN where no order is placed."""
+        opens, highs, lows, closes = open_.tolist(), high.tolist(), low.tolist(), close.tolist()
+        target_rows = targets.tolist()
+        commission, slippage = self.commission, self.slippage
+        columns = range(close.shape[1])
+        cash = self.starting_cash
+        positions = [0.0] * close.shape[1]
+        pending: list[float | None] = [None] * close.shape[1]
+        equity: list[float] = [0.0] * len(closes)
+        fills: list[Fill] = []
+
+        for i, prices in enumerate(closes):
+            for j in columns:
+                size = pending[j]
+                if size is None:
+                    continue
+                pending[j] = None
+                fill_price = _fill_price(size, opens[i][j], highs[i][j], lows[i][j], slippage)
+                position = positions[j]
+                cash, size = _execute(cash, position, size, fill_price, commission)
+                if size:
+                    positions[j] = position + size
+                    cost = abs(size) * fill_price * commission
+                    fills.append(
+                        Fill(position=i, size=size, price=fill_price, commission=cost, column=j)
+                    )
+
+            value = cash + sum(held * price for held, price in zip(positions, prices, strict=True))
+            equity[i] = value
+            available = cash
+            for j, target in enumerate(target_rows[i]):
+                if target != target:
+                    continue
+                price = prices[j]
+                size = _order_size(target, positions[j], price, value)
+                if not size:
+                    continue
+                # A rejected order still leaves the running balance negative, as in Backtrader.
+                available -= size * price + abs(size) * price * commission
+                if available >= 0.0:
+                    pending[j] = size
+
+        return np.asarray(equity, dtype=float), fills
+
+
+def _fill_price(size: float, open_: float, high: float, low: float, slippage: float) -> float:
+    """Next-open fill price with percentage slippage capped to the bar's range."""
+    if not slippage:
+        return open_
+    if size > 0:
+        return min(open_ * (1 + slippage), high)
+    return max(open_ * (1 - slippage), low)
+
+
+def _order_size(target: float, position: float, price: float, value: float) -> float:
+    """Whole units ``order_target_percent`` would order to move ``position`` to ``target``."""
+    if not target:
+        return -position
+    held = position * price
+    desired = target * value
+    if desired > held:
+        return float(int((desired - held) // price))
+    if desired < held:
+        return -float(int((held - desired) // price))
+    return 0.0
+
+
+def _execute(
+    cash: float, position: float, size: float, price: float, commission: float
+) -> tuple[float, float]:
+    """Fill an order like ``BackBroker._execute``, returning the new cash and the executed size.
+
+    The part of ``size`` that closes ``position`` always fills; the part opening a new position
+    fills only if cash stays non-negative, so an unaffordable reversal just goes flat.
+    """
+    closed = 0.0
+    if position and (position > 0) != (size > 0):
+        closed = -position if abs(size) > abs(position) else size
+    opened = size - closed
+    cash -= closed * price + abs(closed) * price * commission
+    if opened:
+        remaining = cash - opened * price - abs(opened) * price * commission
+        if remaining < 0.0:
+            return cash, closed
+        cash = remaining
+    return cash, size
+
+
+def collect_signals(strategy: Strategy, frame: pd.DataFrame) -> SignalBatch:
+    """Build a ``SignalBatch`` by replaying ``signal_side`` for strategies without a batch API."""
+    cursor = HistoryCursor.from_frame(frame)
+    signal_side = strategy.signal_side
+    sides = [0] * len(frame)
+    sizes = [0.0] * len(frame)
+    for position in range(len(frame)):
+        cursor.position = position
+        sides[position], sizes[position] = signal_side(cursor)
+    return SignalBatch(sides=np.asarray(sides, dtype=np.int8), sizes=np.asarray(sizes, dtype=float))
+
+
+def target_percents(signals: SignalBatch, allowed: np.ndarray | None = None) -> np.ndarray:
+    """Translate signals into ``order_target_percent`` targets, NaN meaning no order."""
+    targets = np.where(signals.sides != 0, signals.sides * np.minimum(1.0, signals.sizes), np.nan)
+    if allowed is not None:
+        targets[~allowed] = np.nan
+    return targets
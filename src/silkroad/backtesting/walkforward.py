@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+import pandas as pd
+
+from silkroad.backtesting.engine import bootstrap_options, load_history
+from silkroad.backtesting.metrics import annual_sharpe
+from silkroad.backtesting.results import BacktestResult
+from silkroad.backtesting.robustness import with_bootstrap
+from silkroad.backtesting.sweep import ParameterSweep, WorkerContext, init_worker, worker_context
+from silkroad.data.shared import SharedHistory
+from silkroad.risk.manager import RiskLimits
+from silkroad.strategy.base import MarketData, Signal, SignalBatch, Strategy
+
+if TYPE_CHECKING:
+    from silkroad.config.settings import AppConfig, BacktestConfig, DataFeedConfig, StrategyConfig
+
+# (parameters, first bar, end bar) of one backtest on a slice of the history.
+_Task = tuple[dict[str, Any], int, int]
+
+
+class WalkForward:
+    """Walk-forward optimization: tune on rolling train windows, evaluate on the bars after them.
+
+    For each split, every combination from the ``ParameterSweep`` search space is backtested on
+    the train slice; the best one by ``rank_by`` is then run on the following ``test_size`` bars.
+    The out-of-sample runs are compounded into one ``BacktestResult`` and ``report`` holds the
+    per-window choices. Indicators are computed once per combination on the full history and the
+    slices reuse them, so overlapping windows never recompute them and test windows start warm.
+    """
+
+    def __init__(
+        self,
+        strategy_config: StrategyConfig,
+        backtest_config: BacktestConfig,
+        data_feed_config: DataFeedConfig,
+        train_size: int,
+        test_size: int,
+        step: int | None = None,
+        anchored: bool = False,
+        risk_limits: RiskLimits | None = None,
+        method: str = "grid",
+        samples: int | None = None,
+        seed: int | None = None,
+        workers: int | None = None,
+        rank_by: str = "total_return",
+    ) -> None:
+        if train_size <= 0 or test_size <= 0:
+            raise ValueError("Walk-forward train_size and test_size must be positive.")
+        if step is not None and step < test_size:
+            # Overlapping test windows would count the shared bars twice when stitched.
+            raise ValueError(
+                f"Walk-forward step ({step}) must be at least test_size ({test_size})."
+            )
+        self.sweep = ParameterSweep(
+            strategy_config,
+            backtest_config,
+            data_feed_config,
+            risk_limits=risk_limits,
+            method=method,
+            samples=samples,
+            seed=seed,
+            workers=workers,
+            rank_by=rank_by,
+        )
+        self.train_size = train_size
+        self.test_size = test_size
+        self.step = step or test_size
+        self.anchored = anchored
+        self.report: pd.DataFrame | None = None
+
+    @classmethod
+    def from_config(cls, config: AppConfig, **kwargs: Any) -> WalkForward:
+        sweep = ParameterSweep.from_config(config)
+        return cls(
+            strategy_config=sweep.strategy_config,
+            backtest_config=sweep.backtest_config,
+            data_feed_config=sweep.data_feed_config,
+            risk_limits=sweep.risk_limits,
+            **kwargs,
+        )
+
+    def splits(self, length: int) -> list[tuple[range, range]]:
+        """Train/test bar ranges; train windows roll (or grow, if ``anchored``) by ``step``."""
+        splits = []
+        start = 0
+        while start + self.train_size + self.test_size <= length:
+            train_end = start + self.train_size
+            train = range(0 if self.anchored else start, train_end)
+            splits.append((train, range(train_end, train_end + self.test_size)))
+            start += self.step
+        if not splits:
+            raise ValueError(
+                f"History of {length} bars is too short for train_size={self.train_size} and "
+                f"test_size={self.test_size}."
+            )
+        return splits
+
+    def run(self) -> BacktestResult:
+        history = load_history(self.sweep.data_feed_config)
+        history = history[~history.index.duplicated(keep="last")]
+        splits = self.splits(len(history))
+        combinations = self.sweep.combinations()
+        data_feed_config = self.sweep.data_feed_config.model_copy(update={"parameters": {}})
+        # Only the stitched out-of-sample result is bootstrapped, not every slice.
+        backtest_config = self.sweep.backtest_config.model_copy(update={"bootstrap_samples": 0})
+        settings = (
+            self.sweep.strategy_config,
+            backtest_config,
+            data_feed_config,
+            self.sweep.risk_limits,
+        )
+        # Tasks are grouped by combination so a worker prepares each combination's frame once.
+        train_tasks = [
+            (parameters, train.start, train.stop)
+            for parameters in combinations
+            for train, _ in splits
+        ]
+
+        if self.sweep.workers <= 1:
+            context = WorkerContext(history, *settings)
+            train_results = [run_slice(context, task) for task in train_tasks]
+            best = self._select(splits, combinations, train_results)
+            test_tasks = self._test_tasks(splits, combinations, best)
+            test_results = [run_slice(context, task) for task in test_tasks]
+        else:
+            with SharedHistory.publish(history) as shared:
+                with ProcessPoolExecutor(
+                    max_workers=min(self.sweep.workers, len(train_tasks)),
+                    initializer=init_worker,
+                    initargs=(shared.handle, *settings),
+                ) as pool:
+                    train_results = list(
+                        pool.map(_run_slice, train_tasks, chunksize=len(splits))
+                    )
+                    best = self._select(splits, combinations, train_results)
+                    test_tasks = self._test_tasks(splits, combinations, best)
+                    test_results = list(pool.map(_run_slice, test_tasks))
+
+        self.report = self._report(
+            history.index, splits, combinations, best, train_results, test_results
+        )
+        return self._stitch(history, splits, test_results)
+
+    def _select(
+        self,
+        splits: list[tuple[range, range]],
+        combinations: list[dict[str, Any]],
+        train_results: list[BacktestResult],
+    ) -> list[int]:
+        """Index of the best train result for every split (first combination on ties or NaN)."""
+        best = []
+        for window in range(len(splits)):
+            scores = pd.Series(
+                [
+                    _metric(train_results[combo * len(splits) + window], self.sweep.rank_by)
+                    for combo in range(len(combinations))
+                ],
+                dtype=float,
+            )
+            combo = int(scores.idxmax()) if scores.notna().any() else 0
+            best.append(combo * len(splits) + window)
+        return best
+
+    def _test_tasks(
+        self,
+        splits: list[tuple[range, range]],
+        combinations: list[dict[str, Any]],
+        best: list[int],
+    ) -> list[_Task]:
+        return [
+            (combinations[index // len(splits)], test.start, test.stop)
+            for index, (_, test) in zip(best, splits, strict=True)
+        ]
+
+    def _report(
+        self,
+        index: pd.DatetimeIndex,
+        splits: list[tuple[range, range]],
+        combinations: list[dict[str, Any]],
+        best: list[int],
+        train_results: list[BacktestResult],
+        test_results: list[BacktestResult],
+    ) -> pd.DataFrame:
+        rows = []
+        for window, ((train, test), chosen, result) in enumerate(
+            zip(splits, best, test_results, strict=True)
+        ):
+            row: dict[str, Any] = {
+                "window": window,
+                "train_start": index[train.start],
+                "train_end": index[train.stop - 1],
+                "test_start": index[test.start],
+                "test_end": index[test.stop - 1],
+            }
+            row.update(combinations[chosen // len(splits)])
+            row[f"train_{self.sweep.rank_by}"] = _metric(train_results[chosen], self.sweep.rank_by)
+            row.update(test_total_return=result.total_return, test_total_trades=result.total_trades)
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+    def _stitch(
+        self,
+        history: pd.DataFrame,
+        splits: list[tuple[range, range]],
+        test_results: list[BacktestResult],
+    ) -> BacktestResult:
+        starting_cash = self.sweep.backtest_config.starting_cash
+        pieces = [r.returns_series for r in test_results if r.returns_series is not None]
+        returns_series = None
+        equity_curve = None
+        sharpe_ratio = None
+        extra_metrics: dict[str, float] = {"windows": float(len(splits))}
+        if pieces:
+            # Adjacent windows can share a calendar day; compound those returns into one.
+            growth = (1 + pd.concat(pieces)).groupby(level=0).prod()
+            returns_series = growth - 1
+            equity_curve = growth.cumprod() * starting_cash
+            sharpe_ratio = annual_sharpe(equity_curve, starting_cash)
+            extra_metrics["avg_daily_return"] = float(returns_series.mean())
+        ending_value = starting_cash
+        for result in test_results:
+            ending_value *= result.ending_value / result.starting_cash
+
+        first, last = splits[0][1].start, splits[-1][1].stop
+        price_series = history["close"].iloc[first:last].copy()
+        try:
+            price_series.index = price_series.index.tz_localize(None)
+        except TypeError:
+            pass
+        result = BacktestResult(
+            strategy_name=test_results[0].strategy_name,
+            starting_cash=starting_cash,
+            ending_value=ending_value,
+            total_return=ending_value / starting_cash - 1,
+            total_trades=sum(result.total_trades for result in test_results),
+            sharpe_ratio=sharpe_ratio,
+            run_id=uuid4().hex,
+            completed_at=pd.Timestamp.now(tz="UTC").to_pydatetime(),
+            extra_metrics=extra_metrics,
+            price_series=price_series,
+            equity_curve=equity_curve,
+            returns_series=returns_series,
+        )
+        config = self.sweep.backtest_config
+        if config.bootstrap_samples:
+            result = with_bootstrap(result, **bootstrap_options(config))
+        return result
+
+
+class _PreparedStrategy(Strategy):
+    """Wraps a strategy whose indicator columns were computed on the full history."""
+
+    def __init__(self, strategy: Strategy) -> None:
+        self.strategy = strategy
+        self.name = strategy.name
+
+    def prepare(self, data: pd.DataFrame) -> None:
+        pass
+
+    def generate_signal(self, data: MarketData) -> Signal:
+        return self.strategy.generate_signal(data)
+
+    def generate_signals(self, data: pd.DataFrame) -> SignalBatch | None:
+        return self.strategy.generate_signals(data)
+
+
+def _metric(result: BacktestResult, name: str) -> float:
+    value = getattr(result, name, None)
+    if value is None:
+        value = result.extra_metrics.get(name)
+    return float("nan") if value is None else float(value)
+
+
+def _prepared(context: WorkerContext, parameters: dict[str, Any]) -> tuple[Strategy, pd.DataFrame]:
+    """Strategy and full prepared history for ``parameters``, reused by consecutive tasks."""
+    key = tuple(sorted(parameters.items()))
+    cached = context.cache.get("prepared")
+    if cached is None or cached[0] != key:
+        strategy = context.strategy_config.build(**parameters)
+        frame = context.history.copy(deep=False)
+        strategy.prepare(frame)
+        cached = (key, strategy, frame)
+        context.cache["prepared"] = cached
+    return cached[1], cached[2]
+
+
+def run_slice(context: WorkerContext, task: _Task) -> BacktestResult:
+    """Backtest one combination on bars ``[start, stop)`` of the context history."""
+    parameters, start, stop = task
+    strategy, frame = _prepared(context, parameters)
+    return context.engine(_PreparedStrategy(strategy), frame.iloc[start:stop]).run()
+
+
+def _run_slice(task: _Task) -> BacktestResult:
+    return run_slice(worker_context(), task)
@@ -3,10 +3,16 @@ from __future__ import annotations
 import click
 
 from silkroad.app import SilkRoadApp
+from silkroad.backtesting.robustness import BOOTSTRAP_METRICS
+from silkroad.backtesting.sweep import ParameterSweep
+from silkroad.backtesting.walkforward import WalkForward
+from silkroad.config.settings import load_config
 
 
 @click.group()
-@click.option("--config", "-c", type=click.Path(exists=True), required=True, help="Path to YAML config file.")
+@click.option(
+    "--config", "-c", type=click.Path(exists=True), required=True, help="Path to YAML config file."
+)
 @click.pass_context
 def app(ctx: click.Context, config: str) -> None:
     """SilkRoad trading bot CLI."""
@@ -21,10 +27,127 @@ def backtest(ctx: click.Context) -> None:
     silkroad = SilkRoadApp.from_file(config_path)
     result = silkroad.run_backtest()
     click.echo(
-        f"Backtest complete | strategy={result.strategy_name} | total_return={result.total_return:.2%} "
+        f"Backtest complete | strategy={result.strategy_name} "
+        f"| total_return={result.total_return:.2%} "
         f"| sharpe={result.sharpe_ratio if result.sharpe_ratio is not None else 'n/a'} "
         f"| trades={result.total_trades}"
     )
+    metrics = result.extra_metrics
+    if "bootstrap_samples" in metrics:
+        intervals = " ".join(
+            f"| {name}=[{metrics[f'{name}_ci_low']:.4g}, {metrics[f'{name}_ci_high']:.4g}]"
+            for name in BOOTSTRAP_METRICS
+            if f"{name}_ci_low" in metrics
+        )
+        click.echo(
+            f"Bootstrap {metrics['bootstrap_confidence']:.0%} intervals over "
+            f"{metrics['bootstrap_samples']:.0f} paths {intervals}"
+        )
+
+
+@app.command()
+@click.option("--method", type=click.Choice(["grid", "random"]), default="grid", show_default=True)
+@click.option(
+    "--samples", type=int, default=None, help="Number of combinations drawn for random search."
+)
+@click.option("--seed", type=int, default=None, help="Random seed for random search.")
+@click.option("--workers", type=int, default=None, help="Worker processes (defaults to CPU count).")
+@click.option(
+    "--rank-by", default="sharpe_ratio", show_default=True, help="Metric used to rank runs."
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write the table as CSV.",
+)
+@click.pass_context
+def sweep(
+    ctx: click.Context,
+    method: str,
+    samples: int | None,
+    seed: int | None,
+    workers: int | None,
+    rank_by: str,
+    output: str | None,
+) -> None:
+    """Backtest every combination of list-valued strategy parameters."""
+    config = load_config(ctx.obj["config_path"])
+    runner = ParameterSweep.from_config(
+        config, method=method, samples=samples, seed=seed, workers=workers, rank_by=rank_by
+    )
+    table = runner.run()
+    click.echo(table.to_string(index=False))
+    if output:
+        table.to_csv(output, index=False)
+        click.echo(f"Sweep results written to {output}")
+
+
+@app.command(name="walk-forward")
+@click.option("--train", "train_size", type=int, required=True, help="Bars in each train window.")
+@click.option("--test", "test_size", type=int, required=True, help="Bars in each test window.")
+@click.option(
+    "--step",
+    type=int,
+    default=None,
+    help="Bars between windows; at least --test (the default) so test windows never overlap.",
+)
+@click.option("--anchored", is_flag=True, help="Grow train windows from the first bar.")
+@click.option("--method", type=click.Choice(["grid", "random"]), default="grid", show_default=True)
+@click.option(
+    "--samples", type=int, default=None, help="Number of combinations drawn for random search."
+)
+@click.option("--seed", type=int, default=None, help="Random seed for random search.")
+@click.option("--workers", type=int, default=None, help="Worker processes (defaults to CPU count).")
+@click.option(
+    "--rank-by", default="total_return", show_default=True, help="Metric used to pick parameters."
+)
+@click.option(
+    "--output", "-o", type=click.Path(dir_okay=False), default=None, help="Write windows as CSV."
+)
+@click.pass_context
+def walk_forward(
+    ctx: click.Context,
+    train_size: int,
+    test_size: int,
+    step: int | None,
+    anchored: bool,
+    method: str,
+    samples: int | None,
+    seed: int | None,
+    workers: int | None,
+    rank_by: str,
+    output: str | None,
+) -> None:
+    """Optimize on rolling train windows and report the stitched out-of-sample result."""
+    if step is not None and step < test_size:
+        raise click.BadParameter(f"must be at least --test ({test_size}).", param_hint="--step")
+    config = load_config(ctx.obj["config_path"])
+    runner = WalkForward.from_config(
+        config,
+        train_size=train_size,
+        test_size=test_size,
+        step=step,
+        anchored=anchored,
+        method=method,
+        samples=samples,
+        seed=seed,
+        workers=workers,
+        rank_by=rank_by,
+    )
+    result = runner.run()
+    if runner.report is None:
+        raise click.ClickException("The walk-forward run produced no fold report.")
+    click.echo(runner.report.to_string(index=False))
+    click.echo(
+        f"Out-of-sample | strategy={result.strategy_name} | total_return={result.total_return:.2%} "
+        f"| sharpe={result.sharpe_ratio if result.sharpe_ratio is not None else 'n/a'} "
+        f"| trades={result.total_trades}"
+    )
+    if output:
+        runner.report.to_csv(output, index=False)
+        click.echo(f"Walk-forward windows written to {output}")
 
 
 @app.command()
@@ -1,30 +1,45 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field, ValidationError
 
-from silkroad.strategy.base import Strategy
-from silkroad.execution.base import ExecutionEngine
+from silkroad.analytics import (
+    AnalyticsSink,
+    AnalyticsStore,
+    AsyncAnalyticsStore,
+    ParquetAnalyticsStore,
+)
 from silkroad.backtesting.engine import BacktestEngine
-from silkroad.analytics import AnalyticsStore
+from silkroad.execution.base import ExecutionEngine
 from silkroad.risk.manager import RiskManager
+from silkroad.strategy.base import Strategy
 
 
 class DataFeedConfig(BaseModel):
     source: str = Field(..., description="Identifier for the data source (e.g., 'ccxt:binance').")
     symbol: str = Field(..., description="Trading symbol, such as 'BTC/USDT'.")
+    symbols: list[str] = Field(
+        default_factory=list,
+        description="Symbols followed together in portfolio mode (e.g., 'paper_portfolio').",
+    )
     interval: str = Field("1h", description="Data aggregation interval.")
     lookback: int = Field(365, description="Number of data points to load.")
-    poll_interval: float = Field(15.0, description="Seconds between polling updates for streaming feeds.")
-    parameters: Dict[str, Any] = Field(default_factory=dict, description="Additional feed-specific options.")
+    poll_interval: float = Field(
+        15.0, description="Seconds between polling updates for streaming feeds."
+    )
+    parameters: dict[str, Any] = Field(
+        default_factory=dict, description="Additional feed-specific options."
+    )
 
 
 class StrategyConfig(BaseModel):
     name: str = Field(..., description="Strategy identifier registered in STRATEGY_REGISTRY.")
-    parameters: Dict[str, Any] = Field(default_factory=dict, description="Strategy-specific settings.")
+    parameters: dict[str, Any] = Field(
+        default_factory=dict, description="Strategy-specific settings."
+    )
 
     def build(self, **overrides: Any) -> Strategy:
         from silkroad.strategy.registry import STRATEGY_REGISTRY
@@ -38,7 +53,7 @@ class StrategyConfig(BaseModel):
 
 class ExecutionConfig(BaseModel):
     name: str = Field(..., description="Execution engine identifier.")
-    parameters: Dict[str, Any] = Field(default_factory=dict)
+    parameters: dict[str, Any] = Field(default_factory=dict)
 
     def build(self, **overrides: Any) -> ExecutionEngine:
         from silkroad.execution.registry import EXECUTION_REGISTRY
@@ -54,14 +69,38 @@ class BacktestConfig(BaseModel):
     enabled: bool = Field(True)
     starting_cash: float = Field(10_000.0)
     commission: float = Field(0.001)
-    slippage: float = Field(0.0, description="Fractional slippage applied to fills during backtests.")
+    slippage: float = Field(
+        0.0, description="Fractional slippage applied to fills during backtests."
+    )
+    engine: str = Field(
+        "backtrader",
+        description="Registered executor: 'backtrader', 'vectorized', 'barloop' or a custom one.",
+    )
+    cache_dir: str | None = Field(
+        None, description="Directory of cached results keyed by history, parameters and code."
+    )
+    cache_entries: int = Field(128, description="Cached results kept before evicting the oldest.")
+    chunk_size: int | None = Field(
+        None, description="Stream the history in blocks of this many bars (vectorized engine only)."
+    )
+    bootstrap_samples: int = Field(
+        0, description="Block-bootstrap paths used for confidence intervals (0 disables)."
+    )
+    bootstrap_block: int | None = Field(
+        None, description="Returns per bootstrap block; defaults to the cube root of the length."
+    )
+    bootstrap_confidence: float = Field(0.95, description="Confidence level of the intervals.")
+    bootstrap_seed: int | None = Field(None, description="Seed for reproducible intervals.")
+    bootstrap_workers: int | None = Field(
+        None, description="Processes for bootstrap batches; by default they run in-process."
+    )
 
     def build(
         self,
         strategy: Strategy,
         data_feed_config: DataFeedConfig,
         risk_manager: RiskManager | None,
-        analytics: AnalyticsStore | None = None,
+        analytics: AnalyticsSink | None = None,
     ) -> BacktestEngine:
         return BacktestEngine(
             strategy=strategy,
@@ -80,24 +119,73 @@ class RiskConfig(BaseModel):
 
 class MonitoringConfig(BaseModel):
     enabled: bool = Field(True)
-    channels: Dict[str, Any] = Field(default_factory=dict, description="Notification integrations.")
+    channels: dict[str, Any] = Field(default_factory=dict, description="Notification integrations.")
 
 
 class AnalyticsConfig(BaseModel):
     enabled: bool = Field(True)
-    backend: str = Field("sqlite", description="Analytics backend identifier (e.g., 'sqlite').")
-    database: str = Field("analytics/silkroad.db", description="Database path for analytics store.")
+    backend: str = Field("sqlite", description="Analytics backend: 'sqlite' or 'parquet'.")
+    database: str = Field(
+        "analytics/silkroad.db",
+        description="SQLite database path, or the dataset directory for the parquet backend.",
+    )
+    buffer_size: int = Field(
+        0, description="Records buffered before one batched write (0 = write each immediately)."
+    )
+    flush_interval: float | None = Field(
+        None, description="Also flush buffered records once this many seconds have passed."
+    )
+    writer: str = Field(
+        "sync", description="'sync' writes on the caller's thread, 'background' on a writer thread."
+    )
+    queue_size: int = Field(10_000, description="Bounded queue length for the background writer.")
+    overflow: str = Field(
+        "block", description="Full-queue policy: 'block', 'drop_newest' or 'drop_oldest'."
+    )
+
+    def build(self) -> AnalyticsSink:
+        if self.backend == "sqlite":
+            def open_store() -> AnalyticsStore | ParquetAnalyticsStore:
+                return AnalyticsStore(
+                    self.database, buffer_size=self.buffer_size, flush_interval=self.flush_interval
+                )
+        elif self.backend == "parquet":
+            def open_store() -> AnalyticsStore | ParquetAnalyticsStore:
+                options: dict[str, Any] = {}
+                if self.buffer_size:
+                    options["buffer_size"] = self.buffer_size
+                if self.flush_interval is not None:
+                    options["flush_interval"] = self.flush_interval
+                return ParquetAnalyticsStore(self.database, **options)
+        else:
+            raise ValueError(f"Unsupported analytics backend '{self.backend}'.")
+
+        if self.writer == "background":
+            return AsyncAnalyticsStore(
+                self.database,
+                queue_size=self.queue_size,
+                overflow=self.overflow,
+                store_factory=open_store,
+                # Parquet batches into files itself; flushing whenever the queue drains would
+                # write many tiny files.
+                flush_on_drain=self.backend == "sqlite",
+            )
+        if self.writer != "sync":
+            raise ValueError(f"Unsupported analytics writer '{self.writer}'.")
+        return open_store()
 
 
 class AppConfig(BaseModel):
-    environment: str = Field("development", description="Either 'development', 'paper', or 'production'.")
+    environment: str = Field(
+        "development", description="Either 'development', 'paper', or 'production'."
+    )
     data: DataFeedConfig
     strategy: StrategyConfig
     execution: ExecutionConfig
-    backtest: Optional[BacktestConfig] = Field(None)
-    risk: Optional[RiskConfig] = Field(None)
-    monitoring: Optional[MonitoringConfig] = Field(None)
-    analytics: Optional[AnalyticsConfig] = Field(None)
+    backtest: BacktestConfig | None = Field(None)
+    risk: RiskConfig | None = Field(None)
+    monitoring: MonitoringConfig | None = Field(None)
+    analytics: AnalyticsConfig | None = Field(None)
 
 
 def load_config(path: str | Path) -> AppConfig:
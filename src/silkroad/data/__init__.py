@@ -1,8 +1,27 @@
 "Data feed abstractions."
 
-from .base import MarketDataFeed, MarketSnapshot
+from .async_ccxt_feed import AsyncCCXTFeed
+from .base import AsyncMarketDataFeed, HistoryCursor, MarketDataFeed, MarketSnapshot
+from .cache import OHLCVCache
 from .ccxt_feed import CCXTFeed
-from .factory import build_data_feed
-from .static_feed import StaticFeed
+from .factory import build_async_data_feed, build_data_feed
+from .ring import OHLCVRingBuffer
+from .shared import SharedHistory, SharedHistoryHandle
+from .static_feed import AsyncStaticFeed, StaticFeed
 
-__all__ = ["MarketDataFeed", "MarketSnapshot", "CCXTFeed", "StaticFeed", "build_data_feed"]
+__all__ = [
+    "MarketDataFeed",
+    "MarketSnapshot",
+    "AsyncMarketDataFeed",
+    "HistoryCursor",
+    "CCXTFeed",
+    "AsyncCCXTFeed",
+    "StaticFeed",
+    "AsyncStaticFeed",
+    "OHLCVCache",
+    "OHLCVRingBuffer",
+    "SharedHistory",
+    "SharedHistoryHandle",
+    "build_data_feed",
+    "build_async_data_feed",
+]
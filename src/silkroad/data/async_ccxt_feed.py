@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Protocol
+
+import ccxt  # type: ignore
+import ccxt.async_support as ccxt_async  # type: ignore
+import pandas as pd
+
+from silkroad.data.base import AsyncMarketDataFeed, MarketSnapshot
+from silkroad.data.ccxt_feed import CCXTFeed
+from silkroad.data.download import RateLimiter
+from silkroad.data.ring import OHLCVRingBuffer
+
+CandleUpdate = tuple[str, list[list[float]]]
+
+logger = logging.getLogger(__name__)
+
+
+class CandleSource(Protocol):
+    """Push source of ccxt-style ``[ms, open, high, low, close, volume]`` rows for many symbols."""
+
+    def candles(self, symbols: Sequence[str], interval: str) -> AsyncIterator[CandleUpdate]: ...
+
+    async def close(self) -> None: ...
+
+
+class PollingCandleSource:
+    """Polls ``fetch_ohlcv`` for every symbol concurrently and yields each answer as it arrives."""
+
+    def __init__(self, client: Any, poll_interval: float = 5.0) -> None:
+        self.client = client
+        self.poll_interval = poll_interval
+
+    async def candles(self, symbols: Sequence[str], interval: str) -> AsyncIterator[CandleUpdate]:
+        async def fetch(symbol: str) -> CandleUpdate | None:
+            try:
+                return symbol, await self.client.fetch_ohlcv(symbol, timeframe=interval, limit=2)
+            except Exception:  # one failing symbol must not stall the others
+                logger.warning("Polling %s candles failed", symbol, exc_info=True)
+                return None
+
+        while True:
+            for pending in asyncio.as_completed([fetch(symbol) for symbol in symbols]):
+                update = await pending
+                if update is not None:
+                    yield update
+            await asyncio.sleep(self.poll_interval)
+
+    async def close(self) -> None:
+        return None
+
+
+class WatchCandleSource:
+    """Websocket source driving one ``watch_ohlcv`` loop per symbol (ccxt.pro or a stand-in).
+
+    A failing watch is logged and retried with exponential backoff from ``retry_delay`` up to
+    ``max_retry_delay`` seconds; after ``max_failures`` failures in a row the error is raised
+    from ``candles`` instead of leaving that symbol silently stale.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        queue_size: int = 1024,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+        max_failures: int = 10,
+    ) -> None:
+        self.client = client
+        self.queue_size = queue_size
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_failures = max_failures
+        self._tasks: list[asyncio.Task] = []
+
+    async def candles(self, symbols: Sequence[str], interval: str) -> AsyncIterator[CandleUpdate]:
+        queue: asyncio.Queue[CandleUpdate | Exception] = asyncio.Queue(maxsize=self.queue_size)
+
+        async def watch(symbol: str) -> None:
+            failures = 0
+            while True:
+                try:
+                    rows = await self.client.watch_ohlcv(symbol, interval)
+                except Exception as exc:
+                    failures += 1
+                    if failures >= self.max_failures:
+                        logger.error("Watching %s candles failed %d times", symbol, failures)
+                        await queue.put(exc)
+                        return
+                    delay = min(self.retry_delay * 2 ** (failures - 1), self.max_retry_delay)
+                    logger.warning(
+                        "Watching %s candles failed; retrying in %.1fs",
+                        symbol,
+                        delay,
+                        exc_info=True,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                failures = 0
+                await queue.put((symbol, rows[-2:]))
+
+        self._tasks = [asyncio.create_task(watch(symbol)) for symbol in symbols]
+        try:
+            while True:
+                item = await queue.get()
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+class AsyncCCXTFeed(AsyncMarketDataFeed):
+    """Multi-symbol CCXT feed built on ``ccxt.async_support`` with a pluggable candle source.
+
+    History goes through ``CCXTFeed`` on a worker thread, with a synchronous ``history_client``,
+    so it is paginated past ``page_limit`` and served from the ``cache_dir`` OHLCV cache exactly
+    like single-symbol runs. Every symbol's history requests share one ``RateLimiter``, so loading
+    many symbols at once still stays within the client's ``rateLimit``.
+    """
+
+    def __init__(
+        self,
+        exchange_id: str,
+        symbols: list[str],
+        interval: str,
+        lookback: int,
+        poll_interval: float = 5.0,
+        source: CandleSource | None = None,
+        client: Any = None,
+        cache_dir: str | None = None,
+        page_limit: int = 500,
+        max_concurrency: int = 4,
+        history_client: Any = None,
+        **client_kwargs: Any,
+    ) -> None:
+        super().__init__(symbols=symbols, interval=interval, lookback=lookback)
+        if client is None or history_client is None:
+            try:
+                async_cls = getattr(ccxt_async, exchange_id)
+                sync_cls = getattr(ccxt, exchange_id)
+            except AttributeError as exc:
+                raise ValueError(f"Exchange '{exchange_id}' is not supported by ccxt.") from exc
+            if client is None:
+                client = async_cls(**client_kwargs)
+            if history_client is None:
+                history_client = sync_cls(**client_kwargs)
+        self.exchange_id = exchange_id
+        self.client = client
+        self.history_client = history_client
+        self.cache_dir = cache_dir
+        self.page_limit = page_limit
+        self.max_concurrency = max_concurrency
+        self.history_limiter = RateLimiter.for_client(history_client)
+        self.source: CandleSource = source or PollingCandleSource(
+            client, poll_interval=poll_interval
+        )
+        self._buffers: dict[str, OHLCVRingBuffer] = {}
+
+    async def load_history(self, symbol: str) -> pd.DataFrame:
+        feed = CCXTFeed(
+            self.exchange_id,
+            symbol,
+            self.interval,
+            self.lookback,
+            cache_dir=self.cache_dir,
+            page_limit=self.page_limit,
+            max_concurrency=self.max_concurrency,
+            client=self.history_client,
+            limiter=self.history_limiter,
+        )
+        return await asyncio.to_thread(feed.load_history)
+
+    async def stream(self) -> AsyncIterator[tuple[str, MarketSnapshot]]:
+        histories = await asyncio.gather(*(self.load_history(symbol) for symbol in self.symbols))
+        for symbol, history in zip(self.symbols, histories, strict=True):
+            self._buffers[symbol] = OHLCVRingBuffer.from_frame(history, capacity=self.lookback)
+            yield symbol, self._buffers[symbol].snapshot()
+
+        async for symbol, rows in self.source.candles(self.symbols, self.interval):
+            buffer = self._buffers.get(symbol)
+            if buffer is None:
+                continue
+            buffer.extend_ohlcv(rows)
+            yield symbol, buffer.snapshot()
+
+    async def close(self) -> None:
+        await self.source.close()
+        close = getattr(self.client, "close", None)
+        if close is not None:
+            await close()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -16,6 +18,81 @@ class MarketSnapshot:
     def history(self) -> pd.DataFrame:
         return self._history
 
+    def latest(self, column: str) -> Any:
+        """Return the most recent value of ``column`` or ``None`` when it is unavailable."""
+        if column not in self._history.columns or self._history.empty:
+            return None
+        return self._history[column].iloc[-1]
+
+    def timestamp(self) -> Any:
+        """Return the index label of the most recent bar."""
+        return self._history.index[-1]
+
+
+class HistoryCursor(MarketSnapshot):
+    """Snapshot backed by prebuilt column arrays and an integer bar position.
+
+    The cursor is advanced in place, so a backtest reuses a single object for every bar.
+    Column access returns zero-copy views and the pandas window is only built on demand.
+    """
+
+    def __init__(
+        self,
+        index: pd.Index | np.ndarray,
+        columns: Mapping[str, np.ndarray],
+        position: int = -1,
+    ) -> None:
+        self._index = index
+        self.columns: dict[str, np.ndarray] = dict(columns)
+        self.position = position
+        self._frame: pd.DataFrame | None = None
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, position: int = -1) -> HistoryCursor:
+        columns = {str(name): frame[name].to_numpy() for name in frame.columns}
+        cursor = cls(frame.index, columns, position=position)
+        cursor._frame = frame
+        return cursor
+
+    def __len__(self) -> int:
+        return self.position + 1
+
+    @property
+    def index(self) -> pd.Index:
+        """The bar index; raw int64 arrays are read as UTC epoch nanoseconds on first use."""
+        if not isinstance(self._index, pd.Index):
+            self._index = pd.DatetimeIndex(self._index.view("datetime64[ns]")).tz_localize("UTC")
+        return self._index
+
+    @property
+    def _history(self) -> pd.DataFrame:  # type: ignore[override]
+        return self.history()
+
+    def history(self) -> pd.DataFrame:
+        if self._frame is None:
+            self._frame = pd.DataFrame(self.columns, index=self.index, copy=False)
+        return self._frame.iloc[: self.position + 1]
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a view over ``name`` up to and including the current bar."""
+        return self.columns[name][: self.position + 1]
+
+    def times(self) -> np.ndarray:
+        """Bar times up to and including the current bar, as epoch nanoseconds when datetime."""
+        index = self._index
+        if isinstance(index, pd.DatetimeIndex):
+            index = index.as_unit("ns").asi8
+        return np.asarray(index)[: self.position + 1]
+
+    def latest(self, column: str) -> Any:
+        values = self.columns.get(column)
+        if values is None or self.position < 0:
+            return None
+        return values[self.position]
+
+    def timestamp(self) -> pd.Timestamp:
+        return self.index[self.position]
+
 
 class MarketDataFeed(ABC):
     symbol: str
@@ -34,3 +111,38 @@ class MarketDataFeed(ABC):
     @abstractmethod
     def stream(self) -> Iterable[MarketSnapshot]:
         """Yield new market snapshots in chronological order."""
+
+    def iter_history(self, block_size: int) -> Iterator[pd.DataFrame]:
+        """Yield the history in chronological blocks of at most ``block_size`` bars.
+
+        The default slices ``load_history``; feeds that read from disk override it so only one
+        block is resident at a time.
+        """
+        history = self.load_history()
+        for start in range(0, len(history), block_size):
+            yield history.iloc[start : start + block_size]
+
+
+class AsyncMarketDataFeed(ABC):
+    """Asyncio counterpart of ``MarketDataFeed`` that follows many symbols on one event loop."""
+
+    symbols: list[str]
+    interval: str
+    lookback: int
+
+    def __init__(self, symbols: list[str], interval: str, lookback: int) -> None:
+        self.symbols = list(symbols)
+        self.interval = interval
+        self.lookback = lookback
+
+    @abstractmethod
+    async def load_history(self, symbol: str) -> pd.DataFrame:
+        """Return a DataFrame with historical OHLCV data for ``symbol``."""
+
+    @abstractmethod
+    def stream(self) -> AsyncIterator[tuple[str, MarketSnapshot]]:
+        """Yield ``(symbol, snapshot)`` pairs as soon as any symbol's candles update."""
+
+    async def close(self) -> None:
+        """Release network resources held by the feed."""
+        return None
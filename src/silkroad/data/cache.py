@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+
+
+def ohlcv_frame(rows: Sequence[Sequence[float]] | np.ndarray) -> pd.DataFrame:
+    """Convert ccxt-style ``[ms, open, high, low, close, volume]`` rows into an indexed frame."""
+    data = pd.DataFrame(np.asarray(rows, dtype=float).reshape(-1, 6), columns=OHLCV_COLUMNS)
+    data["timestamp"] = pd.to_datetime(data["timestamp"].astype("int64"), unit="ms", utc=True)
+    data.set_index("timestamp", inplace=True)
+    data.sort_index(inplace=True)
+    return data
+
+
+class OHLCVCache:
+    """Memory-mapped NumPy store of OHLCV bars keyed by exchange, symbol and interval.
+
+    Each key is a single ``(n, 6)`` float64 ``.npy`` file sorted by timestamp. Writes go to a
+    temporary file that atomically replaces the previous one, so readers never see partial data.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def path(self, exchange: str, symbol: str, interval: str) -> Path:
+        safe_symbol = re.sub(r"[^A-Za-z0-9_.-]", "-", symbol)
+        return self.root / exchange / safe_symbol / f"{interval}.npy"
+
+    def load(self, exchange: str, symbol: str, interval: str) -> np.ndarray | None:
+        path = self.path(exchange, symbol, interval)
+        if not path.exists():
+            return None
+        return np.load(path, mmap_mode="r")
+
+    def store(self, exchange: str, symbol: str, interval: str, rows: np.ndarray) -> None:
+        path = self.path(exchange, symbol, interval)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                np.save(fh, np.ascontiguousarray(rows, dtype=float))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def update(
+        self,
+        exchange: str,
+        symbol: str,
+        interval: str,
+        rows: Sequence[Sequence[float]] | np.ndarray,
+    ) -> np.ndarray:
+        """Merge ``rows`` into the cached bars (new values win on equal timestamps) and persist."""
+        fresh = np.asarray(rows, dtype=float).reshape(-1, 6)
+        cached = self.load(exchange, symbol, interval)
+        merged = fresh if cached is None else merge_ohlcv(cached, fresh)
+        if cached is None or len(fresh):
+            self.store(exchange, symbol, interval, merged)
+        return merged
+
+
+def merge_ohlcv(existing: np.ndarray, fresh: np.ndarray) -> np.ndarray:
+    """Union two timestamp-sorted row blocks, keeping ``fresh`` values on duplicate timestamps."""
+    if not len(fresh):
+        return np.asarray(existing)
+    combined = np.concatenate([fresh, existing])
+    _, first = np.unique(combined[:, 0], return_index=True)
+    return combined[first]
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import time
-from typing import Iterable, List
+from collections.abc import Iterable, Iterator
 
 import ccxt  # type: ignore
+import numpy as np
 import pandas as pd
 
 from silkroad.data.base import MarketDataFeed, MarketSnapshot
+from silkroad.data.cache import OHLCVCache, ohlcv_frame
+from silkroad.data.download import RateLimiter, download_ohlcv
+from silkroad.data.ring import OHLCVRingBuffer
 
 
 class CCXTFeed(MarketDataFeed):
@@ -19,40 +23,101 @@ class CCXTFeed(MarketDataFeed):
         interval: str,
         lookback: int,
         poll_interval: float = 5.0,
+        cache_dir: str | None = None,
+        page_limit: int = 500,
+        max_concurrency: int = 4,
+        client: ccxt.Exchange | None = None,
+        limiter: RateLimiter | None = None,
         **client_kwargs,
     ) -> None:
         super().__init__(symbol=symbol, interval=interval, lookback=lookback)
-        try:
-            exchange_cls = getattr(ccxt, exchange_id)
-        except AttributeError as exc:
-            raise ValueError(f"Exchange '{exchange_id}' is not supported by ccxt.") from exc
-        self.client: ccxt.Exchange = exchange_cls(**client_kwargs)
+        if client is None:
+            try:
+                exchange_cls = getattr(ccxt, exchange_id)
+            except AttributeError as exc:
+                raise ValueError(f"Exchange '{exchange_id}' is not supported by ccxt.") from exc
+            client = exchange_cls(**client_kwargs)
+        self.exchange_id = exchange_id
+        self.client: ccxt.Exchange = client
         self.poll_interval = poll_interval
+        self.cache = OHLCVCache(cache_dir) if cache_dir else None
+        self.page_limit = page_limit
+        self.max_concurrency = max_concurrency
+        # Feeds sharing one client pass the same limiter so their requests are spaced together.
+        self.limiter = limiter or RateLimiter.for_client(client)
         self._history_cache: pd.DataFrame | None = None
+        self._buffer: OHLCVRingBuffer | None = None
 
     def load_history(self) -> pd.DataFrame:
-        limit = self.lookback
-        ohlcv: List[List[float]] = self.client.fetch_ohlcv(self.symbol, timeframe=self.interval, limit=limit)
-        data = pd.DataFrame(ohlcv, columns=["timestamp", "open", "high", "low", "close", "volume"])
-        data["timestamp"] = pd.to_datetime(data["timestamp"], unit="ms", utc=True)
-        data.set_index("timestamp", inplace=True)
-        data.sort_index(inplace=True)
+        if self.cache is None:
+            ohlcv = self._fetch_bars(self.lookback)
+        else:
+            ohlcv = self._load_cached_history(self.cache)
+        data = ohlcv_frame(ohlcv).iloc[-self.lookback :]
         self._history_cache = data.copy()
         return data
 
+    def iter_history(self, block_size: int) -> Iterator[pd.DataFrame]:
+        if self.cache is None:
+            yield from super().iter_history(block_size)
+            return
+        # Bring the cache up to date, then page through the memory-mapped file block by block.
+        self._load_cached_history(self.cache)
+        rows = self.cache.load(self.exchange_id, self.symbol, self.interval)
+        if rows is None:
+            return
+        rows = rows[-self.lookback :]
+        for start in range(0, len(rows), block_size):
+            yield ohlcv_frame(rows[start : start + block_size])
+
+    def _fetch_bars(self, count: int, since: int | None = None) -> list[list[float]] | np.ndarray:
+        """Fetch ``count`` bars (the newest unless ``since`` is given), paging past the limit."""
+        if count <= self.page_limit:
+            self.limiter.wait()
+            if since is None:
+                return self.client.fetch_ohlcv(self.symbol, timeframe=self.interval, limit=count)
+            return self.client.fetch_ohlcv(
+                self.symbol, timeframe=self.interval, since=since, limit=count
+            )
+        if since is None:
+            interval_ms = int(self.client.parse_timeframe(self.interval) * 1000)
+            now = self.client.milliseconds()
+            since = now - now % interval_ms - (count - 1) * interval_ms
+        return download_ohlcv(
+            self.client,
+            self.symbol,
+            self.interval,
+            since=since,
+            page_limit=self.page_limit,
+            max_concurrency=self.max_concurrency,
+            limiter=self.limiter,
+        )
+
+    def _load_cached_history(self, cache: OHLCVCache) -> np.ndarray:
+        cached = cache.load(self.exchange_id, self.symbol, self.interval)
+        fresh: list[list[float]] | np.ndarray | None = None
+        if cached is not None and len(cached):
+            # Re-request the newest cached bar: it may have been stored while still in progress.
+            last_timestamp = int(cached[-1, 0])
+            interval_ms = int(self.client.parse_timeframe(self.interval) * 1000)
+            missing = int((self.client.milliseconds() - last_timestamp) // interval_ms) + 1
+            if missing <= self.lookback and len(cached) + missing - 1 >= self.lookback:
+                fresh = self._fetch_bars(missing, since=last_timestamp)
+        if fresh is None:
+            fresh = self._fetch_bars(self.lookback)
+        rows = cache.update(self.exchange_id, self.symbol, self.interval, fresh)
+        return rows[-self.lookback :]
+
     def stream(self) -> Iterable[MarketSnapshot]:
-        if self._history_cache is None:
-            history = self.load_history()
-        else:
-            history = self._history_cache.copy()
+        if self._buffer is None:
+            history = self._history_cache
+            if history is None:
+                history = self.load_history()
+            self._buffer = OHLCVRingBuffer.from_frame(history, capacity=self.lookback)
+        buffer = self._buffer
 
         while True:
-            yield MarketSnapshot(history)
+            yield buffer.snapshot()
             time.sleep(self.poll_interval)
             latest = self.client.fetch_ohlcv(self.symbol, timeframe=self.interval, limit=2)
-            last_row = pd.DataFrame(latest, columns=["timestamp", "open", "high", "low", "close", "volume"])
-            last_row["timestamp"] = pd.to_datetime(last_row["timestamp"], unit="ms", utc=True)
-            last_row.set_index("timestamp", inplace=True)
-            history = pd.concat([history, last_row]).drop_duplicates()
-            history = history.iloc[-self.lookback :]
-            self._history_cache = history.copy()
+            buffer.extend_ohlcv(latest)
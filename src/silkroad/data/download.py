@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+
+
+class RateLimiter:
+    """Spaces request start times at least ``interval`` seconds apart across threads."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    @classmethod
+    def for_client(cls, client: Any) -> RateLimiter:
+        """Limiter spacing requests by the client's ``rateLimit`` (milliseconds)."""
+        return cls(getattr(client, "rateLimit", 0) / 1000)
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def download_ohlcv(
+    client: Any,
+    symbol: str,
+    timeframe: str,
+    since: int,
+    until: int | None = None,
+    page_limit: int = 500,
+    max_concurrency: int = 4,
+    limiter: RateLimiter | None = None,
+) -> np.ndarray:
+    """Fetch ``[since, until)`` as ``(n, 6)`` OHLCV rows by walking ``since`` windows concurrently.
+
+    Windows are fetched in parallel while request starts honour ``client.rateLimit``, or the
+    ``limiter`` shared with other downloads over the same client. A window the exchange answers
+    only partially (because its cap is below ``page_limit``) is continued from the last returned
+    bar, and overlapping bars at window boundaries are deduplicated.
+    """
+    interval_ms = int(client.parse_timeframe(timeframe) * 1000)
+    until = int(until if until is not None else client.milliseconds() + interval_ms)
+    window_ms = page_limit * interval_ms
+    if limiter is None:
+        limiter = RateLimiter.for_client(client)
+
+    def fetch_window(start: int) -> list[list[float]]:
+        end = min(start + window_ms, until)
+        rows: list[list[float]] = []
+        cursor = start
+        while cursor < end:
+            limiter.wait()
+            page = client.fetch_ohlcv(symbol, timeframe=timeframe, since=cursor, limit=page_limit)
+            page = [row for row in page if cursor <= row[0] < end]
+            if not page:
+                break
+            rows.extend(page)
+            cursor = int(page[-1][0]) + interval_ms
+        return rows
+
+    starts = list(range(int(since), until, window_ms))
+    if not starts:
+        return np.empty((0, 6), dtype=float)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(starts)))) as pool:
+        pages = list(pool.map(fetch_window, starts))
+
+    rows = [row for page in pages for row in page]
+    if not rows:
+        return np.empty((0, 6), dtype=float)
+    data = np.asarray(rows, dtype=float).reshape(-1, 6)
+    _, unique = np.unique(data[:, 0], return_index=True)
+    return data[unique]
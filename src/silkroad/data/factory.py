@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from typing import Any
 
-from silkroad.data.base import MarketDataFeed
+from silkroad.data.async_ccxt_feed import AsyncCCXTFeed
+from silkroad.data.base import AsyncMarketDataFeed, MarketDataFeed
 from silkroad.data.ccxt_feed import CCXTFeed
-from silkroad.data.static_feed import StaticFeed
+from silkroad.data.static_feed import AsyncStaticFeed, StaticFeed
 
 
-def build_data_feed(source: str, symbol: str, interval: str, lookback: int, **kwargs: Any) -> MarketDataFeed:
+def build_data_feed(
+    source: str, symbol: str, interval: str, lookback: int, **kwargs: Any
+) -> MarketDataFeed:
     if source.startswith("ccxt:"):
         exchange_id = source.split(":", maxsplit=1)[1]
         poll_interval = kwargs.pop("poll_interval", 5.0)
@@ -23,3 +26,22 @@ def build_data_feed(source: str, symbol: str, interval: str, lookback: int, **kw
         data = kwargs.get("data")
         return StaticFeed(symbol=symbol, interval=interval, lookback=lookback, data=data)
     raise ValueError(f"Unsupported data source '{source}'.")
+
+
+def build_async_data_feed(
+    source: str, symbols: list[str], interval: str, lookback: int, **kwargs: Any
+) -> AsyncMarketDataFeed:
+    if source.startswith("ccxt:"):
+        exchange_id = source.split(":", maxsplit=1)[1]
+        return AsyncCCXTFeed(
+            exchange_id=exchange_id,
+            symbols=symbols,
+            interval=interval,
+            lookback=lookback,
+            **kwargs,
+        )
+    if source == "static":
+        return AsyncStaticFeed(
+            symbols=symbols, interval=interval, lookback=lookback, data=kwargs.get("data")
+        )
+    raise ValueError(f"Unsupported async data source '{source}'.")
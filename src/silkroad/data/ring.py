@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+from silkroad.data.base import HistoryCursor
+
+RING_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+class OHLCVRingBuffer:
+    """Fixed-capacity columnar window of bars keyed on timestamp.
+
+    Every bar is written twice, at ``slot`` and ``slot + capacity``, so the live window is always
+    one contiguous slice. Upserts and snapshots are O(1) regardless of capacity; snapshots are
+    views that keep reflecting later upserts, so copy ``history()`` to keep a stable window.
+    """
+
+    def __init__(self, capacity: int, columns: Sequence[str] = RING_COLUMNS) -> None:
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive.")
+        self.capacity = capacity
+        self.column_names = tuple(columns)
+        self._timestamps = np.zeros(2 * capacity, dtype=np.int64)
+        self._values: dict[str, np.ndarray] = {
+            name: np.zeros(2 * capacity) for name in self.column_names
+        }
+        self._start = 0
+        self._size = 0
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, capacity: int | None = None) -> OHLCVRingBuffer:
+        buffer = cls(capacity or max(len(frame), 1))
+        timestamps = frame.index.as_unit("ns").asi8
+        values = frame[list(buffer.column_names)].to_numpy(dtype=float)
+        for timestamp, row in zip(
+            timestamps[-buffer.capacity :], values[-buffer.capacity :], strict=True
+        ):
+            buffer.upsert(int(timestamp), row)
+        return buffer
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_timestamp(self) -> int | None:
+        if not self._size:
+            return None
+        return int(self._timestamps[self._start + self._size - 1])
+
+    def upsert(self, timestamp: int, values: Sequence[float]) -> None:
+        """Insert a bar keyed by epoch-ns ``timestamp`` or overwrite the bar already holding it."""
+        last = self.last_timestamp
+        if last is not None and timestamp <= last:
+            offset = self._size - 1
+            while offset >= 0 and self._timestamps[self._start + offset] > timestamp:
+                offset -= 1
+            if offset >= 0 and self._timestamps[self._start + offset] == timestamp:
+                self._write((self._start + offset) % self.capacity, timestamp, values)
+            return
+        if self._size < self.capacity:
+            slot = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self.capacity
+        self._write(slot, timestamp, values)
+
+    def extend_ohlcv(self, rows: Sequence[Sequence[float]]) -> None:
+        """Upsert ccxt-style ``[ms, open, high, low, close, volume]`` rows."""
+        for row in rows:
+            self.upsert(int(row[0]) * 1_000_000, row[1:])
+
+    def snapshot(self) -> HistoryCursor:
+        stop = self._start + self._size
+        columns = {name: values[self._start : stop] for name, values in self._values.items()}
+        return HistoryCursor(self._timestamps[self._start : stop], columns, position=self._size - 1)
+
+    def _write(self, slot: int, timestamp: int, values: Sequence[float]) -> None:
+        mirror = slot + self.capacity
+        self._timestamps[slot] = self._timestamps[mirror] = timestamp
+        for name, value in zip(self.column_names, values, strict=True):
+            column = self._values[name]
+            column[slot] = column[mirror] = value
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class SharedHistoryHandle:
+    """Picklable description of a published history: block names, dtypes and row count."""
+
+    length: int
+    index_block: str
+    index_tz: str | None
+    columns: tuple[tuple[str, str, str], ...]  # (column, block name, dtype)
+
+
+class SharedHistory:
+    """OHLCV columns placed in ``multiprocessing.shared_memory`` blocks.
+
+    The publishing process owns the blocks and unlinks them on exit; other processes attach
+    through the handle and read the same pages as read-only NumPy views.
+    """
+
+    def __init__(
+        self,
+        handle: SharedHistoryHandle,
+        blocks: dict[str, shared_memory.SharedMemory],
+        owner: bool,
+    ) -> None:
+        self.handle = handle
+        self._blocks = blocks
+        self._owner = owner
+        self._frame: pd.DataFrame | None = None
+
+    @classmethod
+    def publish(cls, frame: pd.DataFrame, columns: Iterable[str] | None = None) -> SharedHistory:
+        if not isinstance(frame.index, pd.DatetimeIndex):
+            raise TypeError("SharedHistory requires a DatetimeIndex.")
+        if columns is None:
+            columns = [name for name in frame.columns if pd.api.types.is_numeric_dtype(frame[name])]
+        names = [str(name) for name in columns]
+        blocks: dict[str, shared_memory.SharedMemory] = {}
+        try:
+            index_values = frame.index.as_unit("ns").asi8
+            blocks["__index__"] = _create_block(index_values)
+            specs = []
+            for name in names:
+                values = frame[name].to_numpy()
+                block = _create_block(values)
+                blocks[name] = block
+                specs.append((name, block.name, values.dtype.str))
+        except BaseException:
+            for block in blocks.values():
+                block.close()
+                block.unlink()
+            raise
+        tz = frame.index.tz
+        handle = SharedHistoryHandle(
+            length=len(frame),
+            index_block=blocks["__index__"].name,
+            index_tz=str(tz) if tz is not None else None,
+            columns=tuple(specs),
+        )
+        return cls(handle, blocks, owner=True)
+
+    @classmethod
+    def attach(cls, handle: SharedHistoryHandle) -> SharedHistory:
+        blocks = {"__index__": _open_block(handle.index_block)}
+        for name, block_name, _ in handle.columns:
+            blocks[name] = _open_block(block_name)
+        return cls(handle, blocks, owner=False)
+
+    def frame(self) -> pd.DataFrame:
+        """Return a DataFrame whose columns are read-only views over the shared blocks."""
+        if self._frame is None:
+            length = self.handle.length
+            index_values = _view(self._blocks["__index__"], np.dtype(np.int64), length)
+            index = pd.DatetimeIndex(index_values.view("datetime64[ns]"))
+            if self.handle.index_tz is not None:
+                index = index.tz_localize("UTC").tz_convert(self.handle.index_tz)
+            data = {
+                name: _view(self._blocks[name], np.dtype(dtype), length)
+                for name, _, dtype in self.handle.columns
+            }
+            self._frame = pd.DataFrame(data, index=index, copy=False)
+        return self._frame
+
+    def close(self) -> None:
+        self._frame = None
+        for block in self._blocks.values():
+            try:
+                block.close()
+            except BufferError:
+                # Views handed out by frame() are still alive; the mapping goes away with them.
+                pass
+        if self._owner:
+            for block in self._blocks.values():
+                try:
+                    block.unlink()
+                except FileNotFoundError:
+                    pass
+        self._blocks = {}
+
+    def __enter__(self) -> SharedHistory:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _create_block(values: np.ndarray) -> shared_memory.SharedMemory:
+    values = np.ascontiguousarray(values)
+    block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+    return block
+
+
+def _open_block(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _view(block: shared_memory.SharedMemory, dtype: np.dtype, length: int) -> np.ndarray:
+    values = np.ndarray((length,), dtype=dtype, buffer=block.buf)
+    values.flags.writeable = False
+    return values
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-from typing import Iterable
+from collections.abc import AsyncIterator, Iterable, Mapping
 
 import pandas as pd
 
-from silkroad.data.base import MarketDataFeed, MarketSnapshot
+from silkroad.data.base import AsyncMarketDataFeed, MarketDataFeed, MarketSnapshot
 
 
 class StaticFeed(MarketDataFeed):
     """In-memory data feed for tests and dry runs."""
 
-    def __init__(self, symbol: str, interval: str, lookback: int, data: pd.DataFrame | None = None) -> None:
+    def __init__(
+        self, symbol: str, interval: str, lookback: int, data: pd.DataFrame | None = None
+    ) -> None:
         super().__init__(symbol=symbol, interval=interval, lookback=lookback)
         if data is None:
             index = pd.date_range(end=pd.Timestamp.utcnow(), periods=lookback, freq=interval)
@@ -32,3 +34,32 @@ class StaticFeed(MarketDataFeed):
 
     def stream(self) -> Iterable[MarketSnapshot]:
         yield MarketSnapshot(self.data.copy())
+
+
+class AsyncStaticFeed(AsyncMarketDataFeed):
+    """In-memory multi-symbol feed for tests and dry runs of portfolio engines."""
+
+    def __init__(
+        self,
+        symbols: list[str],
+        interval: str,
+        lookback: int,
+        data: Mapping[str, pd.DataFrame] | pd.DataFrame | None = None,
+    ) -> None:
+        super().__init__(symbols=symbols, interval=interval, lookback=lookback)
+        self.feeds = {
+            symbol: StaticFeed(
+                symbol=symbol,
+                interval=interval,
+                lookback=lookback,
+                data=data.get(symbol) if isinstance(data, Mapping) else data,
+            )
+            for symbol in self.symbols
+        }
+
+    async def load_history(self, symbol: str) -> pd.DataFrame:
+        return self.feeds[symbol].load_history()
+
+    async def stream(self) -> AsyncIterator[tuple[str, MarketSnapshot]]:
+        for symbol in self.symbols:
+            yield symbol, MarketSnapshot(await self.load_history(symbol))
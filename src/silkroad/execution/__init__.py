@@ -1,13 +1,14 @@
 "Execution engines for live and paper trading."
 
 from .base import ExecutionEngine
-from .paper import PaperTradingEngine
 from .ibkr import IBKRExecutionEngine
-from .registry import register_execution_engine, EXECUTION_REGISTRY
+from .paper import PaperTradingEngine, PortfolioPaperEngine
+from .registry import EXECUTION_REGISTRY, register_execution_engine
 
 __all__ = [
     "ExecutionEngine",
     "PaperTradingEngine",
+    "PortfolioPaperEngine",
     "IBKRExecutionEngine",
     "register_execution_engine",
     "EXECUTION_REGISTRY",
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional, Protocol, TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
-    from silkroad.analytics import AnalyticsStore
+    from silkroad.analytics import AnalyticsSink
     from silkroad.data import MarketDataFeed
     from silkroad.monitoring.notifications import Notifier
     from silkroad.risk.manager import RiskManager
@@ -24,10 +24,10 @@ class ExecutionEngine(ABC):
     def __init__(
         self,
         symbol: str,
-        data_feed: Optional["MarketDataFeed"] = None,
-        risk_manager: Optional["RiskManager"] = None,
-        notifier: Optional["Notifier"] = None,
-        analytics: Optional["AnalyticsStore"] = None,
+        data_feed: MarketDataFeed | None = None,
+        risk_manager: RiskManager | None = None,
+        notifier: Notifier | None = None,
+        analytics: AnalyticsSink | None = None,
         **kwargs,
     ) -> None:
         self.symbol = symbol
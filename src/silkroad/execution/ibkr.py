@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
 
 from ib_insync import IB, MarketOrder, Stock, util  # type: ignore
 
@@ -64,12 +63,13 @@ class IBKRExecutionEngine(ExecutionEngine):
             strategy.prepare(history.copy())
             try:
                 for snapshot in self.data_feed.stream():
+                    strategy.update(snapshot)
                     signal = strategy.generate_signal(snapshot)
                     if self.risk_manager and not self.risk_manager.validate(signal):
                         if self.notifier:
                             self.notifier.send(f"[IBKR] Risk blocked {signal.side} signal.")
                         continue
-                    price = float(snapshot.history().iloc[-1]["close"])
+                    price = float(snapshot.latest("close"))
                     self.execute(signal, price)
                     self.ib.sleep(self.connection.poll_interval)
             finally:
@@ -140,7 +140,7 @@ class IBKRExecutionEngine(ExecutionEngine):
         if self.ib.isConnected():
             self.ib.disconnect()
 
-    def _fetch_last_price(self) -> Optional[float]:
+    def _fetch_last_price(self) -> float | None:
         ticker = self.ib.reqMktData(self.contract, "", False, False)
         for _ in range(10):
             self.ib.waitOnUpdate(timeout=1)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import copy
 from datetime import datetime
+from typing import Any
 
-from silkroad.analytics.logger import TradeRecord
-from silkroad.data.base import MarketDataFeed
+from silkroad.analytics.logger import AnalyticsSink, TradeRecord
+from silkroad.data.base import AsyncMarketDataFeed, MarketDataFeed
 from silkroad.execution.base import ExecutionEngine
 from silkroad.monitoring.notifications import Notifier, PrintNotifier
 from silkroad.risk.manager import RiskManager
@@ -39,29 +42,96 @@ class PaperTradingEngine(ExecutionEngine):
         history = self.data_feed.load_history()
         strategy.prepare(history.copy())
         for snapshot in self.data_feed.stream():
+            strategy.update(snapshot)
             signal = strategy.generate_signal(snapshot)
             if self.risk_manager and not self.risk_manager.validate(signal):
                 self.notifier.send(f"Risk constraints blocked {signal.side} signal.")
                 continue
-            price = float(snapshot.history().iloc[-1]["close"])
+            price = float(snapshot.latest("close"))
             self.execute(signal, price)
 
-    def execute(self, signal: Signal, price: float | None = None) -> None:
+    def execute(
+        self, signal: Signal, price: float | None = None, symbol: str | None = None
+    ) -> None:
+        symbol = symbol or self.symbol
         price_display = f" @ {price:.2f}" if price is not None else ""
-        self.notifier.send(f"[PAPER] {signal.side.upper()} {signal.size:.4f} {self.symbol}{price_display}")
+        self.notifier.send(
+            f"[PAPER] {signal.side.upper()} {signal.size:.4f} {symbol}{price_display}"
+        )
         if self.analytics and price is not None:
             quantity = signal.size
             self.analytics.log_trade(
                 TradeRecord(
                     timestamp=datetime.utcnow(),
-                    symbol=self.symbol,
+                    symbol=symbol,
                     side=signal.side,
                     quantity=quantity,
                     price=price,
-                    strategy=signal.metadata.get("strategy", "unknown") if signal.metadata else "unknown",
+                    strategy=(
+                        signal.metadata.get("strategy", "unknown") if signal.metadata else "unknown"
+                    ),
                     source="paper",
                 )
             )
 
 
 register_execution_engine("paper")(PaperTradingEngine)
+
+
+class PortfolioPaperEngine(PaperTradingEngine):
+    """Paper-trades a universe of symbols from one process.
+
+    A single asyncio loop drives an ``AsyncMarketDataFeed`` for every symbol; each symbol gets its
+    own copy of the strategy while the notifier and analytics writer are shared.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        data_feed: AsyncMarketDataFeed,
+        risk_manager: RiskManager | None = None,
+        notifier: Notifier | None = None,
+        analytics: AnalyticsSink | None = None,
+        **kwargs: Any,
+    ) -> None:
+        if not isinstance(data_feed, AsyncMarketDataFeed):
+            raise ValueError("PortfolioPaperEngine requires an async data feed.")
+        super().__init__(
+            symbol=symbol,
+            data_feed=data_feed,  # type: ignore[arg-type]
+            risk_manager=risk_manager,
+            notifier=notifier,
+            analytics=analytics,
+            **kwargs,
+        )
+        self.feed: AsyncMarketDataFeed = data_feed
+
+    @property
+    def symbols(self) -> list[str]:
+        return self.feed.symbols
+
+    def run(self, strategy: Strategy) -> None:
+        asyncio.run(self.run_async(strategy))
+
+    async def run_async(self, strategy: Strategy) -> None:
+        strategies: dict[str, Strategy] = {}
+        try:
+            async for symbol, snapshot in self.feed.stream():
+                symbol_strategy = strategies.get(symbol)
+                if symbol_strategy is None:
+                    symbol_strategy = strategies[symbol] = copy.deepcopy(strategy)
+                    symbol_strategy.prepare(snapshot.history().copy())
+                symbol_strategy.update(snapshot)
+                signal = symbol_strategy.generate_signal(snapshot)
+                if self.risk_manager and not self.risk_manager.validate(signal):
+                    if self.notifier:
+                        self.notifier.send(
+                            f"Risk constraints blocked {signal.side} signal for {symbol}."
+                        )
+                    continue
+                self.execute(signal, float(snapshot.latest("close")), symbol=symbol)
+        finally:
+            await self.feed.close()
+
+
+register_execution_engine("paper_portfolio")(PortfolioPaperEngine)
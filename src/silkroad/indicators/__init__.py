@@ -0,0 +1,26 @@
+"Technical indicators: vectorized with a shared memoization cache, and O(1) streaming updates."
+
+from .cache import IndicatorCache, cached, default_cache, release
+from .streaming import EMA, RollingMax, RollingMean, RollingMin, StreamingIndicator, WilderRSI
+from .vectorized import INDICATORS, atr, ema, rolling_max, rolling_min, rsi, sma, wilder_average
+
+__all__ = [
+    "EMA",
+    "INDICATORS",
+    "IndicatorCache",
+    "RollingMax",
+    "RollingMean",
+    "RollingMin",
+    "StreamingIndicator",
+    "WilderRSI",
+    "atr",
+    "cached",
+    "default_cache",
+    "ema",
+    "release",
+    "rolling_max",
+    "rolling_min",
+    "rsi",
+    "sma",
+    "wilder_average",
+]
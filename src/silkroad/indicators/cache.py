@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .vectorized import INDICATORS
+
+# (data pointer, shape, strides, dtype) of an input buffer.
+_Identity = tuple[int, tuple[int, ...], tuple[int, ...], str]
+# (indicator, sorted parameters, input identities)
+_Key = tuple[str, tuple[tuple[str, Any], ...], tuple[_Identity, ...]]
+
+
+class IndicatorCache:
+    """LRU memo of indicator results keyed by (input buffers, indicator, parameters).
+
+    An input is identified by its data pointer, shape, strides and dtype. The cache holds no
+    reference to the inputs: a finalizer on the array that owns each buffer drops its entries when
+    it is collected, so a pointer cannot be recycled for different data while it is cached.
+    Inputs must not be modified in place after they are first used (append-only live buffers
+    should use ``silkroad.indicators.streaming`` instead), and inputs that first had to be
+    converted to float64 are computed without caching. Results are returned read-only and their
+    total size is kept under ``max_bytes``. The cache is shared by threads (dashboard sessions),
+    so its bookkeeping runs under a re-entrant lock that finalizers firing mid-update can take.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries: OrderedDict[_Key, tuple[np.ndarray, tuple[int, ...]]] = OrderedDict()
+        # id(owner array) -> (finalizer, keys computed from its buffer)
+        self._owners: dict[int, tuple[weakref.finalize, set[_Key]]] = {}
+        self._lock = threading.RLock()
+
+    def compute(self, name: str, *inputs: Any, **params: Any) -> np.ndarray:
+        try:
+            function = INDICATORS[name]
+        except KeyError as exc:
+            raise ValueError(f"Indicator '{name}' is not supported.") from exc
+        converted = [_as_array(values) for values in inputs]
+        arrays = tuple(array for array, _ in converted)
+        if any(copied for _, copied in converted):
+            # A temporary copy's address says nothing about the data of later calls.
+            with self._lock:
+                self.misses += 1
+            return _read_only(function(*arrays, **params))
+        key = (name, tuple(sorted(params.items())), tuple(_identity(array) for array in arrays))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        # Computed outside the lock; a thread that raced us to the same key keeps its result.
+        result = _read_only(function(*arrays, **params))
+        with self._lock:
+            if result.nbytes <= self.max_bytes and key not in self._entries:
+                self._store(key, result, arrays)
+        return result
+
+    def release(self, *inputs: Any) -> int:
+        """Drop the entries computed from any of ``inputs`` (arrays, series or frame columns).
+
+        Chunked runs call this once a block is done so its results do not outlive it; returns
+        the number of entries removed.
+        """
+        identities = set()
+        for values in inputs:
+            columns = values.items() if isinstance(values, pd.DataFrame) else [(None, values)]
+            for _, column in columns:
+                identities.add(_identity(_as_array(column)[0]))
+        with self._lock:
+            stale = [key for key in list(self._entries) if identities.intersection(key[2])]
+            for key in stale:
+                self._discard(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._discard(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: _Key, result: np.ndarray, arrays: tuple[np.ndarray, ...]) -> None:
+        owners = []
+        for array in arrays:
+            owner = _owner(array)
+            watched = self._owners.get(id(owner))
+            if watched is None:
+                finalizer = weakref.finalize(owner, _forget, weakref.ref(self), id(owner))
+                watched = self._owners[id(owner)] = (finalizer, set())
+            watched[1].add(key)
+            owners.append(id(owner))
+        self._entries[key] = (result, tuple(owners))
+        self.nbytes += result.nbytes
+        while self.nbytes > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: _Key) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return
+            result, owners = entry
+            self.nbytes -= result.nbytes
+            for owner_id in owners:
+                watched = self._owners.get(owner_id)
+                if watched is None:
+                    continue
+                watched[1].discard(key)
+                if not watched[1]:
+                    watched[0].detach()
+                    del self._owners[owner_id]
+
+
+def _forget(cache_ref: weakref.ref[IndicatorCache], owner_id: int) -> None:
+    cache = cache_ref()
+    if cache is None:
+        return
+    with cache._lock:
+        watched = cache._owners.pop(owner_id, None)
+        if watched is not None:
+            for key in list(watched[1]):
+                cache._discard(key)
+
+
+def _as_array(values: Any) -> tuple[np.ndarray, bool]:
+    """``values`` as a float64 array, and whether that took a copy."""
+    raw = values.to_numpy() if isinstance(values, pd.Series) else values
+    array = np.asarray(raw, dtype=float)
+    return array, array is not raw
+
+
+def _owner(array: np.ndarray) -> np.ndarray:
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
+def _identity(array: np.ndarray) -> _Identity:
+    return (array.__array_interface__["data"][0], array.shape, array.strides, array.dtype.str)
+
+
+def _read_only(values: Any) -> np.ndarray:
+    result = np.asarray(values, dtype=float)
+    result.flags.writeable = False
+    return result
+
+
+default_cache = IndicatorCache()
+
+
+def release(*inputs: Any) -> int:
+    """Drop :data:`default_cache` entries computed from ``inputs``."""
+    return default_cache.release(*inputs)
+
+
+def cached(name: str, *inputs: Any, **params: Any) -> np.ndarray:
+    """Compute ``name`` through the process-wide :data:`default_cache`."""
+    return default_cache.compute(name, *inputs, **params)
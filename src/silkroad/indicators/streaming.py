@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterable
+from typing import TypeVar
+
+_Indicator = TypeVar("_Indicator", bound="StreamingIndicator")
+
+
+class StreamingIndicator(ABC):
+    """Indicator updated one bar at a time in O(1).
+
+    State is split into committed bars and the current (possibly still forming) bar:
+    ``update(value)`` commits the current bar and starts a new one, ``revise(value)`` replaces the
+    current bar's value, e.g. when an exchange re-sends an in-progress candle. ``value`` is NaN
+    until enough bars have been seen, mirroring the vectorized indicators.
+    """
+
+    def __init__(self) -> None:
+        self._pending: float | None = None
+
+    def seed(self: _Indicator, values: Iterable[float]) -> _Indicator:
+        for value in values:
+            self.update(value)
+        return self
+
+    def update(self, value: float) -> float:
+        if self._pending is not None:
+            self._commit(self._pending)
+        self._pending = float(value)
+        return self.value
+
+    def revise(self, value: float) -> float:
+        if self._pending is None:
+            return self.update(value)
+        self._pending = float(value)
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self._pending is None:
+            return math.nan
+        return self._current(self._pending)
+
+    @abstractmethod
+    def _current(self, pending: float) -> float:
+        """Indicator value if the current bar closed at ``pending``."""
+
+    @abstractmethod
+    def _commit(self, value: float) -> None:
+        """Fold a finished bar into the committed state."""
+
+
+class RollingMean(StreamingIndicator):
+    """Simple moving average over a running sum of the previous ``window - 1`` bars."""
+
+    def __init__(self, window: int) -> None:
+        super().__init__()
+        self.window = window
+        self._committed: deque[float] = deque()
+        self._sum = 0.0
+        self._commits = 0
+
+    def _current(self, pending: float) -> float:
+        if len(self._committed) < self.window - 1:
+            return math.nan
+        return (self._sum + pending) / self.window
+
+    def _commit(self, value: float) -> None:
+        self._committed.append(value)
+        self._sum += value
+        if len(self._committed) > self.window - 1:
+            self._sum -= self._committed.popleft()
+        self._commits += 1
+        if self._commits % self.window == 0:
+            # Resum once per window (amortized O(1)) so rounding error cannot accumulate.
+            self._sum = math.fsum(self._committed)
+
+
+class EMA(StreamingIndicator):
+    """Exponential moving average with ``alpha = 2 / (span + 1)``, seeded with the first bar."""
+
+    def __init__(self, span: int) -> None:
+        super().__init__()
+        self.alpha = 2.0 / (span + 1)
+        self._ema: float | None = None
+
+    def _current(self, pending: float) -> float:
+        if self._ema is None:
+            return pending
+        return self._ema + self.alpha * (pending - self._ema)
+
+    def _commit(self, value: float) -> None:
+        self._ema = self._current(value)
+
+
+class WilderRSI(StreamingIndicator):
+    """Wilder's RSI: a ``period`` mean of gains/losses, then smoothing by ``1/period``."""
+
+    def __init__(self, period: int = 14) -> None:
+        super().__init__()
+        self.period = period
+        self._previous_close: float | None = None
+        self._deltas = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+
+    def _advance(self, close: float) -> tuple[int, float, float]:
+        delta = close - self._previous_close  # type: ignore[operator]
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        deltas = self._deltas + 1
+        if deltas <= self.period:
+            # Running means during the seed window; they equal the simple mean at ``period``.
+            avg_gain = self._avg_gain + (gain - self._avg_gain) / deltas
+            avg_loss = self._avg_loss + (loss - self._avg_loss) / deltas
+        else:
+            avg_gain = (self._avg_gain * (self.period - 1) + gain) / self.period
+            avg_loss = (self._avg_loss * (self.period - 1) + loss) / self.period
+        return deltas, avg_gain, avg_loss
+
+    def _current(self, pending: float) -> float:
+        if self._previous_close is None:
+            return math.nan
+        deltas, avg_gain, avg_loss = self._advance(pending)
+        if deltas < self.period:
+            return math.nan
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else math.nan
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    def _commit(self, value: float) -> None:
+        if self._previous_close is not None:
+            self._deltas, self._avg_gain, self._avg_loss = self._advance(value)
+        self._previous_close = value
+
+
+class _RollingExtremum(StreamingIndicator):
+    """Rolling max/min over a monotonic deque of the previous ``window - 1`` bars."""
+
+    _sign = 1.0
+
+    def __init__(self, window: int) -> None:
+        super().__init__()
+        self.window = window
+        self._candidates: deque[tuple[int, float]] = deque()  # (bar number, signed value)
+        self._bars = 0
+
+    def _current(self, pending: float) -> float:
+        if self._bars < self.window - 1:
+            return math.nan
+        signed = self._sign * pending
+        if self._candidates:
+            signed = max(signed, self._candidates[0][1])
+        return self._sign * signed
+
+    def _commit(self, value: float) -> None:
+        signed = self._sign * value
+        while self._candidates and self._candidates[-1][1] <= signed:
+            self._candidates.pop()
+        self._candidates.append((self._bars, signed))
+        self._bars += 1
+        while self._candidates and self._candidates[0][0] <= self._bars - self.window:
+            self._candidates.popleft()
+
+
+class RollingMax(_RollingExtremum):
+    _sign = 1.0
+
+
+class RollingMin(_RollingExtremum):
+    _sign = -1.0
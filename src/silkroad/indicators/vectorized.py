@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+
+def sma(values: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average; the first ``window - 1`` entries are NaN."""
+    return pd.Series(values, copy=False).rolling(window).mean().to_numpy()
+
+
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average with ``alpha = 2 / (span + 1)``, seeded with the first value."""
+    return pd.Series(values, copy=False).ewm(span=span, adjust=False).mean().to_numpy()
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    return pd.Series(values, copy=False).rolling(window).max().to_numpy()
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    return pd.Series(values, copy=False).rolling(window).min().to_numpy()
+
+
+def rsi(values: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder's RSI: gains and losses seeded with a simple mean, then smoothed by ``1/period``."""
+    values = np.asarray(values, dtype=float)
+    delta = np.diff(values, prepend=np.nan)
+    gains = wilder_average(np.where(delta > 0, delta, 0.0), period, start=1)
+    losses = wilder_average(np.where(delta < 0, -delta, 0.0), period, start=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = 100.0 - 100.0 / (1.0 + gains / losses)
+    # No losses in the window means RSI 100 (or undefined when prices did not move at all).
+    result[(losses == 0) & (gains > 0)] = 100.0
+    return result
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder's average true range."""
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    previous_close = np.roll(np.asarray(close, dtype=float), 1)
+    true_range = np.maximum(high - low, np.abs(high - previous_close))
+    true_range = np.maximum(true_range, np.abs(low - previous_close))
+    if len(true_range):
+        true_range[0] = high[0] - low[0]
+    return wilder_average(true_range, period)
+
+
+def wilder_average(values: np.ndarray, period: int, start: int = 0) -> np.ndarray:
+    """Wilder smoothing of ``values[start:]``: a ``period`` mean, then ``alpha = 1/period``."""
+    result = np.full(len(values), np.nan)
+    seed_end = start + period
+    if len(values) < seed_end:
+        return result
+    smoothed = np.concatenate([[values[start:seed_end].mean()], values[seed_end:]])
+    result[seed_end - 1 :] = pd.Series(smoothed).ewm(alpha=1.0 / period, adjust=False).mean()
+    return result
+
+
+INDICATORS: dict[str, Callable[..., np.ndarray]] = {
+    "sma": sma,
+    "ema": ema,
+    "rsi": rsi,
+    "rolling_max": rolling_max,
+    "rolling_min": rolling_min,
+    "atr": atr,
+}
@@ -1,5 +1,5 @@
 "Risk management utilities."
 
-from .manager import RiskManager, RiskLimits
+from .manager import RiskLimits, RiskManager
 
 __all__ = ["RiskManager", "RiskLimits"]
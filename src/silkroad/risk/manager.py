@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from silkroad.strategy.base import Signal
+import numpy as np
+
+from silkroad.strategy.base import Signal, SignalBatch
 
 
 @dataclass
@@ -23,3 +25,7 @@ class RiskManager:
         if signal.size > self.limits.max_position_fraction:
             return False
         return True
+
+    def validate_batch(self, signals: SignalBatch) -> np.ndarray:
+        """Vectorized ``validate`` returning a boolean mask of accepted signals."""
+        return ~(signals.sizes > self.limits.max_position_fraction)
@@ -1,7 +1,14 @@
 "Strategy implementations and registry."
 
-from .base import Strategy
+from .base import Signal, SignalBatch, Strategy
 from .momentum import MomentumStrategy
-from .registry import register_strategy, STRATEGY_REGISTRY
+from .registry import STRATEGY_REGISTRY, register_strategy
 
-__all__ = ["Strategy", "MomentumStrategy", "register_strategy", "STRATEGY_REGISTRY"]
+__all__ = [
+    "Strategy",
+    "Signal",
+    "SignalBatch",
+    "MomentumStrategy",
+    "register_strategy",
+    "STRATEGY_REGISTRY",
+]
@@ -2,20 +2,44 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Protocol
+from typing import Any, Protocol
 
+import numpy as np
 import pandas as pd
 
 
 class MarketData(Protocol):
     def history(self) -> pd.DataFrame: ...
 
+    def latest(self, column: str) -> Any: ...
 
-@dataclass
+    def timestamp(self) -> Any: ...
+
+
+@dataclass(slots=True)
 class Signal:
     side: str  # "buy", "sell", or "hold"
     size: float
-    metadata: Dict[str, Any] | None = None
+    metadata: dict[str, Any] | None = None
+
+
+@dataclass
+class SignalBatch:
+    """Column-oriented signals for a whole frame: ``sides`` holds 1 (buy), -1 (sell) or 0 (hold)."""
+
+    sides: np.ndarray
+    sizes: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.sides)
+
+    def signal_at(self, position: int) -> Signal:
+        side = self.sides[position]
+        if side > 0:
+            return Signal(side="buy", size=float(self.sizes[position]))
+        if side < 0:
+            return Signal(side="sell", size=float(self.sizes[position]))
+        return Signal(side="hold", size=0.0)
 
 
 class Strategy(ABC):
@@ -30,3 +54,35 @@ class Strategy(ABC):
     @abstractmethod
     def generate_signal(self, data: MarketData) -> Signal:
         """Return the next trading signal based on the latest market snapshot."""
+
+    def update(self, bar: MarketData) -> None:
+        """Fold the newest bars of a live snapshot into incremental state.
+
+        Live engines call this for every snapshot after ``prepare`` has run on the initial history,
+        so strategies can keep indicators current in O(1) per bar instead of re-running ``prepare``.
+        """
+        return None
+
+    def signal_side(self, data: MarketData) -> tuple[int, float]:
+        """Metadata-free ``generate_signal``: ``(1 | -1 | 0, size)`` for buy, sell or hold.
+
+        Per-bar backtests call this on every bar; override it to skip building ``Signal``
+        objects and metadata when only the side and size are needed.
+        """
+        signal = self.generate_signal(data)
+        if signal.side == "buy":
+            return 1, signal.size
+        if signal.side == "sell":
+            return -1, signal.size
+        return 0, 0.0
+
+    def warmup(self) -> int:
+        """Bars of history ``prepare`` needs before the current one to compute its indicators.
+
+        Chunked backtests carry this many bars from one block into the next.
+        """
+        return 0
+
+    def generate_signals(self, data: pd.DataFrame) -> SignalBatch | None:
+        """Return signals for every row of a prepared frame, or ``None`` without a batch API."""
+        return None
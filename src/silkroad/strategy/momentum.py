@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import numpy as np
 import pandas as pd
 
-from .base import Signal, Strategy
+from silkroad.data.base import HistoryCursor
+from silkroad.indicators import RollingMean, cached
+
+from .base import MarketData, Signal, SignalBatch, Strategy
 from .registry import register_strategy
 
 
@@ -16,16 +20,52 @@ class MomentumStrategy(Strategy):
     threshold: float = 0.0
     order_size: float = 0.1
 
+    _fast: RollingMean | None = field(default=None, init=False, repr=False, compare=False)
+    _slow: RollingMean | None = field(default=None, init=False, repr=False, compare=False)
+    _last_bar: int | None = field(default=None, init=False, repr=False, compare=False)
+
     def prepare(self, data: pd.DataFrame) -> None:
-        data["fast_ma"] = data["close"].rolling(self.fast_window).mean()
-        data["slow_ma"] = data["close"].rolling(self.slow_window).mean()
+        close = data["close"]
+        data["fast_ma"] = cached("sma", close, window=self.fast_window)
+        data["slow_ma"] = cached("sma", close, window=self.slow_window)
         data["spread"] = data["fast_ma"] - data["slow_ma"]
+        # Seed the streaming averages with the tail of the history for live updates.
+        values = close.to_numpy(dtype=float)
+        self._fast = RollingMean(self.fast_window).seed(values[-self.fast_window :])
+        self._slow = RollingMean(self.slow_window).seed(values[-self.slow_window :])
+        self._last_bar = _bar_times(data.index)[-1] if len(data) else None
+
+    def warmup(self) -> int:
+        return max(self.fast_window, self.slow_window) - 1
 
-    def generate_signal(self, data) -> Signal:
-        history = data.history()
-        latest = history.iloc[-1]
-        spread = latest.get("spread")
-        price = float(latest.get("close")) if not pd.isna(latest.get("close")) else 0.0
+    def update(self, bar: MarketData) -> None:
+        if self._fast is None or self._slow is None:
+            return
+        # Only the two newest bars are read: the last seen bar may still get its final close.
+        times, closes = _tail(bar, 2)
+        if self._last_bar is not None and len(times) and times[0] > self._last_bar:
+            # The feed skipped bars since the last update; catch up from the full window.
+            history = bar.history()
+            times = _bar_times(history.index)
+            closes = history["close"].to_numpy(dtype=float)
+        start = 0 if self._last_bar is None else int(np.searchsorted(times, self._last_bar))
+        for position in range(start, len(times)):
+            close = closes[position]
+            if times[position] == self._last_bar:
+                self._fast.revise(close)
+                self._slow.revise(close)
+            else:
+                self._fast.update(close)
+                self._slow.update(close)
+                self._last_bar = int(times[position])
+
+    def generate_signal(self, data: MarketData) -> Signal:
+        spread = data.latest("spread")
+        if spread is None and self._fast is not None and self._slow is not None:
+            # Live snapshots carry raw OHLCV only; use the incrementally updated averages.
+            spread = self._fast.value - self._slow.value
+        close = data.latest("close")
+        price = float(close) if close is not None and not pd.isna(close) else 0.0
         metadata = {"spread": spread, "price": price, "strategy": self.name}
         if spread is None or pd.isna(spread):
             metadata["reason"] = "spread-not-computed"
@@ -36,5 +76,41 @@ class MomentumStrategy(Strategy):
             return Signal(side="sell", size=self.order_size, metadata=metadata)
         return Signal(side="hold", size=0.0, metadata=metadata)
 
+    def signal_side(self, data: MarketData) -> tuple[int, float]:
+        spread = data.latest("spread")
+        if spread is None and self._fast is not None and self._slow is not None:
+            spread = self._fast.value - self._slow.value
+        if spread is None or spread != spread:
+            return 0, 0.0
+        if spread > self.threshold:
+            return 1, self.order_size
+        if spread < -self.threshold:
+            return -1, self.order_size
+        return 0, 0.0
+
+    def generate_signals(self, data: pd.DataFrame) -> SignalBatch:
+        spread = data["spread"].to_numpy(dtype=float)
+        sides = np.zeros(len(spread), dtype=np.int8)
+        sides[spread > self.threshold] = 1
+        sides[spread < -self.threshold] = -1
+        sizes = np.where(sides != 0, self.order_size, 0.0)
+        return SignalBatch(sides=sides, sizes=sizes)
+
+
+def _bar_times(index: pd.Index) -> np.ndarray:
+    if isinstance(index, pd.DatetimeIndex):
+        return index.as_unit("ns").asi8
+    return np.asarray(index)
+
+
+def _tail(bar: MarketData, count: int) -> tuple[np.ndarray, np.ndarray]:
+    """Bar times and closes of the newest ``count`` bars, without building a history frame."""
+    if isinstance(bar, HistoryCursor):
+        end = bar.position + 1
+        start = max(0, end - count)
+        return bar.times()[start:end], bar.columns["close"][start:end].astype(float)
+    tail = bar.history().iloc[-count:]
+    return _bar_times(tail.index), tail["close"].to_numpy(dtype=float)
+
 
 register_strategy(MomentumStrategy.name)(MomentumStrategy)
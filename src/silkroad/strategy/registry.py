@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Dict, Type
 
 from .base import Strategy
 
 StrategyFactory = Callable[..., Strategy]
 
-STRATEGY_REGISTRY: Dict[str, StrategyFactory] = {}
+STRATEGY_REGISTRY: dict[str, StrategyFactory] = {}
 
 
 def register_strategy(name: str) -> Callable[[StrategyFactory], StrategyFactory]:
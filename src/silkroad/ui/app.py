@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any
 
 import pandas as pd
 import requests
@@ -10,6 +10,12 @@ import streamlit as st
 import yaml
 from streamlit import components
 
+from silkroad.analytics import AnalyticsReader, AnalyticsStore, ParquetAnalyticsReader
+from silkroad.app import SilkRoadApp
+from silkroad.backtesting.results import BacktestResult
+from silkroad.config.settings import load_config
+from silkroad.indicators import cached
+
 TRENDING_REGIONS = {
     "US": "United States",
     "CA": "Canada",
@@ -45,41 +51,38 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     alt = None
 
-from silkroad.analytics.logger import AnalyticsStore
-from silkroad.app import SilkRoadApp
-from silkroad.backtesting.results import BacktestResult
 
+@st.cache_resource(show_spinner=False)
+def _analytics_reader(database: str) -> AnalyticsReader:
+    """One reader per database, shared by every session through its connection pool."""
+    AnalyticsStore(database).close()  # create or upgrade the schema before read-only access
+    return AnalyticsReader(database)
+
+
+@st.cache_resource(show_spinner=False)
+def _parquet_reader(root: str) -> ParquetAnalyticsReader:
+    """One read-only reader per dataset directory, shared by every session."""
+    return ParquetAnalyticsReader(root)
 
-def _fetch_recent_trades(store: Optional[AnalyticsStore], limit: int = 50) -> Optional[pd.DataFrame]:
-    if not store:
+
+# Both expose recent_trades/recent_metrics/recent_runs/load_result for the dashboard.
+_Reader = AnalyticsReader | ParquetAnalyticsReader
+
+
+def _fetch_recent_trades(reader: _Reader | None, limit: int = 50) -> pd.DataFrame | None:
+    if not reader:
         return None
     try:
-        query = """
-        SELECT timestamp, symbol, side, quantity, price, strategy, source
-        FROM trades
-        ORDER BY timestamp DESC
-        LIMIT ?
-        """
-        df = pd.read_sql_query(query, store.conn, params=(limit,))
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        return df
+        return reader.recent_trades(limit)
     except Exception:
         return None
 
 
-def _fetch_recent_metrics(store: Optional[AnalyticsStore], limit: int = 50) -> Optional[pd.DataFrame]:
-    if not store:
+def _fetch_recent_metrics(reader: _Reader | None, limit: int = 50) -> pd.DataFrame | None:
+    if not reader:
         return None
     try:
-        query = """
-        SELECT run_id, timestamp, metric, value, metadata
-        FROM performance
-        ORDER BY timestamp DESC
-        LIMIT ?
-        """
-        df = pd.read_sql_query(query, store.conn, params=(limit,))
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        return df
+        return reader.recent_metrics(limit)
     except Exception:
         return None
 
@@ -235,7 +238,7 @@ def _fetch_trending_symbols(region: str, limit: int = 8) -> list[dict[str, Any]]
 
 
 @st.cache_data(ttl=60)
-def _fetch_quote_snapshot(symbol: str) -> Optional[dict[str, Any]]:
+def _fetch_quote_snapshot(symbol: str) -> dict[str, Any] | None:
     endpoint = "https://query1.finance.yahoo.com/v7/finance/quote"
     try:
         response = requests.get(
@@ -260,7 +263,7 @@ def _fetch_quote_snapshot(symbol: str) -> Optional[dict[str, Any]]:
     }
 
 
-def _fetch_quote_snapshot_fallback(symbol: str) -> Optional[dict[str, Any]]:
+def _fetch_quote_snapshot_fallback(symbol: str) -> dict[str, Any] | None:
     endpoint = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
     try:
         response = requests.get(
@@ -277,18 +280,14 @@ def _fetch_quote_snapshot_fallback(symbol: str) -> Optional[dict[str, Any]]:
     if not result:
         return None
     meta = result[0].get("meta") or {}
+    price = meta.get("regularMarketPrice")
+    previous_close = meta.get("previousClose")
+    change = price - previous_close if price is not None and previous_close is not None else None
     yahoo_snapshot = {
-        "price": meta.get("regularMarketPrice"),
-        "change": meta.get("regularMarketPrice") - meta.get("previousClose", 0.0)
-        if meta.get("regularMarketPrice") is not None and meta.get("previousClose") is not None
-        else None,
+        "price": price,
+        "change": change,
         "change_percent": (
-            (meta.get("regularMarketPrice") - meta.get("previousClose"))
-            / meta.get("previousClose")
-            * 100.0
-            if meta.get("regularMarketPrice") is not None
-            and meta.get("previousClose") not in (None, 0)
-            else None
+            change / previous_close * 100.0 if change is not None and previous_close else None
         ),
         "exchange": meta.get("exchangeName"),
         "currency": meta.get("currency"),
@@ -299,7 +298,7 @@ def _fetch_quote_snapshot_fallback(symbol: str) -> Optional[dict[str, Any]]:
     return yahoo_snapshot
 
 
-def _fetch_quote_snapshot_stooq(symbol: str) -> Optional[dict[str, Any]]:
+def _fetch_quote_snapshot_stooq(symbol: str) -> dict[str, Any] | None:
     stooq_symbol = _normalize_stooq_symbol(symbol)
     if not stooq_symbol:
         return None
@@ -343,7 +342,7 @@ def _fetch_quote_snapshot_stooq(symbol: str) -> Optional[dict[str, Any]]:
 
 
 @st.cache_data(ttl=60)
-def _fetch_intraday_series(symbol: str) -> Optional[pd.Series]:
+def _fetch_intraday_series(symbol: str) -> pd.Series | None:
     endpoint = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
     try:
         response = requests.get(
@@ -371,7 +370,7 @@ def _fetch_intraday_series(symbol: str) -> Optional[pd.Series]:
 
 
 @st.cache_data(ttl=60)
-def _fetch_price_ohlc(symbol: str, range_value: str, interval: str) -> Optional[pd.DataFrame]:
+def _fetch_price_ohlc(symbol: str, range_value: str, interval: str) -> pd.DataFrame | None:
     endpoint = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
     try:
         response = requests.get(
@@ -412,7 +411,7 @@ def _fetch_price_ohlc(symbol: str, range_value: str, interval: str) -> Optional[
     return _limit_ohlc_range(df, range_value)
 
 
-def _fetch_price_ohlc_stooq(symbol: str, range_value: str) -> Optional[pd.DataFrame]:
+def _fetch_price_ohlc_stooq(symbol: str, range_value: str) -> pd.DataFrame | None:
     stooq_symbol = _normalize_stooq_symbol(symbol)
     if not stooq_symbol:
         return None
@@ -465,7 +464,7 @@ def _fetch_price_ohlc_stooq(symbol: str, range_value: str) -> Optional[pd.DataFr
     return df
 
 
-def _render_price_chart(symbol: str) -> Optional[pd.DataFrame]:
+def _render_price_chart(symbol: str) -> pd.DataFrame | None:
     st.markdown("### Price Chart")
     ranges = {
         "1D": ("1d", "5m"),
@@ -554,22 +553,18 @@ def _render_insights(ohlc: pd.DataFrame) -> None:
         st.info("Not enough data to build a snapshot.")
         return
     returns = close.pct_change().dropna()
-    sma20 = close.rolling(20).mean()
-    sma50 = close.rolling(50).mean()
+    values = close.to_numpy()
+    sma20 = cached("sma", values, window=20)
+    sma50 = cached("sma", values, window=50)
     latest = close.iloc[-1]
     trend = "Neutral"
-    if sma20.iloc[-1] > sma50.iloc[-1] and latest > sma20.iloc[-1]:
+    if sma20[-1] > sma50[-1] and latest > sma20[-1]:
         trend = "Bullish"
-    elif sma20.iloc[-1] < sma50.iloc[-1] and latest < sma20.iloc[-1]:
+    elif sma20[-1] < sma50[-1] and latest < sma20[-1]:
         trend = "Bearish"
     momentum = "Neutral"
     if len(close) >= 15:
-        delta = close.diff()
-        gain = delta.clip(lower=0).rolling(14).mean()
-        loss = -delta.clip(upper=0).rolling(14).mean()
-        rs = gain / loss.replace(0, pd.NA)
-        rsi = 100 - (100 / (1 + rs))
-        last_rsi = rsi.iloc[-1]
+        last_rsi = cached("rsi", values, period=14)[-1]
         if last_rsi >= 70:
             momentum = "Overbought"
         elif last_rsi <= 30:
@@ -598,26 +593,22 @@ def _render_pattern_insights(ohlc: pd.DataFrame) -> None:
         st.info("Not enough data to build pattern insights.")
         return
 
-    sma20 = close.rolling(20).mean()
-    sma50 = close.rolling(50).mean()
-    trend_score = 1 if sma20.iloc[-1] > sma50.iloc[-1] else -1
+    values = close.to_numpy()
+    sma20 = cached("sma", values, window=20)
+    sma50 = cached("sma", values, window=50)
+    trend_score = 1 if sma20[-1] > sma50[-1] else -1
 
-    rolling_high = close.rolling(20).max()
-    rolling_low = close.rolling(20).min()
+    rolling_high = cached("rolling_max", values, window=20)
+    rolling_low = cached("rolling_min", values, window=20)
     breakout_score = 0
-    if close.iloc[-1] >= rolling_high.iloc[-1]:
+    if close.iloc[-1] >= rolling_high[-1]:
         breakout_score = 1
-    elif close.iloc[-1] <= rolling_low.iloc[-1]:
+    elif close.iloc[-1] <= rolling_low[-1]:
         breakout_score = -1
 
     momentum_score = 0
     if len(close) >= 15:
-        delta = close.diff()
-        gain = delta.clip(lower=0).rolling(14).mean()
-        loss = -delta.clip(upper=0).rolling(14).mean()
-        rs = gain / loss.replace(0, pd.NA)
-        rsi = 100 - (100 / (1 + rs))
-        last_rsi = rsi.iloc[-1]
+        last_rsi = cached("rsi", values, period=14)[-1]
         if last_rsi >= 70:
             momentum_score = -0.5
         elif last_rsi <= 30:
@@ -656,7 +647,7 @@ def _render_pattern_insights(ohlc: pd.DataFrame) -> None:
     )
 
 
-def _fetch_intraday_series_stooq(symbol: str) -> Optional[pd.Series]:
+def _fetch_intraday_series_stooq(symbol: str) -> pd.Series | None:
     stooq_symbol = _normalize_stooq_symbol(symbol)
     if not stooq_symbol:
         return None
@@ -701,7 +692,7 @@ def _fetch_intraday_series_stooq(symbol: str) -> Optional[pd.Series]:
     return series if not series.empty else None
 
 
-def _normalize_stooq_symbol(symbol: str) -> Optional[str]:
+def _normalize_stooq_symbol(symbol: str) -> str | None:
     if not symbol:
         return None
     cleaned = symbol.strip().lower()
@@ -735,7 +726,7 @@ def _get_query_params() -> dict[str, list[str]]:
     return {}
 
 
-def _infer_region_from_coords(lat: float, lon: float) -> Optional[str]:
+def _infer_region_from_coords(lat: float, lon: float) -> str | None:
     if 24 <= lat <= 49 and -125 <= lon <= -66:
         return "US"
     if 42 <= lat <= 83 and -141 <= lon <= -52:
@@ -757,7 +748,7 @@ def _format_percent(value: float) -> str:
     return f"{value:.2%}"
 
 
-def _format_change(value: Optional[float]) -> str:
+def _format_change(value: float | None) -> str:
     if value is None:
         return "0.00%"
     sign = "+" if value >= 0 else ""
@@ -907,7 +898,7 @@ def _status_card(column, label: str, value: str, detail: str = "") -> None:
     )
 
 
-def _build_altair_chart(series: pd.Series, value_label: str, color: str) -> Optional["alt.Chart"]:
+def _build_altair_chart(series: pd.Series, value_label: str, color: str) -> alt.Chart | None:
     if alt is None or series is None or series.empty:
         return None
     df = series.to_frame(name=value_label).reset_index()
@@ -928,7 +919,7 @@ def _build_altair_chart(series: pd.Series, value_label: str, color: str) -> Opti
 
 
 def _build_activity_feed(
-    trades_df: Optional[pd.DataFrame], metrics_df: Optional[pd.DataFrame]
+    trades_df: pd.DataFrame | None, metrics_df: pd.DataFrame | None
 ) -> list[dict[str, Any]]:
     feed: list[dict[str, Any]] = []
     if trades_df is not None and not trades_df.empty:
@@ -1031,12 +1022,54 @@ digraph {{
     return graph
 
 
-def _run_backtest(config_path: Path) -> tuple[BacktestResult, Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+def _run_backtest(config_path: Path) -> tuple[BacktestResult, pd.DataFrame | None, pd.DataFrame | None]:
     app = SilkRoadApp.from_file(str(config_path))
-    result = app.run_backtest()
-    trades = _fetch_recent_trades(app.analytics)
-    metrics = _fetch_recent_metrics(app.analytics)
-    return result, trades, metrics
+    try:
+        result = app.run_backtest()
+    finally:
+        if app.analytics:
+            app.analytics.close()
+    reader = _reader_for(config_path)
+    return result, _fetch_recent_trades(reader), _fetch_recent_metrics(reader)
+
+
+def _load_stored_run(
+    config_path: Path, run_id: str
+) -> tuple[BacktestResult | None, pd.DataFrame | None, pd.DataFrame | None]:
+    """Read a logged backtest and its charts from the analytics store instead of rerunning it."""
+    reader = _reader_for(config_path)
+    if reader is None:
+        return None, None, None
+    result = reader.load_result(run_id)
+    return result, _fetch_recent_trades(reader), _fetch_recent_metrics(reader)
+
+
+def _recent_runs(config_path: Path, limit: int = 20) -> pd.DataFrame:
+    reader = _reader_for(config_path)
+    if reader is None:
+        return pd.DataFrame(columns=["run_id", "completed_at", "strategy"])
+    try:
+        return reader.recent_runs(limit=limit)
+    except Exception:
+        return pd.DataFrame(columns=["run_id", "completed_at", "strategy"])
+
+
+def _reader_for(config_path: Path) -> _Reader | None:
+    try:
+        config = load_config(str(config_path))
+    except Exception:
+        return None
+    analytics = config.analytics
+    if not analytics or not analytics.enabled:
+        return None
+    database = Path(analytics.database)
+    if not database.exists():
+        return None
+    if analytics.backend == "parquet":
+        return _parquet_reader(str(database.resolve()))
+    if analytics.backend != "sqlite":
+        return None
+    return _analytics_reader(str(database.resolve()))
 
 
 def main() -> None:
@@ -1179,6 +1212,23 @@ def main() -> None:
                     st.session_state["last_metrics"] = metrics
                     st.success("Backtest completed.")
 
+    runs = _recent_runs(config_path) if config_path.exists() else pd.DataFrame()
+    if not runs.empty:
+        st.sidebar.markdown("### Previous Runs")
+        run_labels = {
+            row.run_id: f"{row.completed_at:%b %d · %H:%M} · {row.strategy}"
+            for row in runs.itertuples()
+        }
+        selected_run = st.sidebar.selectbox(
+            "Stored backtest", list(run_labels), format_func=run_labels.get, key="stored_run"
+        )
+        if st.sidebar.button("Load stored run", key="load_stored_run"):
+            stored, stored_trades, stored_metrics = _load_stored_run(config_path, selected_run)
+            if stored is not None:
+                st.session_state["last_result"] = stored
+                st.session_state["last_trades"] = stored_trades
+                st.session_state["last_metrics"] = stored_metrics
+
     config_col, preview_col = st.columns([1, 2])
     with config_col:
         st.subheader("Your Bot Recipe")
@@ -1323,23 +1373,25 @@ def main() -> None:
         chart_col1, chart_col2 = st.columns(2)
         with chart_col1:
             st.markdown("### Price History")
-            if result.price_series is not None and not result.price_series.empty:
-                chart = _build_altair_chart(result.price_series, "price", "#8fffc2")
+            price_series = result.series("price_series")
+            if price_series is not None and not price_series.empty:
+                chart = _build_altair_chart(price_series, "price", "#8fffc2")
                 if chart is not None:
                     st.altair_chart(chart, use_container_width=True)
                 else:
-                    price_df = result.price_series.to_frame(name="price")
+                    price_df = price_series.to_frame(name="price")
                     st.line_chart(price_df, use_container_width=True)
             else:
                 st.info("Price series not available for this run.")
         with chart_col2:
             st.markdown("### Equity Curve")
-            if result.equity_curve is not None and not result.equity_curve.empty:
-                chart = _build_altair_chart(result.equity_curve, "equity", "#66c2ff")
+            equity_curve = result.series("equity_curve")
+            if equity_curve is not None and not equity_curve.empty:
+                chart = _build_altair_chart(equity_curve, "equity", "#66c2ff")
                 if chart is not None:
                     st.altair_chart(chart, use_container_width=True)
                 else:
-                    equity_df = result.equity_curve.to_frame(name="equity")
+                    equity_df = equity_curve.to_frame(name="equity")
                     st.line_chart(equity_df, use_container_width=True)
             else:
                 st.info("Equity curve not available.")
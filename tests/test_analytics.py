@@ -0,0 +1,213 @@
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from silkroad.analytics import AsyncAnalyticsStore
+from silkroad.analytics.logger import SCHEMA_VERSION, AnalyticsStore, TradeRecord, to_epoch_ns
+
+
+def _trade(price: float) -> TradeRecord:
+    return TradeRecord(
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        symbol="BTC/USDT",
+        side="buy",
+        quantity=1.0,
+        price=price,
+        strategy="momentum",
+        source="test",
+    )
+
+
+def _count(path) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0]
+
+
+def test_buffered_store_flushes_on_threshold_and_close(tmp_path):
+    path = tmp_path / "analytics.db"
+    store = AnalyticsStore(str(path), buffer_size=3)
+    for price in (1.0, 2.0):
+        store.log_trade(_trade(price))
+    assert _count(path) == 0
+    store.log_trade(_trade(3.0))
+    assert _count(path) == 3
+    store.log_trade(_trade(4.0))
+    store.close()
+    assert _count(path) == 4
+
+
+def test_failed_flush_keeps_records_buffered(tmp_path):
+    path = tmp_path / "analytics.db"
+    store = AnalyticsStore(str(path), buffer_size=10)
+    store.log_trade(_trade(1.0))
+    store.conn.execute(
+        "CREATE TEMP TRIGGER reject BEFORE INSERT ON trades BEGIN SELECT RAISE(ABORT, 'full'); END"
+    )
+    with pytest.raises(sqlite3.IntegrityError):
+        store.flush()
+    store.conn.execute("DROP TRIGGER reject")
+    store.close()
+    assert _count(path) == 1
+
+
+def test_background_writer_drains_queue_on_close(tmp_path):
+    path = tmp_path / "analytics.db"
+    store = AsyncAnalyticsStore(str(path), queue_size=16, batch_size=50)
+    for price in range(200):
+        store.log_trade(_trade(float(price)))
+    store.close()
+    assert _count(path) == 200
+    assert store.dropped == 0
+    with pytest.raises(RuntimeError):
+        store.log_trade(_trade(1.0))
+
+
+class _FlakyStore:
+    def __init__(self) -> None:
+        self.trades: list[TradeRecord] = []
+
+    def log_trade(self, record: TradeRecord) -> None:
+        if record.price < 0:
+            raise ValueError("negative price")
+        if record.price == 0:
+            raise SystemExit("writer killed")
+        self.trades.append(record)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_background_writer_skips_failing_records(tmp_path):
+    inner = _FlakyStore()
+    store = AsyncAnalyticsStore(str(tmp_path / "unused.db"), store_factory=lambda: inner)
+    for price in (1.0, -1.0, 2.0):
+        store.log_trade(_trade(price))
+    store.flush(timeout=5)
+    assert [trade.price for trade in inner.trades] == [1.0, 2.0]
+    assert isinstance(store.last_error, ValueError)
+    store.close()
+
+
+def test_background_writer_reports_dead_thread(tmp_path):
+    store = AsyncAnalyticsStore(str(tmp_path / "unused.db"), store_factory=_FlakyStore)
+    store.log_trade(_trade(0.0))
+    store._thread.join(timeout=5)
+    with pytest.raises(RuntimeError):
+        store.log_trade(_trade(1.0))
+    with pytest.raises(RuntimeError):
+        store.flush(timeout=5)
+    with pytest.raises(RuntimeError):
+        store.close()
+
+
+def test_legacy_text_schema_is_upgraded_in_place(tmp_path):
+    path = tmp_path / "analytics.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE trades (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, "
+            "symbol TEXT NOT NULL, side TEXT NOT NULL, quantity REAL NOT NULL, "
+            "price REAL NOT NULL, strategy TEXT NOT NULL, source TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO trades (timestamp, symbol, side, quantity, price, strategy, source) "
+            "VALUES ('2024-01-01T00:00:00', 'BTC/USDT', 'buy', 1.0, 10.0, 'momentum', 'paper')"
+        )
+
+    store = AnalyticsStore(str(path))
+    store.log_trade(_trade(11.0))
+    assert store.conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    stamps = [row[0] for row in store.conn.execute("SELECT timestamp FROM trades")]
+    assert stamps == [to_epoch_ns(datetime(2024, 1, 1))] * 2
+    plan = store.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM trades ORDER BY timestamp DESC LIMIT 5"
+    ).fetchall()
+    assert "idx_trades_timestamp" in str(plan)
+    store.close()
+
+
+def test_parquet_backend_appends_partitions_and_filters_reads(tmp_path):
+    pytest.importorskip("pyarrow")
+    from silkroad.analytics import ParquetAnalyticsStore
+
+    store = ParquetAnalyticsStore(str(tmp_path / "analytics"), buffer_size=2)
+    for day, symbol in [(1, "BTC/USDT"), (1, "ETH/USDT"), (2, "BTC/USDT"), (3, "BTC/USDT")]:
+        record = _trade(float(day))
+        record.timestamp = datetime(2024, 1, day, 12, tzinfo=timezone.utc)
+        record.symbol = symbol
+        store.log_trade(record)
+    store.close()
+
+    partitions = sorted(path.name for path in (tmp_path / "analytics" / "trades").iterdir())
+    assert partitions == ["date=2024-01-01", "date=2024-01-02", "date=2024-01-03"]
+    trades = store.read_trades(
+        start=datetime(2024, 1, 1), end=datetime(2024, 1, 3), symbol="BTC/USDT"
+    )
+    assert trades["price"].tolist() == [1.0, 2.0]
+
+
+def test_parquet_reader_reads_only_the_newest_partitions(tmp_path):
+    pytest.importorskip("pyarrow")
+    from silkroad.analytics import ParquetAnalyticsReader, ParquetAnalyticsStore
+
+    root = tmp_path / "analytics"
+    assert ParquetAnalyticsReader(str(root)).recent_trades(5).empty
+    assert not root.exists()
+
+    store = ParquetAnalyticsStore(str(root))
+    for day in (1, 2, 3, 3):
+        record = _trade(float(day))
+        record.timestamp = datetime(2024, 1, day, day, tzinfo=timezone.utc)
+        store.log_trade(record)
+    store.close()
+    # An unreadable file in the oldest partition shows that partition is never opened.
+    (root / "trades" / "date=2024-01-01" / "broken.parquet").write_text("not parquet")
+
+    reader = ParquetAnalyticsReader(str(root))
+    assert reader.recent_trades(3)["price"].tolist() == [3.0, 3.0, 2.0]
+
+
+def test_background_parquet_writer_keeps_store_batching(tmp_path):
+    pytest.importorskip("pyarrow")
+    from silkroad.analytics import ParquetAnalyticsStore
+
+    root = tmp_path / "analytics"
+    inner = ParquetAnalyticsStore(str(root), buffer_size=100)
+    store = AsyncAnalyticsStore(str(root), store_factory=lambda: inner, flush_on_drain=False)
+    trades = [_trade(float(price)) for price in range(6)]
+    for minute, trade in enumerate(trades):
+        trade.timestamp = datetime(2024, 1, 1, 0, minute, tzinfo=timezone.utc)
+    for trade in trades[:5]:
+        store.log_trade(trade)
+    store.flush(timeout=5)
+    store.log_trade(trades[5])
+    store.close()
+
+    assert len(list((root / "trades").rglob("*.parquet"))) == 2
+    assert inner.recent_trades(2)["price"].tolist() == [5.0, 4.0]
+
+
+def test_reader_serves_threads_read_only_while_store_writes(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from silkroad.analytics import AnalyticsReader
+
+    path = tmp_path / "analytics.db"
+    store = AnalyticsStore(str(path))
+    store.log_trade(_trade(1.0))
+    reader = AnalyticsReader(str(path), pool_size=2)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        counts = list(pool.map(lambda _: len(reader.recent_trades(10)), range(8)))
+    store.log_trade(_trade(2.0))
+
+    assert counts == [1] * 8
+    assert sorted(reader.recent_trades(10)["price"]) == [1.0, 2.0]
+    with pytest.raises(sqlite3.OperationalError), reader.connection() as conn:
+        conn.execute("DELETE FROM trades")
+    assert len(reader._connections) <= reader.pool_size
+    reader.close()
+    store.close()
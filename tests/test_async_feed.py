@@ -0,0 +1,130 @@
+import asyncio
+import time
+from itertools import pairwise
+
+import pytest
+
+from silkroad.data.async_ccxt_feed import AsyncCCXTFeed, WatchCandleSource
+
+HOUR_MS = 3_600_000
+START_MS = 1_700_000_000_000 - 1_700_000_000_000 % HOUR_MS
+
+
+class WebsocketStandIn:
+    """Local stand-in for a ccxt.pro client: candles are pushed into per-symbol queues."""
+
+    def __init__(self, symbols):
+        self.queues = {symbol: asyncio.Queue() for symbol in symbols}
+        self.closed = False
+
+    async def fetch_ohlcv(self, symbol, timeframe="1h", since=None, limit=None):
+        return [[START_MS + i * HOUR_MS, 1.0, 2.0, 0.5, 1.0 + i, 1.0] for i in range(limit)]
+
+    async def watch_ohlcv(self, symbol, timeframe="1h"):
+        return await self.queues[symbol].get()
+
+    async def close(self):
+        self.closed = True
+
+
+class HistoryStandIn:
+    """Synchronous client serving the feed's history requests."""
+
+    def __init__(self, rate_limit=0):
+        self.rateLimit = rate_limit
+        self.calls = []
+
+    def fetch_ohlcv(self, symbol, timeframe="1h", since=None, limit=None):
+        self.calls.append(time.monotonic())
+        return [[START_MS + i * HOUR_MS, 1.0, 2.0, 0.5, 1.0 + i, 1.0] for i in range(limit)]
+
+
+def test_async_feed_multiplexes_symbols_as_candles_arrive():
+    symbols = ["BTC/USD", "ETH/USD"]
+
+    async def scenario():
+        client = WebsocketStandIn(symbols)
+        feed = AsyncCCXTFeed(
+            "kraken",
+            symbols,
+            "1h",
+            lookback=5,
+            source=WatchCandleSource(client),
+            client=client,
+            history_client=HistoryStandIn(),
+        )
+        stream = feed.stream()
+        initial = [await stream.__anext__() for _ in symbols]
+
+        await client.queues["ETH/USD"].put([[START_MS + 5 * HOUR_MS, 1.0, 2.0, 0.5, 9.0, 1.0]])
+        symbol, snapshot = await stream.__anext__()
+        await stream.aclose()
+        await feed.close()
+        return initial, symbol, snapshot, client
+
+    initial, symbol, snapshot, client = asyncio.run(scenario())
+
+    assert [name for name, _ in initial] == symbols
+    assert symbol == "ETH/USD"
+    assert snapshot.latest("close") == 9.0
+    assert len(snapshot.history()) == 5
+    assert client.closed
+
+
+def test_async_feed_spaces_history_requests_across_symbols():
+    symbols = ["BTC/USD", "ETH/USD", "SOL/USD", "XRP/USD"]
+    history_client = HistoryStandIn(rate_limit=20)
+
+    async def scenario():
+        client = WebsocketStandIn(symbols)
+        feed = AsyncCCXTFeed(
+            "kraken",
+            symbols,
+            "1h",
+            lookback=5,
+            source=WatchCandleSource(client),
+            client=client,
+            history_client=history_client,
+        )
+        stream = feed.stream()
+        for _ in symbols:
+            await stream.__anext__()
+        await stream.aclose()
+        await feed.close()
+
+    asyncio.run(scenario())
+
+    starts = sorted(history_client.calls)
+    assert len(starts) == len(symbols)
+    assert min(b - a for a, b in pairwise(starts)) >= 0.015
+
+
+class FlakyWebsocket(WebsocketStandIn):
+    def __init__(self, symbols, failures):
+        super().__init__(symbols)
+        self.failures = failures
+
+    async def watch_ohlcv(self, symbol, timeframe="1h"):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("socket dropped")
+        return await super().watch_ohlcv(symbol, timeframe)
+
+
+def test_watch_source_retries_then_surfaces_repeated_failures():
+    async def collect(client, source):
+        await client.queues["BTC/USD"].put([[START_MS, 1.0, 2.0, 0.5, 1.5, 1.0]])
+        candles = source.candles(["BTC/USD"], "1h")
+        try:
+            return await asyncio.wait_for(candles.__anext__(), timeout=5)
+        finally:
+            await candles.aclose()
+
+    client = FlakyWebsocket(["BTC/USD"], failures=2)
+    source = WatchCandleSource(client, retry_delay=0.001, max_failures=3)
+    assert asyncio.run(collect(client, source))[0] == "BTC/USD"
+
+    client = FlakyWebsocket(["BTC/USD"], failures=3)
+    source = WatchCandleSource(client, retry_delay=0.001, max_failures=3)
+    with pytest.raises(ConnectionError):
+        asyncio.run(collect(client, source))
@@ -1,4 +1,13 @@
+import numpy as np
+import pandas as pd
+import pytest
+
 from silkroad.app import SilkRoadApp
+from silkroad.backtesting import EXECUTOR_REGISTRY, register_executor
+from silkroad.backtesting.engine import BacktestEngine
+from silkroad.config.settings import BacktestConfig, DataFeedConfig
+from silkroad.risk.manager import RiskManager
+from silkroad.strategy.momentum import MomentumStrategy
 
 
 def test_backtest_returns_result(tmp_path):
@@ -35,3 +44,192 @@ backtest:
 
     assert result.strategy_name == "momentum"
     assert result.starting_cash == 10000
+
+
+def _random_walk_history(periods: int = 1500) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, periods)))
+    open_ = np.r_[close[0], close[:-1]] * (1 + rng.normal(0, 0.001, periods))
+    index = pd.date_range("2023-01-01", periods=periods, freq="h", tz="UTC")
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) * 1.002,
+            "low": np.minimum(open_, close) * 0.998,
+            "close": close,
+            "volume": 1.0,
+        },
+        index=index,
+    )
+
+
+def test_vectorized_engine_matches_backtrader():
+    data_config = DataFeedConfig(
+        source="static",
+        symbol="TEST/USDT",
+        interval="1h",
+        lookback=1500,
+        parameters={"data": _random_walk_history()},
+    )
+    results = {}
+    for engine in ("backtrader", "vectorized"):
+        config = BacktestConfig(
+            starting_cash=10_000, commission=0.001, slippage=0.0005, engine=engine
+        )
+        strategy = MomentumStrategy(fast_window=5, slow_window=20, threshold=0.05, order_size=0.1)
+        results[engine] = BacktestEngine(strategy, config, data_config, RiskManager()).run()
+
+    expected, actual = results["backtrader"], results["vectorized"]
+    assert actual.total_trades == expected.total_trades > 0
+    assert actual.ending_value == pytest.approx(expected.ending_value, rel=1e-9)
+    expected_equity = expected.equity_curve.to_numpy()
+    assert actual.equity_curve.to_numpy() == pytest.approx(expected_equity, rel=1e-9)
+
+
+def test_backtest_result_is_reloaded_from_analytics_store(tmp_path):
+    from silkroad.analytics import AnalyticsReader
+    from silkroad.analytics.logger import AnalyticsStore
+
+    history = _random_walk_history(400)
+    store = AnalyticsStore(str(tmp_path / "analytics.db"))
+    engine = BacktestEngine(
+        strategy=MomentumStrategy(fast_window=5, slow_window=20),
+        config=BacktestConfig(engine="vectorized"),
+        data_feed_config=DataFeedConfig(source="static", symbol="TEST", interval="1h"),
+        risk_manager=RiskManager(),
+        analytics=store,
+        history=history,
+    )
+    result = engine.run()
+
+    stored = store.load_result(result.run_id)
+    assert stored.ending_value == result.ending_value
+    assert stored.equity_curve is None
+    pd.testing.assert_series_equal(
+        stored.series("equity_curve"),
+        result.equity_curve,
+        check_names=False,
+        check_freq=False,
+        check_index_type=False,
+    )
+    assert list(store.recent_runs()["run_id"]) == [result.run_id]
+    store.close()
+
+    reader = AnalyticsReader(str(tmp_path / "analytics.db"), pool_size=1)
+    loaded = reader.load_result(result.run_id)
+    reader.close()
+    assert loaded.series("equity_curve").tolist() == result.equity_curve.tolist()
+
+
+def test_portfolio_backtest_matches_backtrader_across_engines():
+    rng = np.random.default_rng(7)
+    late = _random_walk_history(900).iloc[50:]
+    late = late.drop(late.index[rng.choice(len(late), 40, replace=False)])
+    histories = {
+        "AAA": _random_walk_history(800),
+        "BBB": late,
+        "CCC": _random_walk_history(700) * 3,
+    }
+    data_config = DataFeedConfig(
+        source="static", symbol="AAA", symbols=list(histories), interval="1h"
+    )
+    results = {}
+    for engine in ("backtrader", "vectorized"):
+        config = BacktestConfig(
+            starting_cash=10_000, commission=0.01, slippage=0.0005, engine=engine
+        )
+        strategy = MomentumStrategy(fast_window=5, slow_window=20, threshold=0.05, order_size=1.0)
+        engine_run = BacktestEngine(strategy, config, data_config, None, history=histories)
+        results[engine] = engine_run.run()
+
+    expected, actual = results["backtrader"], results["vectorized"]
+    assert actual.total_trades == expected.total_trades > 0
+    assert actual.ending_value == pytest.approx(expected.ending_value, rel=1e-9)
+    expected_equity = expected.equity_curve.to_numpy()
+    assert actual.equity_curve.to_numpy() == pytest.approx(expected_equity, rel=1e-9)
+    assert actual.extra_metrics == pytest.approx(expected.extra_metrics, rel=1e-9)
+    assert actual.price_series is None
+
+
+def test_result_cache_reuses_identical_runs_and_evicts(tmp_path, monkeypatch):
+    history = _random_walk_history(400)
+    config = BacktestConfig(engine="vectorized", cache_dir=str(tmp_path / "cache"), cache_entries=2)
+    data_config = DataFeedConfig(source="static", symbol="TEST", interval="1h")
+
+    def run(fast_window: int):
+        strategy = MomentumStrategy(fast_window=fast_window, slow_window=20)
+        return BacktestEngine(strategy, config, data_config, RiskManager(), history=history).run()
+
+    first = run(5)
+    monkeypatch.setattr(BacktestEngine, "_simulate", lambda *args: pytest.fail("cache missed"))
+    config = config.model_copy(update={"bootstrap_workers": 4})  # does not change the result
+    second = run(5)
+
+    assert second.run_id != first.run_id
+    assert second.ending_value == first.ending_value
+    pd.testing.assert_series_equal(second.equity_curve, first.equity_curve)
+
+    monkeypatch.undo()
+    run(6)
+    run(7)
+    assert len(list((tmp_path / "cache").glob("*.pkl"))) == 2
+
+
+def test_chunked_backtest_matches_full_run():
+    history = _random_walk_history(1500)
+    data_config = DataFeedConfig(source="static", symbol="TEST", interval="1h")
+    results = {}
+    for chunk_size in (None, 97):
+        config = BacktestConfig(engine="vectorized", slippage=0.0005, chunk_size=chunk_size)
+        strategy = MomentumStrategy(fast_window=5, slow_window=20, threshold=0.05, order_size=1.0)
+        engine = BacktestEngine(strategy, config, data_config, None, history=history)
+        results[chunk_size] = engine.run()
+
+    expected, actual = results[None], results[97]
+    assert actual.total_trades == expected.total_trades > 0
+    assert actual.ending_value == pytest.approx(expected.ending_value, rel=1e-12)
+    assert actual.sharpe_ratio == pytest.approx(expected.sharpe_ratio, rel=1e-9)
+    assert actual.extra_metrics == pytest.approx(expected.extra_metrics, rel=1e-9)
+    pd.testing.assert_series_equal(actual.returns_series, expected.returns_series, rtol=1e-9)
+    day_end_close = expected.price_series.groupby(expected.price_series.index.normalize()).last()
+    pd.testing.assert_series_equal(actual.price_series, day_end_close, check_names=False)
+
+
+class _PerBarMomentum(MomentumStrategy):
+    def generate_signals(self, data):
+        return None
+
+
+def test_bar_loop_executor_matches_vectorized_for_batch_and_per_bar_signals(monkeypatch):
+    history = _random_walk_history(1500)
+    data_config = DataFeedConfig(source="static", symbol="TEST", interval="1h")
+    results = {}
+    for engine in ("vectorized", "barloop"):
+        for strategy_cls in (MomentumStrategy, _PerBarMomentum):
+            config = BacktestConfig(engine=engine, slippage=0.0005)
+            strategy = strategy_cls(fast_window=5, slow_window=20, threshold=0.05, order_size=0.1)
+            backtest = BacktestEngine(strategy, config, data_config, RiskManager(), history=history)
+            run = backtest.run()
+            results[engine, strategy_cls] = run
+
+    expected = results["vectorized", MomentumStrategy]
+    assert expected.total_trades > 0
+    for actual in results.values():
+        assert actual.total_trades == expected.total_trades
+        assert actual.ending_value == pytest.approx(expected.ending_value, rel=1e-12)
+        assert actual.extra_metrics == pytest.approx(expected.extra_metrics, rel=1e-12)
+
+    registry = dict(EXECUTOR_REGISTRY)
+    monkeypatch.setattr("silkroad.backtesting.executors.EXECUTOR_REGISTRY", registry)
+    calls = []
+
+    @register_executor("recording")
+    def recording(engine, legs):
+        calls.append([leg.symbol for leg in legs])
+        return EXECUTOR_REGISTRY["barloop"](engine, legs)
+
+    config = BacktestConfig(engine="recording", slippage=0.0005)
+    strategy = MomentumStrategy(fast_window=5, slow_window=20, threshold=0.05, order_size=0.1)
+    result = BacktestEngine(strategy, config, data_config, RiskManager(), history=history).run()
+    assert calls == [["TEST"]]
+    assert result.ending_value == pytest.approx(expected.ending_value, rel=1e-12)
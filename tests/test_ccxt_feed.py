@@ -0,0 +1,88 @@
+import threading
+import time
+
+from silkroad.data.ccxt_feed import CCXTFeed
+
+HOUR_MS = 3_600_000
+
+
+class RecordedExchange:
+    """Replays recorded OHLCV rows the way ccxt's fetch_ohlcv would serve them."""
+
+    def __init__(self, rows, now, cap=None, rate_limit=0):
+        self.rows = rows
+        self.now = now
+        self.cap = cap
+        self.rateLimit = rate_limit
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def parse_timeframe(self, timeframe):
+        return 3600
+
+    def milliseconds(self):
+        return self.now
+
+    def fetch_ohlcv(self, symbol, timeframe="1h", since=None, limit=None):
+        with self._lock:
+            self.calls.append({"since": since, "limit": limit, "at": time.monotonic()})
+        limit = min(limit, self.cap) if self.cap else limit
+        available = [row for row in self.rows if row[0] <= self.now]
+        if since is not None:
+            return [row for row in available if row[0] >= since][:limit]
+        return available[-limit:]
+
+
+def _recorded_rows(count):
+    start = 1_700_000_000_000 - 1_700_000_000_000 % HOUR_MS
+    return [
+        [start + i * HOUR_MS, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 1.0] for i in range(count)
+    ]
+
+
+def test_load_history_tops_up_cache_with_missing_tail(tmp_path):
+    rows = _recorded_rows(60)
+    exchange = RecordedExchange(rows, now=rows[49][0])
+    feed = CCXTFeed(
+        "kraken", "BTC/USD", "1h", lookback=30, cache_dir=str(tmp_path), client=exchange
+    )
+
+    first = feed.load_history()
+    assert len(first) == 30
+    assert (exchange.calls[-1]["since"], exchange.calls[-1]["limit"]) == (None, 30)
+
+    exchange.now = rows[52][0]
+    second = feed.load_history()
+    assert (exchange.calls[-1]["since"], exchange.calls[-1]["limit"]) == (rows[49][0], 4)
+    assert len(second) == 30
+    assert second["open"].iloc[-1] == rows[52][1]
+    assert int(second.index[0].value // 1_000_000) == rows[23][0]
+
+
+def test_deep_lookback_is_paginated_within_rate_limit():
+    rows = _recorded_rows(120)
+    exchange = RecordedExchange(rows, now=rows[-1][0], cap=7, rate_limit=5)
+    feed = CCXTFeed(
+        "kraken", "BTC/USD", "1h", lookback=100, page_limit=10, max_concurrency=4, client=exchange
+    )
+
+    history = feed.load_history()
+
+    assert len(history) == 100
+    assert history.index.is_unique and history.index.is_monotonic_increasing
+    assert history["open"].tolist() == [row[1] for row in rows[-100:]]
+    starts = [call["at"] for call in exchange.calls]
+    assert max(starts) - min(starts) >= (len(starts) - 2) * 0.005
+
+
+def test_iter_history_pages_through_cached_bars(tmp_path):
+    rows = _recorded_rows(60)
+    exchange = RecordedExchange(rows, now=rows[-1][0])
+    feed = CCXTFeed(
+        "kraken", "BTC/USD", "1h", lookback=50, cache_dir=str(tmp_path), client=exchange
+    )
+
+    blocks = list(feed.iter_history(16))
+
+    assert [len(block) for block in blocks] == [16, 16, 16, 2]
+    assert [open_ for block in blocks for open_ in block["open"]] == [row[1] for row in rows[-50:]]
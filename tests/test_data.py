@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+from silkroad.data.base import HistoryCursor
+from silkroad.data.ring import OHLCVRingBuffer
+from silkroad.data.shared import SharedHistory
+
+
+def test_history_cursor_exposes_views_up_to_position():
+    index = pd.date_range("2024-01-01", periods=5, freq="h")
+    frame = pd.DataFrame({"close": np.arange(5.0)}, index=index)
+    cursor = HistoryCursor.from_frame(frame)
+
+    cursor.position = 2
+    assert cursor.latest("close") == 2.0
+    assert cursor.latest("spread") is None
+    assert len(cursor.history()) == 3
+    assert np.shares_memory(cursor.column("close"), cursor.columns["close"])
+
+    cursor.position = 4
+    assert cursor.history().index[-1] == index[-1]
+
+
+def test_shared_history_round_trips_read_only_views():
+    index = pd.date_range("2024-01-01", periods=4, freq="h", tz="UTC")
+    frame = pd.DataFrame({"close": np.arange(4.0), "volume": np.arange(4)}, index=index)
+
+    with SharedHistory.publish(frame) as published:
+        attached = SharedHistory.attach(published.handle)
+        view = attached.frame()
+        assert view.equals(frame)
+        assert not view["close"].to_numpy().flags.writeable
+        del view
+        attached.close()
+
+
+def test_ring_buffer_upserts_in_place_and_keeps_latest_window():
+    index = pd.date_range("2024-01-01", periods=3, freq="h", tz="UTC")
+    frame = pd.DataFrame(
+        {"open": 1.0, "high": 2.0, "low": 0.5, "close": [1.0, 2.0, 3.0], "volume": 1.0}, index=index
+    )
+    buffer = OHLCVRingBuffer.from_frame(frame, capacity=3)
+
+    last_ms = int(index[-1].value // 1_000_000)
+    buffer.extend_ohlcv(
+        [[last_ms, 1.0, 2.0, 0.5, 3.5, 2.0], [last_ms + 3_600_000, 1.0, 2.0, 0.5, 4.0, 1.0]]
+    )
+
+    snapshot = buffer.snapshot()
+    assert len(buffer) == 3
+    assert snapshot.column("close").tolist() == [2.0, 3.5, 4.0]
+    assert snapshot.latest("close") == 4.0
+    assert snapshot.history().index[0] == index[1]
+    assert snapshot.history().index.is_unique
@@ -0,0 +1,64 @@
+import sqlite3
+
+from silkroad.app import SilkRoadApp
+from silkroad.data.base import MarketDataFeed
+
+
+def test_portfolio_paper_engine_trades_every_symbol_from_one_loop(tmp_path):
+    database = tmp_path / "analytics.db"
+    sample_config = tmp_path / "config.yml"
+    sample_config.write_text(
+        f"""
+environment: paper
+data:
+  source: static
+  symbol: BTC/USDT
+  symbols: [BTC/USDT, ETH/USDT, SOL/USDT]
+  interval: 1h
+  lookback: 60
+strategy:
+  name: momentum
+  parameters:
+    fast_window: 5
+    slow_window: 10
+execution:
+  name: paper_portfolio
+analytics:
+  enabled: true
+  database: {database}
+""",
+        encoding="utf-8",
+    )
+
+    app = SilkRoadApp.from_file(str(sample_config))
+    app.run_live()
+    app.analytics.close()
+
+    with sqlite3.connect(database) as conn:
+        rows = conn.execute("SELECT symbol FROM trades WHERE source = 'paper'")
+        symbols = {row[0] for row in rows}
+    assert symbols == {"BTC/USDT", "ETH/USDT", "SOL/USDT"}
+
+
+def test_single_symbol_paper_engine_keeps_the_sync_feed_when_symbols_are_set(tmp_path):
+    sample_config = tmp_path / "config.yml"
+    sample_config.write_text(
+        """
+environment: paper
+data:
+  source: static
+  symbol: BTC/USDT
+  symbols: [BTC/USDT, ETH/USDT]
+  interval: 1h
+  lookback: 60
+strategy:
+  name: momentum
+execution:
+  name: paper
+""",
+        encoding="utf-8",
+    )
+
+    app = SilkRoadApp.from_file(str(sample_config))
+
+    assert isinstance(app.data_feed, MarketDataFeed)
@@ -0,0 +1,87 @@
+import gc
+import sys
+
+import numpy as np
+import pandas as pd
+
+from silkroad.indicators import IndicatorCache, rsi, sma
+
+
+def _prices(count=300, seed=3):
+    return 100 + np.cumsum(np.random.default_rng(seed).normal(0, 1, count))
+
+
+def test_rsi_matches_wilder_recursion():
+    prices = _prices()
+    delta = np.diff(prices)
+    gains, losses = np.clip(delta, 0, None), np.clip(-delta, 0, None)
+    avg_gain, avg_loss = gains[:14].mean(), losses[:14].mean()
+    expected = [100 - 100 / (1 + avg_gain / avg_loss)]
+    for gain, loss in zip(gains[14:], losses[14:], strict=True):
+        avg_gain = (avg_gain * 13 + gain) / 14
+        avg_loss = (avg_loss * 13 + loss) / 14
+        expected.append(100 - 100 / (1 + avg_gain / avg_loss))
+
+    result = rsi(prices, 14)
+    assert np.isnan(result[:14]).all()
+    np.testing.assert_allclose(result[14:], expected)
+
+
+def test_cache_reuses_results_for_views_of_the_same_column():
+    frame = pd.DataFrame({"close": _prices()})
+    cache = IndicatorCache()
+    first = cache.compute("sma", frame["close"], window=20)
+    again = cache.compute("sma", frame.copy(deep=False)["close"], window=20)
+    other = cache.compute("sma", frame["close"], window=50)
+
+    assert again is first
+    assert other is not first
+    assert (cache.hits, cache.misses) == (1, 2)
+    np.testing.assert_allclose(first, sma(frame["close"].to_numpy(), 20))
+
+
+def test_cache_is_bounded_by_bytes_and_holds_no_inputs():
+    prices = _prices()
+    cache = IndicatorCache(max_bytes=2 * prices.nbytes)
+    for window in (5, 10, 20):
+        cache.compute("sma", prices, window=window)
+
+    assert len(cache) == 2 and cache.nbytes <= cache.max_bytes
+    del prices
+    gc.collect()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_cache_skips_inputs_that_needed_conversion():
+    cache = IndicatorCache()
+    prices = _prices().tolist()
+    cache.compute("sma", prices, window=5)
+    cache.compute("sma", prices, window=5)
+
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 2)
+
+
+def test_cache_keeps_its_accounting_under_concurrent_sessions():
+    from concurrent.futures import ThreadPoolExecutor
+
+    base = _prices()[:200]
+    cache = IndicatorCache(max_bytes=6 * base.nbytes)  # small enough to evict constantly
+
+    def session(seed: int) -> None:
+        for step in range(500):
+            prices = base + seed
+            for window in (5, 10, 20):
+                cache.compute("sma", prices, window=window)
+            if step % 2 == 0:
+                cache.release(prices)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often enough to interleave cache updates
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(session, range(8)))
+    finally:
+        sys.setswitchinterval(interval)
+    gc.collect()
+
+    assert len(cache) == 0 and cache.nbytes == 0
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from silkroad.backtesting.metrics import max_drawdown, performance_metrics, trade_pnls
+from silkroad.backtesting.vectorized import Fill
+
+
+def test_trade_pnls_split_reversals_and_charge_commissions():
+    fills = [
+        Fill(position=1, size=10, price=100.0, commission=1.0),
+        Fill(position=3, size=-15, price=110.0, commission=1.5),  # closes +10, opens -5
+        Fill(position=5, size=5, price=100.0, commission=0.5),
+    ]
+
+    pnls = trade_pnls(fills)
+
+    assert pnls == pytest.approx([10 * 10 - 1.0 - 1.0, 5 * 10 - 0.5 - 0.5])
+
+
+def test_performance_metrics_report_drawdown_exposure_and_trades():
+    index = pd.date_range("2024-01-01", periods=6, freq="D")
+    equity = pd.Series([100.0, 110.0, 88.0, 99.0, 121.0, 121.0], index=index)
+    fills = [Fill(position=1, size=1, price=10.0, commission=0.0)]
+    fills.append(Fill(position=4, size=-1, price=12.0, commission=0.0))
+
+    metrics = performance_metrics(equity, fills, starting_cash=100.0)
+
+    assert max_drawdown(equity.to_numpy(), 100.0) == metrics["max_drawdown"] == pytest.approx(0.2)
+    assert metrics["exposure"] == pytest.approx(3 / 6)
+    assert metrics["turnover"] == pytest.approx(22.0 / np.mean(equity))
+    assert metrics["win_rate"] == 1.0
+    assert metrics["avg_trade_pnl"] == pytest.approx(2.0)
+    assert "profit_factor" not in metrics
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from silkroad.analytics.logger import AnalyticsStore
+from silkroad.backtesting.engine import BacktestEngine
+from silkroad.backtesting.robustness import (
+    BOOTSTRAP_METRICS,
+    bootstrap,
+    resample_metrics,
+    with_bootstrap,
+)
+from silkroad.config.settings import BacktestConfig, DataFeedConfig
+from silkroad.strategy.momentum import MomentumStrategy
+
+
+def test_bootstrap_is_reproducible_across_workers_and_brackets_the_run():
+    rng = np.random.default_rng(3)
+    index = pd.date_range("2023-01-01", periods=500, freq="D")
+    returns = pd.Series(rng.normal(0.001, 0.02, len(index)), index=index)
+
+    serial = bootstrap(returns, samples=2000, seed=11, batch_size=300)
+    parallel = bootstrap(returns, samples=2000, seed=11, batch_size=300, workers=2)
+
+    assert serial == parallel
+    assert "daily_sharpe_ci_low" in serial and "sharpe_ratio_ci_low" not in serial
+    observed = resample_metrics(returns.to_numpy()[None, :], periods=365.25)[0]
+    for value, name in zip(observed, BOOTSTRAP_METRICS, strict=True):
+        assert serial[f"{name}_ci_low"] <= value <= serial[f"{name}_ci_high"]
+    assert serial["bootstrap_block_size"] == 8
+    with pytest.raises(ValueError):
+        bootstrap(returns.iloc[:1])
+
+
+def test_engine_stores_bootstrap_intervals_with_the_run(tmp_path):
+    rng = np.random.default_rng(5)
+    index = pd.date_range("2023-01-01", periods=2000, freq="h")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))
+    history = pd.DataFrame(
+        {"open": close, "high": close * 1.001, "low": close * 0.999, "close": close, "volume": 1.0},
+        index=index,
+    )
+    store = AnalyticsStore(str(tmp_path / "analytics.db"))
+    config = BacktestConfig(engine="vectorized", bootstrap_samples=500, bootstrap_seed=1)
+    engine = BacktestEngine(
+        MomentumStrategy(fast_window=5, slow_window=20),
+        config,
+        DataFeedConfig(source="static", symbol="TEST", interval="1h"),
+        None,
+        analytics=store,
+        history=history,
+    )
+    result = engine.run()
+
+    assert result.extra_metrics["bootstrap_samples"] == 500
+    low, high = (result.extra_metrics[f"total_return_ci_{side}"] for side in ("low", "high"))
+    assert low < high
+    stored = store.load_result(result.run_id)
+    assert stored.extra_metrics == result.extra_metrics
+    assert with_bootstrap(stored, samples=10) is stored
+    store.close()
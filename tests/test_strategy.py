@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from silkroad.data.base import HistoryCursor
+from silkroad.strategy.momentum import MomentumStrategy
+
+
+def test_momentum_batch_signals_match_per_bar_signals():
+    rng = np.random.default_rng(7)
+    index = pd.date_range("2024-01-01", periods=200, freq="h")
+    frame = pd.DataFrame({"close": 100 + rng.normal(0, 1, 200).cumsum()}, index=index)
+    strategy = MomentumStrategy(fast_window=5, slow_window=20, threshold=0.2, order_size=0.1)
+    strategy.prepare(frame)
+
+    batch = strategy.generate_signals(frame)
+    cursor = HistoryCursor.from_frame(frame)
+    for position in range(len(frame)):
+        cursor.position = position
+        expected = strategy.generate_signal(cursor)
+        actual = batch.signal_at(position)
+        assert (actual.side, actual.size) == (expected.side, expected.size)
+
+
+def test_momentum_update_tracks_live_bars_incrementally():
+    from silkroad.data.ring import OHLCVRingBuffer
+
+    rng = np.random.default_rng(11)
+    index = pd.date_range("2024-01-01", periods=160, freq="h", tz="UTC")
+    close = 100 + rng.normal(0, 1, 160).cumsum()
+    frame = pd.DataFrame({name: close for name in ("open", "high", "low", "close")}, index=index)
+    frame["volume"] = 1.0
+    strategy = MomentumStrategy(fast_window=5, slow_window=20)
+    strategy.prepare(frame.iloc[:100].copy())
+    expected = frame.copy()
+    MomentumStrategy(fast_window=5, slow_window=20).prepare(expected)
+
+    buffer = OHLCVRingBuffer.from_frame(frame.iloc[:100], capacity=50)
+    for position in range(100, 160):
+        timestamp = int(index[position].value)
+        buffer.upsert(timestamp, frame.iloc[position].to_numpy() + 3.0)  # in-progress candle
+        strategy.update(buffer.snapshot())
+        buffer.upsert(timestamp, frame.iloc[position].to_numpy())
+        snapshot = buffer.snapshot()
+        strategy.update(snapshot)
+        signal = strategy.generate_signal(snapshot)
+        assert signal.metadata["spread"] == pytest.approx(expected["spread"].iloc[position])
@@ -0,0 +1,54 @@
+import pytest
+
+from silkroad.backtesting import sweep
+from silkroad.backtesting.sweep import ParameterSweep
+from silkroad.config.settings import BacktestConfig, DataFeedConfig, StrategyConfig
+
+
+def _sweep(**kwargs) -> ParameterSweep:
+    return ParameterSweep(
+        strategy_config=StrategyConfig(
+            name="momentum",
+            parameters={"fast_window": [3, 5], "slow_window": [10, 20, 30], "order_size": 0.1},
+        ),
+        backtest_config=BacktestConfig(engine="vectorized"),
+        data_feed_config=DataFeedConfig(
+            source="static", symbol="TEST/USDT", interval="1h", lookback=200
+        ),
+        **kwargs,
+    )
+
+
+def test_grid_sweep_ranks_every_combination():
+    table = _sweep(workers=2).run()
+
+    assert len(table) == 6
+    assert set(zip(table["fast_window"], table["slow_window"], strict=True)) == {
+        (fast, slow) for fast in (3, 5) for slow in (10, 20, 30)
+    }
+    assert (table["order_size"] == 0.1).all()
+
+
+def test_random_sweep_samples_without_replacement():
+    combinations = _sweep(method="random", samples=4, seed=1).combinations()
+
+    assert len(combinations) == 4
+    assert len({(c["fast_window"], c["slow_window"]) for c in combinations}) == 4
+
+
+def test_serial_sweep_leaves_no_worker_state():
+    table = _sweep(workers=1).run()
+
+    assert len(table) == 6
+    assert sweep._WORKER_CONTEXT is None
+
+
+def test_sweep_rejects_portfolio_configs():
+    with pytest.raises(ValueError, match="data.symbols"):
+        ParameterSweep(
+            strategy_config=StrategyConfig(name="momentum"),
+            backtest_config=BacktestConfig(engine="vectorized"),
+            data_feed_config=DataFeedConfig(
+                source="static", symbol="TEST/USDT", symbols=["A/USDT", "B/USDT"]
+            ),
+        )
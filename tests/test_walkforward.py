@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from silkroad.backtesting.walkforward import WalkForward
+from silkroad.config.settings import BacktestConfig, DataFeedConfig, StrategyConfig
+
+
+def _walk_forward(**kwargs) -> WalkForward:
+    rng = np.random.default_rng(3)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 1500)))
+    history = pd.DataFrame(
+        {"open": close, "high": close * 1.002, "low": close * 0.998, "close": close, "volume": 1.0},
+        index=pd.date_range("2023-01-01", periods=len(close), freq="h", tz="UTC"),
+    )
+    return WalkForward(
+        strategy_config=StrategyConfig(
+            name="momentum",
+            parameters={"fast_window": [3, 5], "slow_window": [10, 20], "order_size": 0.1},
+        ),
+        backtest_config=BacktestConfig(engine="vectorized"),
+        data_feed_config=DataFeedConfig(
+            source="static", symbol="TEST/USDT", interval="1h", parameters={"data": history}
+        ),
+        **{"train_size": 400, "test_size": 200, **kwargs},
+    )
+
+
+def test_walk_forward_stitches_out_of_sample_windows():
+    runner = _walk_forward(workers=2)
+    result = runner.run()
+
+    assert len(runner.report) == len(runner.splits(1500)) == 5
+    assert result.total_trades == runner.report["test_total_trades"].sum() > 0
+    assert 1 + result.total_return == pytest.approx((1 + runner.report["test_total_return"]).prod())
+    assert result.equity_curve.iloc[-1] == pytest.approx(result.ending_value)
+
+    serial = _walk_forward(workers=1).run()
+    assert serial.ending_value == pytest.approx(result.ending_value)
+
+
+def test_anchored_splits_grow_the_train_window():
+    splits = _walk_forward(anchored=True, test_size=100).splits(800)
+
+    assert [(train.start, train.stop, test.stop) for train, test in splits] == [
+        (0, 400, 500),
+        (0, 500, 600),
+        (0, 600, 700),
+        (0, 700, 800),
+    ]
+
+
+def test_overlapping_test_windows_are_rejected():
+    with pytest.raises(ValueError, match="step"):
+        _walk_forward(step=100)